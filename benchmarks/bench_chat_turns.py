@@ -0,0 +1,97 @@
+"""
+Per-turn cost of a long conversation with the tool chatbot.
+
+Runs "Chatbot with tavily search" for N turns on one checkpointed thread
+with the fake LLM and reports, per block of turns, the time per turn,
+how many messages the model was sent and how many the thread holds.
+
+The prompt is capped by token-budget trimming from the first turns on.
+Time per turn still rises until the stored thread reaches
+``MAX_STORED_MESSAGES``: every turn loads and writes the whole
+checkpointed thread, so that cost follows the thread's length. Once the
+thread is pruned at its cap, time per turn stays flat; the ratio that
+matters is the last block against the first block at the cap.
+
+Usage:
+    python -m benchmarks.bench_chat_turns --turns 100
+"""
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from benchmarks.fakes import FakeNewsLLM, offline
+
+
+def run(turns: int, words_per_turn: int) -> List[Dict]:
+    from src.LangGraph.graph.graph_builder import GraphBuilder
+
+    llm = FakeNewsLLM()
+    graph = GraphBuilder(llm, "news").setup_graph(
+        "Chatbot with tavily search", checkpointer=InMemorySaver()
+    )
+    config = {"configurable": {"thread_id": "bench"}}
+    filler = " ".join(["word"] * words_per_turn)
+
+    rows = []
+    for turn in range(1, turns + 1):
+        started = time.perf_counter()
+        graph.invoke(
+            {"messages": [HumanMessage(content=f"turn {turn}: {filler}")]}, config
+        )
+        elapsed = time.perf_counter() - started
+        stored = len(graph.get_state(config).values["messages"])
+        rows.append(
+            {
+                "turn": turn,
+                "seconds": elapsed,
+                "prompt_messages": llm.last_prompt_messages,
+                "stored_messages": stored,
+            }
+        )
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--words", type=int, default=60, help="words per user message")
+    parser.add_argument("--block", type=int, default=10, help="turns per report row")
+    args = parser.parse_args(argv)
+
+    with offline():
+        rows = run(args.turns, args.words)
+
+    print(f"{'turns':<12}{'ms/turn':>10}{'prompt msgs':>14}{'stored msgs':>14}")
+    for i in range(0, len(rows), args.block):
+        block = rows[i:i + args.block]
+        print(
+            f"{block[0]['turn']:>4}-{block[-1]['turn']:<7}"
+            f"{statistics.mean(r['seconds'] for r in block) * 1000:>10.2f}"
+            f"{max(r['prompt_messages'] for r in block):>14}"
+            f"{block[-1]['stored_messages']:>14}"
+        )
+
+    head = statistics.mean(r["seconds"] for r in rows[:args.block])
+    tail = statistics.mean(r["seconds"] for r in rows[-args.block:])
+    print(f"\nlast/first block time ratio: {tail / head:.2f}")
+
+    # First turn whose thread did not grow: pruning has kicked in.
+    capped = next(
+        (i for i in range(1, len(rows))
+         if rows[i]["stored_messages"] <= rows[i - 1]["stored_messages"]),
+        None,
+    )
+    if capped is not None and len(rows) - capped >= 2 * args.block:
+        at_cap = statistics.mean(r["seconds"] for r in rows[capped:capped + args.block])
+        print(
+            f"last/first block time ratio at the stored cap (from turn "
+            f"{rows[capped]['turn']}): {tail / at_cap:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
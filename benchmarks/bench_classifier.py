@@ -0,0 +1,95 @@
+"""
+Throughput and accuracy of the local category classifier.
+
+Classifies the labelled fixture set (``fixtures/labelled_articles.jsonl``)
+and reports articles/second, exact-match accuracy and micro / per-category
+precision, recall and F1.
+
+Usage:
+    python -m benchmarks.bench_classifier
+    python -m benchmarks.bench_classifier --repeat 2000
+"""
+import argparse
+import json
+import os
+import time
+from typing import Dict, List, Tuple
+
+from src.LangGraph.tools.category_classifier import CategoryClassifier
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "labelled_articles.jsonl")
+
+
+def load_examples(path: str = FIXTURE) -> List[Dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _prf(tp: int, fp: int, fn: int) -> Tuple[float, float, float]:
+    p = tp / (tp + fp) if tp + fp else 0.0
+    r = tp / (tp + fn) if tp + fn else 0.0
+    f = 2 * p * r / (p + r) if p + r else 0.0
+    return p, r, f
+
+
+def evaluate(classifier: CategoryClassifier, examples: List[Dict]) -> Dict:
+    counts: Dict[str, List[int]] = {}
+    exact = 0
+    misses = []
+    for ex in examples:
+        predicted = set(classifier.classify(ex["title"], ex["description"]))
+        gold = set(ex["labels"])
+        exact += predicted == gold
+        if predicted != gold:
+            misses.append((ex["title"], sorted(gold), sorted(predicted)))
+        for cat in predicted | gold:
+            tp_fp_fn = counts.setdefault(cat, [0, 0, 0])
+            if cat in predicted and cat in gold:
+                tp_fp_fn[0] += 1
+            elif cat in predicted:
+                tp_fp_fn[1] += 1
+            else:
+                tp_fp_fn[2] += 1
+    micro = _prf(*(sum(c[i] for c in counts.values()) for i in range(3)))
+    return {
+        "exact": exact / len(examples),
+        "micro": micro,
+        "per_category": {cat: _prf(*c) for cat, c in sorted(counts.items())},
+        "misses": misses,
+    }
+
+
+def throughput(classifier: CategoryClassifier, examples: List[Dict], repeat: int) -> float:
+    pairs = [(ex["title"], ex["description"]) for ex in examples] * repeat
+    started = time.perf_counter()
+    classifier.classify_many(pairs)
+    return len(pairs) / (time.perf_counter() - started)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=500, help="passes over the fixture for throughput")
+    parser.add_argument("--show-misses", action="store_true")
+    args = parser.parse_args(argv)
+
+    examples = load_examples()
+    classifier = CategoryClassifier()
+    report = evaluate(classifier, examples)
+    rate = throughput(classifier, examples, args.repeat)
+
+    print(f"examples          {len(examples)}")
+    print(f"throughput        {rate:,.0f} articles/s")
+    print(f"exact match       {report['exact']:.1%}")
+    p, r, f = report["micro"]
+    print(f"micro P/R/F1      {p:.2f} / {r:.2f} / {f:.2f}")
+    print(f"\n{'category':<10}{'P':>6}{'R':>6}{'F1':>6}")
+    for cat, (p, r, f) in report["per_category"].items():
+        print(f"{cat:<10}{p:>6.2f}{r:>6.2f}{f:>6.2f}")
+    if args.show_misses:
+        print("\nmisses")
+        for title, gold, predicted in report["misses"]:
+            print(f"  {title[:60]:<60} gold={gold} got={predicted}")
+
+
+if __name__ == "__main__":
+    main()
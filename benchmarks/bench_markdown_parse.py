@@ -0,0 +1,146 @@
+"""
+Cost of turning a summary file into UI sections on every rerun.
+
+Writes a synthetic summary file with N articles over 30 dated sections and
+times the previous parser (uncompiled patterns, bare-``?`` URL dedupe),
+the single-pass parser (canonical-key dedupe against an empty article
+store in a temporary directory) on a cold first call and warm, a cold
+``load_news_sections`` (a freshly rewritten file: what the first rerun
+after every fetch pays) and ``load_news_sections`` once it has parsed
+the file version (what every later Streamlit rerun pays).
+
+Usage:
+    python -m benchmarks.bench_markdown_parse
+    python -m benchmarks.bench_markdown_parse --articles 50000 --repeat 3
+"""
+import argparse
+import os
+import re
+import tempfile
+import time
+from datetime import date, timedelta
+
+from src.LangGraph.ui.streamlitui.display_results import (
+    load_news_sections,
+    parse_news_markdown_grouped,
+)
+
+HOSTS = ("www.bbc.co.uk", "www.theguardian.com", "apnews.com", "www.reuters.com", "techcrunch.com")
+
+
+def make_markdown(n: int, days: int = 30) -> str:
+    lines = ["# Monthly News Summary", ""]
+    today = date.today()
+    per_day = max(1, n // days)
+    for i in range(n):
+        if i % per_day == 0:
+            lines += ["", f"### {(today - timedelta(days=i // per_day)).isoformat()}"]
+        lines.append(
+            f"- **Headline number {i} about markets**: Two sentences of summary for story {i}, "
+            f"with enough words to look like the real thing. "
+            f"[Read full story](https://{HOSTS[i % len(HOSTS)]}/news/2025/story-{i}?at_medium=RSS)"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def legacy_parse(markdown_text: str):
+    """The parser before precompiled patterns: two passes, ``re.search`` per line."""
+    sections = []
+    current_date = None
+    current_articles = []
+    seen_urls = set()
+    for raw_line in markdown_text.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("# "):
+            continue
+        if line.startswith("### "):
+            if current_date and current_articles:
+                sections.append({"date": current_date, "articles": current_articles})
+            current_date = line.replace("###", "").strip()
+            current_articles = []
+            continue
+        if line.startswith("- "):
+            m = re.search(r"-\s+\*\*(.+?)\*\*:\s*(.+?)\s*\[.*?\]\((https?://[^\)]+)\)", line)
+            if not m:
+                continue
+            url = m.group(3).strip()
+            norm_url = url.split("?", 1)[0].strip()
+            if norm_url in seen_urls:
+                continue
+            seen_urls.add(norm_url)
+            current_articles.append(
+                {"title": m.group(1).strip(), "summary": m.group(2).strip(), "url": url}
+            )
+    if current_date and current_articles:
+        sections.append({"date": current_date, "articles": current_articles})
+    if not sections:
+        flat_articles = []
+        for raw_line in markdown_text.splitlines():
+            line = raw_line.strip()
+            if not line.startswith("- "):
+                continue
+            m = re.search(r"-\s+\*\*(.+?)\*\*:\s*(.+?)\s*\[.*?\]\((https?://[^\)]+)\)", line)
+            if not m:
+                continue
+            url = m.group(3).strip()
+            norm_url = url.split("?", 1)[0].strip()
+            if norm_url in seen_urls:
+                continue
+            seen_urls.add(norm_url)
+            flat_articles.append({"title": m.group(1).strip(), "summary": m.group(2).strip(), "url": url})
+        if flat_articles:
+            sections.append({"date": "No Date", "articles": flat_articles})
+    return sections
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=10_000, help="articles in the summary file")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is kept)")
+    args = parser.parse_args(argv)
+
+    text = make_markdown(args.articles)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        # The canonical-key store is opened relative to the cwd.
+        os.chdir(workdir)
+        path = os.path.join(workdir, "monthly_summary_news.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+        legacy = _best(lambda: legacy_parse(text), args.repeat)
+        started = time.perf_counter()
+        sections = parse_news_markdown_grouped(text)
+        cold = (time.perf_counter() - started) * 1000
+        single = _best(lambda: parse_news_markdown_grouped(text), args.repeat)
+
+        def reparse():
+            # Every fetch rewrites the file, so the memo misses once.
+            os.utime(path, ns=(time.time_ns(), time.time_ns()))
+            load_news_sections(path)
+
+        fresh = _best(reparse, args.repeat)
+        load_news_sections(path)
+        cached = _best(lambda: load_news_sections(path), args.repeat)
+        os.chdir(cwd)
+
+    parsed = sum(len(s["articles"]) for s in sections)
+    assert parsed == sum(len(s["articles"]) for s in legacy_parse(text))
+    print(f"summary file      {args.articles:,} articles, {len(text) / 1e6:.1f} MB, {len(sections)} sections")
+    print(f"legacy parser     {legacy:8.1f} ms")
+    print(f"single pass       {single:8.1f} ms ({cold:.1f} ms on the first call)")
+    print(f"rewritten file    {fresh:8.1f} ms (cold load_news_sections)")
+    print(f"memoised rerun    {cached:8.3f} ms ({legacy / cached:,.0f}x faster than legacy)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""
+End-to-end offline benchmark for the News graph.
+
+Runs ``GraphBuilder.news_builder_graph`` against recorded provider
+fixtures and a deterministic fake LLM, and reports per timeframe:
+
+- wall time and per-stage time (fetch / article pages / summarise / save)
+- peak Python memory (tracemalloc, measured in a separate pass)
+- number of summarised articles and throughput in articles/second
+- upstream HTTP calls
+
+``--category all`` runs the batch pipeline; ``--compare-batch`` runs
+every category separately and then once in batch mode, and compares
+HTTP calls, LLM calls and wall time. Every measured run starts from an
+empty article store; ``--refresh`` instead times a cold run followed by
+an immediate refresh, which only processes what is new. ``--anchors``
+runs several past anchors in the given order over one store (newest
+first, like the backfill) and checks that each still fetches its own
+GDELT days.
+
+Usage:
+    python -m benchmarks.bench_news_graph
+    python -m benchmarks.bench_news_graph --scale 20 --repeat 5 --archive
+    python -m benchmarks.bench_news_graph --compare-batch --net-latency 0.05
+    python -m benchmarks.bench_news_graph --refresh --llm-latency 0.5
+    python -m benchmarks.bench_news_graph --anchors 1 3 10 --timeframes daily
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Dict, List
+
+from benchmarks.fakes import FakeNewsLLM, offline
+
+TIMEFRAMES = ("daily", "weekly", "monthly")
+_UI_TIMEFRAME = {"daily": "today", "weekly": "weekly", "monthly": "monthly"}
+
+
+def _count_articles(paths: List[str]) -> int:
+    """Distinct summarised articles across ``paths``."""
+    lines = set()
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines.update(line for line in f if line.startswith("- **"))
+        except FileNotFoundError:
+            pass
+    return len(lines)
+
+
+async def _astream_updates(graph, inputs) -> List[Dict]:
+    """Collect astream updates with the time each one arrived."""
+    timed = []
+    async for update in graph.astream(inputs, stream_mode="updates"):
+        timed.append((time.perf_counter(), update))
+    return timed
+
+
+def _stream_updates(graph, inputs, use_async: bool):
+    if use_async:
+        from src.LangGraph.tools.aio import run
+
+        yield from run(_astream_updates(graph, inputs))
+        return
+    for update in graph.stream(inputs, stream_mode="updates"):
+        yield time.perf_counter(), update
+
+
+@contextmanager
+def _fresh_store(root: str):
+    """Run the block in a new directory under ``root``: empty store, no summary files."""
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp(dir=root))
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+
+def run_once(timeframe: str, category: str, anchor: date, llm,
+             trace_memory: bool = False, use_async: bool = False) -> Dict:
+    """Build a fresh News graph and run it once; return timings."""
+    from src.LangGraph.graph.graph_builder import GraphBuilder
+    from src.LangGraph.nodes.news_node import ALL_CATEGORIES, NEWS_CATEGORIES, summary_path
+
+    payload = {"timeframe": _UI_TIMEFRAME[timeframe], "selected_date": anchor.isoformat()}
+    inputs = {"messages": [{"role": "user", "content": json.dumps(payload)}]}
+
+    if trace_memory:
+        tracemalloc.start()
+
+    stages: Dict[str, float] = {}
+    started = time.perf_counter()
+    graph = GraphBuilder(llm, category).setup_graph("News")
+    last = time.perf_counter()
+    stages["build"] = last - started
+    for now, update in _stream_updates(graph, inputs, use_async):
+        for node in update:
+            stages[node] = stages.get(node, 0.0) + (now - last)
+        last = now
+    wall = time.perf_counter() - started
+
+    peak = 0
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    categories = NEWS_CATEGORIES if category == ALL_CATEGORIES else (category,)
+    articles = _count_articles([summary_path(timeframe, c) for c in categories])
+    return {"wall": wall, "stages": stages, "peak": peak, "articles": articles}
+
+
+def bench(timeframes: List[str], category: str, scale: int, repeat: int,
+          archive: bool, net_latency: float, llm_latency: float,
+          use_async: bool = False) -> List[Dict]:
+    anchor = date.today() - timedelta(days=1) if archive else date.today()
+    results = []
+
+    with offline(scale=scale, net_latency=net_latency) as http, \
+            tempfile.TemporaryDirectory() as workdir:
+        def cold_run(tf, llm, trace_memory=False):
+            with _fresh_store(workdir):
+                return run_once(tf, category, anchor, llm, trace_memory, use_async)
+
+        for tf in timeframes:
+            llm = FakeNewsLLM(latency=llm_latency)
+            # Warm-up: imports, regex compilation, fixture parsing.
+            cold_run(tf, llm)
+
+            calls_before = len(http.calls)
+            runs = [cold_run(tf, llm) for _ in range(repeat)]
+            calls = (len(http.calls) - calls_before) // max(repeat, 1)
+            mem = cold_run(tf, llm, trace_memory=True)
+
+            wall = statistics.median(r["wall"] for r in runs)
+            stage_names = runs[0]["stages"].keys()
+            stages = {
+                s: statistics.median(r["stages"].get(s, 0.0) for r in runs)
+                for s in stage_names
+            }
+            articles = runs[-1]["articles"]
+            results.append(
+                {
+                    "timeframe": tf,
+                    "anchor": anchor.isoformat(),
+                    "wall_s": wall,
+                    "stages_s": stages,
+                    "peak_mem_mb": mem["peak"] / (1024 * 1024),
+                    "articles": articles,
+                    "articles_per_s": articles / wall if wall else 0.0,
+                    "http_calls": calls,
+                }
+            )
+    return results
+
+
+def compare_batch(timeframe: str, archive: bool, net_latency: float,
+                  llm_latency: float, use_async: bool = False) -> Dict:
+    """
+    Cost of refreshing every category: seven single-category runs versus
+    one batch run over the same fixtures.
+    """
+    from src.LangGraph.nodes.news_node import ALL_CATEGORIES, NEWS_CATEGORIES
+
+    anchor = date.today() - timedelta(days=1) if archive else date.today()
+    out = {}
+    with offline(net_latency=net_latency) as http, \
+            tempfile.TemporaryDirectory() as workdir:
+        plans = {
+            "separate": list(NEWS_CATEGORIES),
+            "batch": [ALL_CATEGORIES],
+        }
+        for label, categories in plans.items():
+            llm = FakeNewsLLM(latency=llm_latency)
+            calls_before = len(http.calls)
+            started = time.perf_counter()
+            # Each plan gets its own store, or the second would find everything seen.
+            with _fresh_store(workdir):
+                for category in categories:
+                    run_once(timeframe, category, anchor, llm, use_async=use_async)
+            out[label] = {
+                "wall_s": time.perf_counter() - started,
+                "http_calls": len(http.calls) - calls_before,
+                "llm_calls": llm.calls,
+            }
+    return out
+
+
+def compare_refresh(timeframe: str, category: str, scale: int, archive: bool,
+                    net_latency: float, llm_latency: float, use_async: bool = False) -> Dict:
+    """A cold run and an immediate refresh over the same store."""
+    anchor = date.today() - timedelta(days=1) if archive else date.today()
+    out = {}
+    with offline(scale=scale, net_latency=net_latency) as http, \
+            tempfile.TemporaryDirectory() as workdir, _fresh_store(workdir):
+        for label in ("cold", "refresh"):
+            llm = FakeNewsLLM(latency=llm_latency)
+            calls_before = len(http.calls)
+            run = run_once(timeframe, category, anchor, llm, use_async=use_async)
+            out[label] = {
+                "wall_s": run["wall"],
+                "http_calls": len(http.calls) - calls_before,
+                "llm_calls": llm.calls,
+                "articles": run["articles"],
+            }
+    return out
+
+
+def compare_anchors(timeframe: str, category: str, offsets: List[int],
+                    use_async: bool = False) -> List[Dict]:
+    """
+    Runs anchored ``offsets`` days back, in order, over one store. An
+    older anchor must not inherit the GDELT watermark of a newer one.
+    """
+    from src.LangGraph.tools.archive_fetch import GDELT_URL
+
+    out = []
+    with offline() as http, tempfile.TemporaryDirectory() as workdir, _fresh_store(workdir):
+        for offset in offsets:
+            anchor = date.today() - timedelta(days=offset)
+            calls_before = len(http.calls)
+            run = run_once(timeframe, category, anchor, FakeNewsLLM(), use_async=use_async)
+            gdelt = sum(1 for _, url, _ in http.calls[calls_before:] if url == GDELT_URL)
+            out.append({"anchor": anchor.isoformat(), "gdelt_calls": gdelt,
+                        "articles": run["articles"]})
+    return out
+
+
+def _print_anchors(timeframe: str, out: List[Dict]) -> None:
+    print(f"{timeframe}: past anchors over one store")
+    print(f"{'anchor':<12}{'gdelt':>8}{'articles':>10}")
+    for r in out:
+        print(f"{r['anchor']:<12}{r['gdelt_calls']:>8}{r['articles']:>10}")
+    missed = [r["anchor"] for r in out if not r["gdelt_calls"]]
+    if missed:
+        raise SystemExit(f"GDELT skipped for anchors {', '.join(missed)}")
+    print()
+
+
+def _print_compare(timeframe: str, out: Dict) -> None:
+    print(f"{timeframe}: refresh every category")
+    print(f"{'mode':<10}{'wall ms':>10}{'http':>8}{'llm':>6}")
+    for label, r in out.items():
+        print(f"{label:<10}{r['wall_s'] * 1000:>10.1f}{r['http_calls']:>8}{r['llm_calls']:>6}")
+    sep, bat = out["separate"], out["batch"]
+    print(
+        f"batch/separate: wall {bat['wall_s'] / sep['wall_s']:.2f}, "
+        f"http {bat['http_calls'] / max(sep['http_calls'], 1):.2f}, "
+        f"llm {bat['llm_calls'] / max(sep['llm_calls'], 1):.2f}\n"
+    )
+
+
+def _print_refresh(timeframe: str, out: Dict) -> None:
+    print(f"{timeframe}: cold run, then refresh")
+    print(f"{'run':<10}{'wall ms':>10}{'http':>8}{'llm':>6}{'articles':>10}")
+    for label, r in out.items():
+        print(
+            f"{label:<10}{r['wall_s'] * 1000:>10.1f}{r['http_calls']:>8}"
+            f"{r['llm_calls']:>6}{r['articles']:>10}"
+        )
+    print()
+
+
+def _print_table(results: List[Dict]) -> None:
+    header = f"{'timeframe':<10}{'wall ms':>10}{'build ms':>10}{'fetch ms':>10}{'pages ms':>10}{'summ ms':>10}{'save ms':>10}{'peak MB':>10}{'articles':>10}{'art/s':>10}{'http':>6}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        st = r["stages_s"]
+        print(
+            f"{r['timeframe']:<10}"
+            f"{r['wall_s'] * 1000:>10.1f}"
+            f"{st.get('build', 0) * 1000:>10.1f}"
+            f"{st.get('fetch_news', 0) * 1000:>10.1f}"
+            f"{st.get('fetch_articles', 0) * 1000:>10.1f}"
+            f"{st.get('summarize_news', 0) * 1000:>10.1f}"
+            f"{st.get('save_results', 0) * 1000:>10.1f}"
+            f"{r['peak_mem_mb']:>10.2f}"
+            f"{r['articles']:>10}"
+            f"{r['articles_per_s']:>10.0f}"
+            f"{r['http_calls']:>6}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--timeframes", nargs="+", default=list(TIMEFRAMES), choices=TIMEFRAMES)
+    parser.add_argument("--category", default="news")
+    parser.add_argument("--scale", type=int, default=1, help="repeat each fixture item N times")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--archive", action="store_true", help="anchor on yesterday (Guardian + GDELT path)")
+    parser.add_argument("--net-latency", type=float, default=0.0, help="simulated seconds per HTTP call")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="simulated seconds per LLM call")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="drive the graph with astream")
+    parser.add_argument("--json", dest="json_out", help="also write results to this file")
+    parser.add_argument("--compare-batch", action="store_true",
+                        help="compare seven single-category runs with one batch run")
+    parser.add_argument("--refresh", action="store_true",
+                        help="time a cold run and an immediate incremental refresh")
+    parser.add_argument("--anchors", type=int, nargs="+", metavar="DAYS_BACK",
+                        help="run these past anchors in order over one store")
+    args = parser.parse_args(argv)
+
+    if args.anchors:
+        for tf in args.timeframes:
+            _print_anchors(tf, compare_anchors(tf, args.category, args.anchors, args.use_async))
+        return
+
+    if args.compare_batch:
+        for tf in args.timeframes:
+            _print_compare(tf, compare_batch(
+                tf, args.archive, args.net_latency, args.llm_latency, args.use_async
+            ))
+        return
+    if args.refresh:
+        for tf in args.timeframes:
+            _print_refresh(tf, compare_refresh(
+                tf, args.category, args.scale, args.archive,
+                args.net_latency, args.llm_latency, args.use_async,
+            ))
+        return
+
+    results = bench(
+        args.timeframes, args.category, args.scale, args.repeat,
+        args.archive, args.net_latency, args.llm_latency, args.use_async,
+    )
+    _print_table(results)
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Size, speed and accuracy of the global seen-URL index.
+
+Loads N synthetic article URLs into a ``SeenIndex`` backed by a
+temporary article store and reports build throughput, Bloom filter RAM
+(next to what a Python ``set`` of the same URLs takes), lookup
+throughput for known and unseen URLs, the measured false-positive rate
+and how many lookups had to be confirmed in SQLite.
+
+Usage:
+    python -m benchmarks.bench_seen_index
+    python -m benchmarks.bench_seen_index --urls 1000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from src.LangGraph.tools.article_store import ArticleStore
+from src.LangGraph.tools.seen_index import SEEN_INDEX_ERROR, SeenIndex, _hash_pairs
+
+HOSTS = ("www.bbc.co.uk", "www.theguardian.com", "apnews.com", "www.reuters.com", "techcrunch.com")
+
+
+def make_urls(n: int, prefix: str):
+    return [f"https://{HOSTS[i % len(HOSTS)]}/{prefix}/2025/story-{i}" for i in range(n)]
+
+
+def set_size(urls) -> int:
+    """Bytes held by a ``set`` of ``urls`` (table plus the strings)."""
+    s = set(urls)
+    return sys.getsizeof(s) + sum(sys.getsizeof(u) for u in s)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--urls", type=int, default=200_000, help="URLs to ingest")
+    parser.add_argument("--batch", type=int, default=500, help="URLs per add / lookup (one run's worth)")
+    parser.add_argument("--probes", type=int, default=100_000, help="unseen URLs to look up")
+    args = parser.parse_args(argv)
+
+    known = make_urls(args.urls, "known")
+    unseen = make_urls(args.probes, "unseen")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        store = ArticleStore(os.path.join(workdir, "store.sqlite"))
+        index = SeenIndex(store)
+
+        started = time.perf_counter()
+        for i in range(0, len(known), args.batch):
+            index.add(known[i:i + args.batch])
+            index.flush()
+        build = time.perf_counter() - started
+
+        sample = known[:: max(1, len(known) // args.probes)][: args.probes]
+        started = time.perf_counter()
+        hits = sum(len(index.seen(sample[i:i + args.batch])) for i in range(0, len(sample), args.batch))
+        known_rate = len(sample) / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        false_hits = sum(len(index.seen(unseen[i:i + args.batch])) for i in range(0, len(unseen), args.batch))
+        unseen_rate = len(unseen) / (time.perf_counter() - started)
+
+        maybe = int(index.bloom.contains(_hash_pairs(unseen)).sum())
+
+        started = time.perf_counter()
+        reloaded = SeenIndex(store)
+        load = time.perf_counter() - started
+        bloom_bytes = index.bloom.nbytes
+        filters = len(index.bloom.filters)
+        assert len(reloaded.bloom) == len(index.bloom)
+        store_bytes = os.path.getsize(store.path)
+
+        # Two processes sharing the file: neither may drop the other's keys.
+        other_keys, own_keys = make_urls(1000, "other"), make_urls(1000, "own")
+        reloaded.add(other_keys)
+        reloaded.flush()
+        index.add(own_keys)
+        index.flush()
+        merged = SeenIndex(store).bloom
+        shared = int(merged.contains(_hash_pairs(other_keys + own_keys)).sum())
+        assert shared == len(other_keys) + len(own_keys), "seen-index file lost keys"
+        assert len(index.seen(other_keys)) == len(other_keys)
+
+    print(f"urls ingested     {args.urls:,} in {build:.2f}s ({args.urls / build:,.0f}/s, batches of {args.batch})")
+    print(f"bloom filter      {bloom_bytes / 1e6:.2f} MB in {filters} sub-filters "
+          f"({bloom_bytes * 8 / args.urls:.1f} bits/URL); python set {set_size(known) / 1e6:.1f} MB")
+    print(f"exact store       {store_bytes / 1e6:.1f} MB on disk")
+    print(f"reload            {load * 1000:.0f} ms")
+    print(f"shared file       {shared:,}/2,000 keys of two writers kept")
+    print(f"known lookups     {known_rate:,.0f}/s ({hits:,}/{len(sample):,} found)")
+    print(f"unseen lookups    {unseen_rate:,.0f}/s ({false_hits} wrongly found)")
+    print(f"false positives   {maybe / len(unseen):.4%} sent to SQLite (target <= {SEEN_INDEX_ERROR:.2%})")
+
+
+if __name__ == "__main__":
+    main()
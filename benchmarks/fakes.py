@@ -0,0 +1,321 @@
+"""
+Offline stand-ins for every external dependency of the News pipeline.
+
+- ``FakeHTTP`` answers all outgoing ``requests`` and shared-pool ``httpx``
+  calls from the recorded fixtures in ``benchmarks/fixtures`` (Tavily, RSS
+  feeds, Guardian, GDELT, NewsData and article pages) and keeps a log of
+  every call. ``httpx`` responses carry an ETag and honour
+  ``If-None-Match``.
+- ``FakeNewsLLM`` is a deterministic chat model that answers the strict
+  summariser prompt in the ``DATE || HEADLINE || SUMMARY || URL`` format.
+
+Use ``offline()`` to patch both in for the duration of a block.
+"""
+import asyncio
+import copy
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+import requests
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# Fixtures store dates as {{date:-N:fmt}} (N days before "now") so the
+# recordings stay inside the daily / weekly / monthly windows forever.
+_DATE_TOKEN = re.compile(r"\{\{date:-(\d+):(\w+)\}\}")
+_DATE_FORMATS = {
+    "iso": "%Y-%m-%dT%H:%M:%SZ",
+    "rfc822": "%a, %d %b %Y %H:%M:%S GMT",
+    "gdelt": "%Y%m%dT%H%M%SZ",
+    "newsdata": "%Y-%m-%d %H:%M:%S",
+    "day": "%Y-%m-%d",
+}
+
+# (host substring, fixture file, path to the list of items inside the JSON)
+_ROUTES = [
+    ("api.tavily.com", "tavily_search.json", ("results",)),
+    ("feeds.bbci.co.uk", "bbc_rss.xml", None),
+    ("content.guardianapis.com", "guardian_search.json", ("response", "results")),
+    ("api.gdeltproject.org", "gdelt_artlist.json", ("articles",)),
+    ("newsdata.io", "newsdata_latest.json", ("results",)),
+]
+# Any other URL that looks like a feed (the catalog's many publishers).
+_FEED_HINTS = ("rss", "/feed", ".xml", "atom")
+_FEED_FIXTURE = "bbc_rss.xml"
+_ARTICLE_FIXTURE = "article.html"
+_ARTICLE_CANONICAL = b"https://www.example-news.com/business/central-bank-holds-rates"
+_URL_KEYS = ("url", "webUrl", "link")
+
+
+def load_fixture(name: str, now: Optional[datetime] = None) -> str:
+    """Read a fixture and resolve its relative date tokens."""
+    now = now or datetime.now(timezone.utc).replace(hour=6, minute=0, second=0)
+    with open(os.path.join(FIXTURE_DIR, name), "r", encoding="utf-8") as f:
+        raw = f.read()
+
+    def _sub(m: re.Match) -> str:
+        when = now - timedelta(days=int(m.group(1)))
+        return when.strftime(_DATE_FORMATS[m.group(2)])
+
+    return _DATE_TOKEN.sub(_sub, raw)
+
+
+def _scale_json(data: Dict, path, scale: int) -> Dict:
+    """Repeat the item list ``scale`` times with distinct URLs."""
+    if scale <= 1 or not path:
+        return data
+    parent = data
+    for key in path[:-1]:
+        parent = parent[key]
+    items = parent[path[-1]]
+    scaled: List[Dict] = []
+    for copy_idx in range(scale):
+        for item in items:
+            clone = copy.deepcopy(item)
+            if copy_idx:
+                for key in _URL_KEYS:
+                    if clone.get(key):
+                        clone[key] = f"{clone[key].rstrip('/')}-{copy_idx}"
+                if clone.get("title"):
+                    clone["title"] = f"{clone['title']} ({copy_idx})"
+                if clone.get("webTitle"):
+                    clone["webTitle"] = f"{clone['webTitle']} ({copy_idx})"
+            scaled.append(clone)
+    parent[path[-1]] = scaled
+    return data
+
+
+def _scale_rss(xml: str, scale: int) -> str:
+    if scale <= 1:
+        return xml
+    items = re.findall(r"<item>.*?</item>", xml, flags=re.S)
+    extra = []
+    for copy_idx in range(1, scale):
+        for item in items:
+            extra.append(
+                re.sub(r"(</link>|#0</guid>)", rf"-{copy_idx}\1", item)
+            )
+    return xml.replace("</channel>", "\n".join(extra) + "\n  </channel>")
+
+
+class FakeHTTP:
+    """
+    Fixture-backed replacement for ``requests.Session.request``.
+
+    Every call is recorded in ``calls`` as ``(method, url, params)`` so
+    callers can count upstream requests and spot duplicates.
+    """
+
+    def __init__(self, scale: int = 1, latency: float = 0.0):
+        self.scale = max(1, int(scale))
+        self.latency = latency
+        self.calls: List[tuple] = []
+        self._lock = threading.Lock()
+        self._cache: Dict[str, bytes] = {}
+
+    def _body(self, url: str) -> tuple:
+        host = urlparse(url).netloc
+        for needle, fixture, path in _ROUTES:
+            if needle in host:
+                break
+        else:
+            if any(hint in url.lower() for hint in _FEED_HINTS):
+                fixture, path = _FEED_FIXTURE, None
+            else:
+                fixture, path = _ARTICLE_FIXTURE, None
+
+        if fixture not in self._cache:
+            raw = load_fixture(fixture)
+            if fixture.endswith(".json"):
+                raw = json.dumps(_scale_json(json.loads(raw), path, self.scale))
+            elif fixture.endswith(".xml"):
+                raw = _scale_rss(raw, self.scale)
+            self._cache[fixture] = raw.encode("utf-8")
+
+        if fixture.endswith(".json"):
+            ctype = "application/json"
+        elif fixture.endswith(".xml"):
+            ctype = "application/rss+xml"
+        else:
+            ctype = "text/html; charset=utf-8"
+            # Every fake page is its own canonical copy.
+            return self._cache[fixture].replace(_ARTICLE_CANONICAL, url.encode("utf-8")), ctype
+        return self._cache[fixture], ctype
+
+    def _record(self, method: str, url: str, params_key) -> None:
+        with self._lock:
+            self.calls.append((method.upper(), url, params_key))
+
+    def request(self, method: str, url: str, params=None, data=None, **_: Any) -> requests.Response:
+        frozen = tuple(sorted((params or {}).items())) if isinstance(params, dict) else params
+        self._record(method, url, frozen or data)
+        if self.latency:
+            time.sleep(self.latency)
+        body, ctype = self._body(url)
+
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = body
+        resp.encoding = "utf-8"
+        resp.headers["Content-Type"] = ctype
+        resp.url = url
+        return resp
+
+    def _httpx_response(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url.copy_with(query=None))
+        params = tuple(sorted(request.url.params.multi_items()))
+        self._record(request.method, url, params or request.content or None)
+        body, ctype = self._body(url)
+        # Fixtures never change, so conditional requests always revalidate.
+        etag = f'"{hash(body) & 0xFFFFFFFF:08x}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, content=body, headers={"Content-Type": ctype, "ETag": etag})
+
+    def duplicate_calls(self) -> int:
+        """Number of calls that repeated an earlier identical request."""
+        return len(self.calls) - len(set(self.calls))
+
+    @contextmanager
+    def patched(self):
+        from src.LangGraph.tools import http_pool
+
+        fake = self
+
+        def _request(session, method, url, params=None, data=None, **kwargs):
+            return fake.request(method, url, params=params, data=data, **kwargs)
+
+        original = requests.Session.request
+        requests.Session.request = _request
+        http_pool.use_transport(_FakeTransport(self))
+        try:
+            yield self
+        finally:
+            requests.Session.request = original
+            http_pool.use_transport(None)
+
+
+class _FakeTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport serving ``FakeHTTP`` fixtures; latency never blocks the loop."""
+
+    def __init__(self, fake: FakeHTTP):
+        self.fake = fake
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.fake.latency:
+            time.sleep(self.fake.latency)
+        return self.fake._httpx_response(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.fake.latency:
+            await asyncio.sleep(self.fake.latency)
+        return self.fake._httpx_response(request)
+
+
+_LLM_ARTICLE = re.compile(
+    r"^ID: \d+ \| DATE: (?P<date>[^|]*) \| TITLE: (?P<title>.*?) \| TEXT: (?P<text>.*?) \| URL: (?P<url>\S+)$",
+    re.M,
+)
+
+
+class FakeNewsLLM(BaseChatModel):
+    """
+    Deterministic chat model.
+
+    For the news summariser prompt it emits one ``DATE || HEADLINE ||
+    SUMMARY || URL`` line per article; for anything else it echoes the
+    last message back.
+    """
+
+    latency: float = 0.0
+    calls: int = 0
+    last_prompt_messages: int = 0
+
+    def bind_tools(self, tools, **kwargs):
+        """Tools are accepted but never called."""
+        return self
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-news-llm"
+
+    def _reply(self, messages) -> str:
+        prompt = messages[-1].content if messages else ""
+        if not isinstance(prompt, str):
+            prompt = str(prompt)
+
+        lines = []
+        for m in _LLM_ARTICLE.finditer(prompt):
+            words = (m.group("text") or m.group("title")).split()
+            summary = " ".join(words[:80]) or m.group("title")
+            lines.append(
+                f"{m.group('date').strip()} || {m.group('title').strip()} || {summary} || {m.group('url')}"
+            )
+        if lines:
+            return "\n".join(lines)
+        return f"You said: {prompt[:200]}"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        self.calls += 1
+        self.last_prompt_messages = len(messages)
+        if self.latency:
+            time.sleep(self.latency)
+        message = AIMessage(content=self._reply(messages))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        self.last_prompt_messages = len(messages)
+        if self.latency:
+            time.sleep(self.latency)
+        for token in re.findall(r"\S+\s*", self._reply(messages)):
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+
+@contextmanager
+def offline(scale: int = 1, net_latency: float = 0.0, rate_limits: bool = False):
+    """
+    Patch all network access with fixtures for the duration of the block.
+
+    Provider rate limiters (``archive_fetch``) and the per-host delay of
+    article fetches are switched off unless ``rate_limits`` is set, since
+    fixtures have no quota to protect.
+
+    Yields the ``FakeHTTP`` instance so callers can inspect ``calls``.
+    """
+    from src.LangGraph.tools import archive_fetch, article_fetch
+
+    os.environ.setdefault("TAVILY_API_KEY", "offline")
+    os.environ.setdefault("NEWS_DATA_API_KEY", "offline")
+    os.environ.setdefault("GUARDIAN_API_KEY", "offline")
+
+    limiters = (archive_fetch.GUARDIAN_LIMITER, archive_fetch.GDELT_LIMITER)
+    intervals = [limiter.interval for limiter in limiters]
+    host_interval = article_fetch.HOST_INTERVAL
+    if not rate_limits:
+        for limiter in limiters:
+            limiter.interval = 0.0
+        article_fetch.HOST_INTERVAL = 0.0
+
+    http = FakeHTTP(scale=scale, latency=net_latency)
+    try:
+        with http.patched():
+            yield http
+    finally:
+        for limiter, interval in zip(limiters, intervals):
+            limiter.interval = interval
+        article_fetch.HOST_INTERVAL = host_interval
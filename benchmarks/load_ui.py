@@ -0,0 +1,220 @@
+"""
+Synthetic multi-session load generator for the Streamlit app.
+
+Drives ``app.py`` (and therefore ``load_app``) through Streamlit's
+``AppTest`` harness with all providers and the LLM stubbed by
+``benchmarks.fakes``. Each simulated reader opens a session, then
+repeatedly picks a category + timeframe and clicks "Fetch Latest News".
+
+Reports latency percentiles per click, process memory growth and how
+many upstream HTTP calls were exact duplicates of an earlier call.
+
+Usage:
+    python -m benchmarks.load_ui --sessions 20 --clicks 5
+    python -m benchmarks.load_ui --sessions 50 --processes 4 --net-latency 0.05
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+from urllib.parse import urlparse
+
+from benchmarks.fakes import FakeNewsLLM, offline
+
+APP_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, "app.py"))
+CATEGORIES = ["news", "general", "finance", "movies", "sports", "business", "tech"]
+TIMEFRAMES = ["Today", "Weekly", "Monthly"]
+
+
+def _rss_mb() -> float:
+    """Resident set size of this process in MB (Linux), else peak RSS."""
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _percentile(values: List[float], pct: int) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def _widget(elements, label):
+    return next(w for w in elements if w.label == label)
+
+
+def run_worker(session_ids: List[int], clicks: int, seed: int, timeout: float,
+               net_latency: float, llm_latency: float, workdir: str) -> Dict:
+    """
+    Drive a group of sessions round-robin inside one process.
+
+    ``AppTest`` owns a process-global runtime, so sessions cannot overlap
+    inside one interpreter; interleaving their clicks still exercises the
+    shared caches exactly like a multi-session server would. Parallelism
+    comes from running several workers as separate processes.
+    """
+    from streamlit.testing.v1 import AppTest
+    import src.LangGraph.llms.groqllm as groqllm
+
+    # AppTest runs without a server, so every rerun warns about a
+    # missing ScriptRunContext; that noise is irrelevant here.
+    from streamlit import logger as st_logger
+
+    st_logger.set_log_level("error")
+
+    original_chat = groqllm.ChatGroq
+    groqllm.ChatGroq = lambda **_: FakeNewsLLM(latency=llm_latency)
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    cwd = os.getcwd()
+    try:
+        with offline(net_latency=net_latency) as http:
+            # Summary files are written relative to the working directory.
+            os.chdir(workdir)
+            rss_start = _rss_mb()
+
+            sessions = []
+            for sid in session_ids:
+                at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+                at.run()
+                sessions.append((at, random.Random(seed + sid)))
+
+            for _ in range(clicks):
+                for at, rng in sessions:
+                    _widget(at.sidebar.radio, "Choose News Category").set_value(
+                        rng.choice(CATEGORIES)
+                    )
+                    _widget(at.sidebar.selectbox, "Select Time Frame").set_value(
+                        rng.choice(TIMEFRAMES)
+                    )
+                    _widget(at.sidebar.button, "Fetch Latest News").click()
+
+                    started = time.perf_counter()
+                    try:
+                        at.run()
+                    except Exception as e:
+                        errors.append(f"{type(e).__name__}: {e}")
+                        continue
+                    latencies.append(time.perf_counter() - started)
+
+                    errors.extend(exc.message for exc in at.exception)
+                    errors.extend(str(err.value) for err in at.error)
+
+            rss_end = _rss_mb()
+            calls = list(http.calls)
+    finally:
+        os.chdir(cwd)
+        groqllm.ChatGroq = original_chat
+
+    return {
+        "latencies": latencies,
+        "errors": errors,
+        "calls": calls,
+        "rss_growth": rss_end - rss_start,
+        "rss_end": rss_end,
+    }
+
+
+def load_test(sessions: int, clicks: int, processes: int, seed: int,
+              net_latency: float, llm_latency: float, timeout: float) -> Dict:
+    processes = max(1, min(processes, sessions))
+    groups = [list(range(sessions))[i::processes] for i in range(processes)]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        started = time.perf_counter()
+        if processes == 1:
+            results = [
+                run_worker(groups[0], clicks, seed, timeout, net_latency, llm_latency, workdir)
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                futures = [
+                    pool.submit(run_worker, g, clicks, seed, timeout, net_latency, llm_latency, workdir)
+                    for g in groups
+                ]
+                results = [f.result() for f in futures]
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(l for r in results for l in r["latencies"])
+    errors = [e for r in results for e in r["errors"]]
+    calls = [c for r in results for c in r["calls"]]
+    by_host = Counter(urlparse(url).netloc for _, url, _ in calls)
+    duplicates = len(calls) - len(set(calls))
+
+    return {
+        "sessions": sessions,
+        "processes": processes,
+        "clicks": len(latencies),
+        "elapsed_s": elapsed,
+        "clicks_per_s": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "p50": _percentile(latencies, 50) * 1000,
+            "p90": _percentile(latencies, 90) * 1000,
+            "p95": _percentile(latencies, 95) * 1000,
+            "p99": _percentile(latencies, 99) * 1000,
+            "max": (latencies[-1] if latencies else 0.0) * 1000,
+        },
+        "rss_growth_mb": sum(r["rss_growth"] for r in results),
+        "rss_end_mb": sum(r["rss_end"] for r in results),
+        "upstream_calls": len(calls),
+        "duplicate_calls": duplicates,
+        "calls_by_host": dict(by_host.most_common(10)),
+        "errors": Counter(errors).most_common(5),
+    }
+
+
+def _print_report(report: Dict) -> None:
+    lat = report["latency_ms"]
+    print(f"sessions          {report['sessions']} across {report['processes']} process(es)")
+    print(f"clicks            {report['clicks']}  ({report['clicks_per_s']:.1f}/s over {report['elapsed_s']:.1f}s)")
+    print(
+        "latency ms        "
+        f"p50 {lat['p50']:.0f}  p90 {lat['p90']:.0f}  p95 {lat['p95']:.0f}  "
+        f"p99 {lat['p99']:.0f}  max {lat['max']:.0f}"
+    )
+    print(f"rss MB            {report['rss_end_mb']:.1f} total, +{report['rss_growth_mb']:.1f} while under load")
+    dup_pct = 100 * report["duplicate_calls"] / report["upstream_calls"] if report["upstream_calls"] else 0
+    print(f"upstream calls    {report['upstream_calls']}  duplicates {report['duplicate_calls']} ({dup_pct:.0f}%)")
+    for host, count in report["calls_by_host"].items():
+        print(f"  {host:<32}{count}")
+    if report["errors"]:
+        print("errors")
+        for msg, count in report["errors"]:
+            print(f"  {count:>4} x {msg[:120]}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--clicks", type=int, default=3, help="fetch clicks per session")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes running sessions in parallel")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--net-latency", type=float, default=0.0, help="simulated seconds per HTTP call")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="simulated seconds per LLM call")
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-rerun timeout in seconds")
+    args = parser.parse_args(argv)
+
+    report = load_test(
+        args.sessions, args.clicks, args.processes, args.seed,
+        args.net_latency, args.llm_latency, args.timeout,
+    )
+    _print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Bulk historical backfill of the local article store.
+
+Runs the News pipeline once per (day, category) over a date range and
+saves the articles and summaries in the article store, so the UI can
+serve those days without calling any provider or LLM. Finished units are
+checkpointed in the store: re-running the same command resumes where it
+stopped. Provider rate limits are shared by all concurrent units.
+
+Usage:
+    python -m src.LangGraph.backfill --start 2025-10-01 --end 2025-10-31
+    python -m src.LangGraph.backfill --start 2025-10-01 --end 2025-10-31 --categories sports tech
+    python -m src.LangGraph.backfill --start 2025-10-01 --end 2025-10-07 --mode hybrid --model llama-3.1-8b-instant
+
+By default every category is backfilled together in batch mode with
+local extractive summaries ("fast"), which needs no LLM key.
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from src.LangGraph.nodes.news_node import ALL_CATEGORIES, NEWS_CATEGORIES, SUMMARY_MODES, NewsNode
+from src.LangGraph.tools.aio import run
+from src.LangGraph.tools.article_store import STORE_DB, ArticleStore, days_between, get_store
+
+
+def _build_llm(mode: str, model: Optional[str]):
+    if mode == "fast":
+        return None
+    from langchain_groq import ChatGroq
+
+    return ChatGroq(model=model or "llama-3.1-8b-instant")
+
+
+async def _run_unit(node: NewsNode, day: date) -> int:
+    """Run fetch → pages → summarise → store for one day; return articles stored."""
+    state = {
+        "messages": [
+            {
+                "role": "user",
+                "content": json.dumps({"timeframe": "daily", "selected_date": day.isoformat()}),
+            }
+        ]
+    }
+    for stage in (node.afetch_news, node.afetch_articles, node.asummarize_news, node.asave_result):
+        state.update(await stage(state))
+    return len(state.get("news_data") or [])
+
+
+async def backfill(start: date, end: date, categories: List[str], mode: str = "fast",
+                   model: Optional[str] = None, concurrency: int = 2,
+                   store: Optional[ArticleStore] = None) -> Tuple[int, int]:
+    """
+    Backfill ``start``..``end`` for ``categories`` (``["all"]`` for one
+    batch run per day). Returns ``(units run, articles stored)``.
+    """
+    store = store or get_store()
+    llm = _build_llm(mode, model)
+    nodes = {
+        cat: NewsNode(llm, cat, [], summary_mode=mode, write_files=False, store=store,
+                      gdelt_windows=None)
+        for cat in categories
+    }
+
+    units = []
+    for cat in categories:
+        done = store.done_days(cat, start, end)
+        units.extend((day, cat) for day in days_between(start, end) if day.isoformat() not in done)
+    total = len(units)
+    skipped = len(categories) * ((end - start).days + 1) - total
+    print(f"{total} day×category units to run ({skipped} already done)")
+    if not total:
+        return 0, 0
+
+    slots = asyncio.Semaphore(max(concurrency, 1))
+    started = time.perf_counter()
+    finished = 0
+    stored = 0
+
+    async def one(day: date, cat: str) -> None:
+        nonlocal finished, stored
+        async with slots:
+            try:
+                count = await _run_unit(nodes[cat], day)
+            except Exception as e:
+                print(f"  {day} {cat}: failed ({e}); will retry on the next run")
+                return
+        await asyncio.to_thread(store.mark_done, day.isoformat(), cat, count)
+        finished += 1
+        stored += count
+        elapsed = time.perf_counter() - started
+        rate = finished / elapsed
+        eta = (total - finished) / rate if rate else 0
+        print(
+            f"[{finished:>{len(str(total))}}/{total}] {day} {cat:<8} {count:>4} articles | "
+            f"{rate * 60:.1f} units/min, {stored / elapsed:.1f} articles/s, ETA {eta:.0f}s"
+        )
+
+    # Newest days first: the most likely to be viewed.
+    await asyncio.gather(*(one(day, cat) for day, cat in sorted(units, reverse=True)))
+    return finished, stored
+
+
+def main(argv=None):
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--start", required=True, type=date.fromisoformat)
+    parser.add_argument("--end", type=date.fromisoformat, help="default: yesterday")
+    parser.add_argument(
+        "--categories", nargs="+", default=[ALL_CATEGORIES],
+        choices=(ALL_CATEGORIES,) + NEWS_CATEGORIES,
+        help='"all" runs every category together in one batch pass per day',
+    )
+    parser.add_argument("--mode", default="fast", choices=SUMMARY_MODES)
+    parser.add_argument("--model", help="Groq model for the hybrid / llm modes")
+    parser.add_argument("--concurrency", type=int, default=2, help="units running at once")
+    parser.add_argument("--db", default=STORE_DB, help="article store path")
+    args = parser.parse_args(argv)
+
+    # Today is still changing; it is served live, not backfilled.
+    yesterday = date.today() - timedelta(days=1)
+    end = min(args.end or yesterday, yesterday)
+    if args.start > end:
+        parser.error(f"--start must be on or before {end}")
+
+    started = time.perf_counter()
+    units, articles = run(
+        backfill(args.start, end, args.categories, args.mode, args.model,
+                 args.concurrency, get_store(args.db))
+    )
+    elapsed = time.perf_counter() - started
+    print(f"done: {units} units, {articles} articles in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Process-wide checkpointer giving the chatbots persistent, per-thread
+conversation memory.
+
+Uses SQLite (``langgraph-checkpoint-sqlite``) when available so history
+survives app restarts; otherwise falls back to an in-memory saver.
+"""
+import os
+import sqlite3
+from functools import lru_cache
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+try:
+    from langgraph.checkpoint.sqlite import SqliteSaver
+except ImportError:
+    SqliteSaver = None
+
+CHECKPOINT_DB = os.getenv("CHECKPOINT_DB", "./checkpoints.sqlite")
+
+
+@lru_cache(maxsize=None)
+def get_checkpointer(path: str = CHECKPOINT_DB):
+    """
+    Return the shared checkpointer for ``path``.
+
+    One connection is shared by every Streamlit session thread, hence
+    ``check_same_thread=False``; ``SqliteSaver`` serialises access itself.
+    """
+    if SqliteSaver is None:
+        return InMemorySaver()
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    saver = SqliteSaver(conn)
+    saver.setup()
+    return saver
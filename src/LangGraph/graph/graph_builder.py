@@ -1,16 +1,18 @@
 from langgraph.graph import StateGraph
-from src.LangGraph.state.state import State
+from langchain_core.runnables import RunnableLambda
+from src.LangGraph.state.state import State, NewsState
 from langgraph.graph import START,END
 from src.LangGraph.nodes.basic_chatbot_node import BasicChatbotNode
 from src.LangGraph.tools.search_tool import get_tools,create_tool_node
 from langgraph.prebuilt import ToolNode,tools_condition
 from src.LangGraph.nodes.chatbot_with_tools import ChatBotToolNode
 
-from src.LangGraph.nodes.news_node import NewsNode
+from src.LangGraph.nodes.news_node import NewsNode, DEFAULT_SUMMARY_MODE
 class GraphBuilder:
-    def __init__(self,model,news_type):
+    def __init__(self,model,news_type,summary_mode=DEFAULT_SUMMARY_MODE):
         self.llm=model
         self.news_type=news_type
+        self.summary_mode=summary_mode
         self.graph_builder=StateGraph(State)
 
     def basic_chatbot_build_graph(self):
@@ -65,20 +67,45 @@ class GraphBuilder:
         tool_node = create_tool_node(tools)  # ← ToolNode (NOT passed to NewsNode)
 
         # pass only tools list
-        news_node = NewsNode(self.llm, self.news_type, tools)
+        news_node = NewsNode(
+            self.llm, self.news_type, tools, summary_mode=self.summary_mode
+        )
 
-        self.graph_builder.add_node("fetch_news", news_node.fetch_news)
-        self.graph_builder.add_node("summarize_news", news_node.summarize_news)
-        self.graph_builder.add_node("save_results", news_node.save_result)
+        # All news data lives in the graph state, not on the node.
+        self.graph_builder = StateGraph(NewsState)
+
+        # Each node carries a sync and an async implementation: ainvoke /
+        # astream run the coroutines on one loop, invoke uses the shims.
+        self.graph_builder.add_node(
+            "fetch_news",
+            RunnableLambda(news_node.fetch_news, afunc=news_node.afetch_news),
+        )
+        self.graph_builder.add_node(
+            "fetch_articles",
+            RunnableLambda(news_node.fetch_articles, afunc=news_node.afetch_articles),
+        )
+        self.graph_builder.add_node(
+            "summarize_news",
+            RunnableLambda(news_node.summarize_news, afunc=news_node.asummarize_news),
+        )
+        self.graph_builder.add_node(
+            "save_results",
+            RunnableLambda(news_node.save_result, afunc=news_node.asave_result),
+        )
 
         self.graph_builder.set_entry_point("fetch_news")
-        self.graph_builder.add_edge("fetch_news", "summarize_news")
+        self.graph_builder.add_edge("fetch_news", "fetch_articles")
+        self.graph_builder.add_edge("fetch_articles", "summarize_news")
         self.graph_builder.add_edge("summarize_news", "save_results")
         self.graph_builder.add_edge("save_results", END)
 
-    def setup_graph(self, usecase: str):
+    def setup_graph(self, usecase: str, checkpointer=None):
         """
         Sets up the graph for the selected use case.
+
+        The chatbot graphs are compiled with ``checkpointer`` so each
+        ``thread_id`` keeps its conversation across turns; the News graph
+        is one-shot and never checkpointed.
         """
         if usecase == "Basic Chatbot":
             self.basic_chatbot_build_graph()
@@ -86,4 +113,5 @@ class GraphBuilder:
             self.chatbot_tools_build_graph()
         if usecase == "News":
             self.news_builder_graph()
-        return self.graph_builder.compile()
+            return self.graph_builder.compile()
+        return self.graph_builder.compile(checkpointer=checkpointer)
@@ -3,6 +3,7 @@ import streamlit as st
 from src.LangGraph.ui.streamlitui.loadui import LoadStreamLitUI
 from src.LangGraph.llms.groqllm import GroqLLM
 from src.LangGraph.graph.graph_builder import GraphBuilder
+from src.LangGraph.graph.checkpointer import get_checkpointer
 from src.LangGraph.ui.streamlitui.display_results import DisplayResultStreamlit
 
 
@@ -53,9 +54,15 @@ def load_app():
                 st.error("Error: No use case selected.")
                 return
 
-            graph_builder = GraphBuilder(model, news_type)
+            # "Fetch All Categories" runs the News graph in batch mode.
+            graph_news_type = "all" if st.session_state.get("NEWS_BATCH") else news_type
+            graph_builder = GraphBuilder(
+                model, graph_news_type, user_input.get("SUMMARY_MODE", "hybrid")
+            )
             try:
-                graph = graph_builder.setup_graph(usecase)
+                graph = graph_builder.setup_graph(
+                    usecase, checkpointer=get_checkpointer()
+                )
                 DisplayResultStreamlit(
                     usecase, graph, user_message, thread_id
                 ).display_result_on_ui()
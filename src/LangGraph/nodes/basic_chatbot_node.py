@@ -1,4 +1,5 @@
 from src.LangGraph.state.state import State
+from src.LangGraph.nodes.history import prune_stored, trim_history
 
 class BasicChatbotNode:
     """
@@ -24,20 +25,11 @@ class BasicChatbotNode:
             3. If the user asks something partially related, clarify and bring the topic back.
             4. Keep answers short, factual, and focused on {self.news_type}.
             """
-        # Get LLM reply
-        last_user_msg = state["messages"][-1].content if state["messages"] else ""
+        # Recent history (token-bounded) instead of only the last message
+        messages = [("system", system_prompt)] + trim_history(state["messages"])
 
-        messages = [
-            ("system", system_prompt),
-            ("user", last_user_msg)
-        ]
-      
         response = self.llm.invoke(messages)
 
-        # Convert to plain string if AIMessage object
-        content = getattr(response, "content", str(response))
-
-        # Append to chat history
-        messages.append({"role": "assistant", "content": content})
-
-        return {"messages": messages}
\ No newline at end of file
+        # Only the new reply (plus removals past the retention cap); the
+        # add_messages reducer applies them to the checkpointed thread.
+        return {"messages": prune_stored(state["messages"]) + [response]}
\ No newline at end of file
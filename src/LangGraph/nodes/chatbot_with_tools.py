@@ -1,4 +1,5 @@
 from src.LangGraph.state.state import State
+from src.LangGraph.nodes.history import prune_stored, trim_history
 
 class ChatBotToolNode:
     def __init__(self,model):
@@ -28,9 +29,9 @@ class ChatBotToolNode:
                 """
                    Chatbot Logic for processing the input state and returning a response 
                 """
-                print(state)
-                # return {"messages":[llm_with_tools.invoke(state["messages"])]}
-                response = llm_with_tools.invoke(state["messages"])
-                return {"messages": state["messages"] + [response]}
+                # Token-bounded window of the thread, and only the new
+                # reply back: add_messages appends it to the history.
+                response = llm_with_tools.invoke(trim_history(state["messages"]))
+                return {"messages": prune_stored(state["messages"]) + [response]}
              
             return chatbot_node
\ No newline at end of file
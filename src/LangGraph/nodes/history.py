@@ -0,0 +1,53 @@
+"""
+Conversation-history trimming shared by the chatbot nodes.
+
+Only a recent window that fits ``MAX_HISTORY_TOKENS`` is ever sent to the
+model, and the checkpointed thread itself is capped at
+``MAX_STORED_MESSAGES``, so both prompt size and per-turn checkpoint
+cost stay bounded however long the conversation gets.
+"""
+import os
+from typing import List
+
+from langchain_core.messages import BaseMessage, HumanMessage, RemoveMessage, trim_messages
+from langchain_core.messages.utils import count_tokens_approximately
+
+MAX_HISTORY_TOKENS = int(os.getenv("MAX_HISTORY_TOKENS", "3000"))
+# Hard cap applied before token counting, so trimming cost does not grow
+# with the length of the stored thread.
+MAX_HISTORY_MESSAGES = int(os.getenv("MAX_HISTORY_MESSAGES", "60"))
+MAX_STORED_MESSAGES = int(os.getenv("MAX_STORED_MESSAGES", "100"))
+
+
+def trim_history(messages: List[BaseMessage], max_tokens: int = MAX_HISTORY_TOKENS) -> List[BaseMessage]:
+    """
+    Keep the most recent messages that fit ``max_tokens``.
+
+    The window always starts on a human turn and never splits an AI tool
+    call from its tool results.
+    """
+    if not messages:
+        return []
+    return trim_messages(
+        messages[-MAX_HISTORY_MESSAGES:],
+        max_tokens=max_tokens,
+        token_counter=count_tokens_approximately,
+        strategy="last",
+        start_on="human",
+        include_system=False,
+        allow_partial=False,
+    )
+
+
+def prune_stored(messages: List[BaseMessage], keep: int = MAX_STORED_MESSAGES) -> List[RemoveMessage]:
+    """
+    ``RemoveMessage`` markers for everything older than the last ``keep``
+    messages. The cut is moved forward to the next human turn so a tool
+    call is never separated from its results.
+    """
+    if len(messages) <= keep:
+        return []
+    cut = len(messages) - keep
+    while cut < len(messages) and not isinstance(messages[cut], HumanMessage):
+        cut += 1
+    return [RemoveMessage(id=m.id) for m in messages[:cut] if m.id]
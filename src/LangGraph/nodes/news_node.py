@@ -1,82 +1,236 @@
-from datetime import datetime, timezone, date, timedelta
+from datetime import datetime, timezone, date
 from collections import defaultdict
+import asyncio
 import json
 import os
-from typing import List, Dict
-from urllib.parse import urlparse, urlunparse
+from typing import List, Dict, Iterable, Optional, Tuple
 
-import requests
 from tavily import TavilyClient
 from langchain_core.prompts import ChatPromptTemplate
 
-from src.LangGraph.state.state import State
+from src.LangGraph.state.state import Article, NewsState
+from src.LangGraph.tools.aio import run_sync
+from src.LangGraph.tools.category_classifier import GENERAL_CATEGORIES, get_classifier
+from src.LangGraph.tools.ranking import TOP_K_PER_DAY, rank_articles, select_top_k
+from src.LangGraph.tools.extractive_summary import summarize as extractive_summary
+from src.LangGraph.tools.article_fetch import afetch_articles
+from src.LangGraph.tools.article_store import ArticleStore, get_store
+from src.LangGraph.tools.seen_index import get_seen_index
+from src.LangGraph.tools.url_canonical import canonical_key, canonical_keys, canonical_url, learn
+from src.LangGraph.tools.feeds import afetch_feeds, covered
+from src.LangGraph.tools.feed_poller import apoll
+from src.LangGraph.tools.date_ranges import FREQUENCY_DAYS, date_range, normalize_frequency, parse_anchor
+from src.LangGraph.tools.archive_fetch import (
+    ARCHIVE_PER_DAY,
+    GDELT_INTERACTIVE_WINDOWS,
+    day_windows,
+    fetch_gdelt_archive,
+    fetch_guardian_archive,
+)
 from src.LangGraph.tools.search_tool import NewsDataSearch
 
 
+# ----------------------------------------------------------------------
+# CATEGORIES + PER-PROVIDER MAPPINGS
+# ----------------------------------------------------------------------
+NEWS_CATEGORIES = ("news", "general", "finance", "movies", "sports", "business", "tech")
+
+# ``news_type`` that runs every category in one batch pass.
+ALL_CATEGORIES = "all"
+
+GUARDIAN_SECTIONS = {
+    "finance": "business",
+    "business": "business",
+    "sports": "sport",
+    "movies": "film",
+    "tech": "technology",
+}
+
+GDELT_TERMS = {
+    "finance": "finance OR stock OR market",
+    "business": "business OR company OR earnings",
+    "sports": "sports OR football OR cricket OR soccer OR tennis",
+    "movies": "movie OR film OR cinema OR hollywood OR bollywood",
+    "tech": "technology OR AI OR software OR gadgets OR startups",
+    "general": "",
+    "news": "",
+}
+
+TAVILY_QUERIES = {
+    "news": (
+        "news",
+        "breaking news headlines from BBC, The Guardian, AP and Reuters",
+    ),
+    "general": (
+        "news",
+        "top general stories from BBC, The Guardian, AP and Reuters",
+    ),
+    "finance": (
+        "finance",
+        "finance and markets news from Reuters, Bloomberg, WSJ and FT",
+    ),
+    "business": (
+        "finance",
+        "business and company news from FT, Bloomberg, WSJ and Reuters",
+    ),
+    "sports": (
+        "news",
+        "sports headlines, scores and match reports from ESPN and BBC Sport",
+    ),
+    "movies": (
+        "news",
+        "movies and entertainment news from Variety, Hollywood Reporter and IMDB news",
+    ),
+    "tech": (
+        "news",
+        "technology news about AI, software, gadgets and startups from The Verge, Wired and TechCrunch",
+    ),
+}
+
+# One broad Tavily query per topic in batch mode; classification sorts
+# the results into categories afterwards.
+TAVILY_BATCH_QUERIES = {
+    "news": "Latest news – breaking headlines, sports, movies and entertainment, technology and AI",
+    "finance": "Latest finance and business news – markets, companies and earnings",
+}
+
+# How stories are summarised:
+#   fast   – local extractive summaries only, no LLM call
+#   hybrid – LLM for the top-K stories per day, extractive for the rest
+#   llm    – LLM for every story
+SUMMARY_MODES = ("fast", "hybrid", "llm")
+DEFAULT_SUMMARY_MODE = "hybrid"
+
+# Words of page text sent to the LLM per article.
+LLM_TEXT_WORDS = 250
+# Words of article input per summariser call: long ranges and batch runs
+# are split into several calls, each well inside the model's context and
+# output limits (one 60-150 word summary comes back per article).
+LLM_PROMPT_WORDS = int(os.getenv("NEWS_LLM_PROMPT_WORDS", "4000"))
+# Summariser calls in flight at once.
+LLM_CONCURRENCY = int(os.getenv("NEWS_LLM_CONCURRENCY", "2"))
+
+SUMMARY_HEADINGS = {
+    "daily": "Today News Summary",
+    "weekly": "Weekly News Summary",
+    "monthly": "Monthly News Summary",
+}
+
+
+def summary_path(frequency: str, category: str = None) -> str:
+    """
+    Markdown file holding the ``frequency`` summary of ``category``.
+    Without a category this is the single shared file older runs wrote.
+    """
+    if not category:
+        return os.path.join("News", f"{frequency}_summary.md")
+    return os.path.join("News", category, f"{frequency}_summary.md")
+
+
 class NewsNode:
     """
     News node that:
 
       1. Fetches raw articles from multiple **free** sources:
          - Tavily (for latest / near-term)
-         - BBC RSS feeds (latest)
+         - RSS / Atom feed catalog (polled per feed, kept in the store)
          - The Guardian Content API (latest + archive)
          - GDELT Doc API (archive for selected dates)
 
-      2. Summarises them into 60–150 word summaries.
+      2. Ranks the stories, downloads the pages of the top ones for
+         their full text (``fetch_pages``), and summarises them into 60–150 word
+         summaries: with the LLM for the ``top_k`` best per day and a
+         local extractive summariser for the rest (``summary_mode``
+         "hybrid"), the LLM for all ("llm") or no LLM at all ("fast").
+
+      3. Writes markdown files for "daily", "weekly", "monthly" used by
+         the UI (``write_files``) and saves articles + summaries in the
+         local article store.
+
+    With ``news_type="all"`` the node runs in batch mode: each provider is
+    queried once for every category, articles are de-duplicated once and
+    classified into categories afterwards, one LLM pass summarises them
+    all and one summary file is written per category.
 
-      3. Writes markdown files for "daily", "weekly", "monthly" used by the UI.
+    With ``incremental`` (default) only articles not yet processed for
+    their (source, category) go on to ranking and summarisation; the
+    summaries stored by earlier runs fill in the rest of the range.
+
+    ``gdelt_windows`` caps the GDELT requests of a run so a long range
+    stays interactive; those runs report the range as partial in
+    ``notices``. ``None`` fetches every day in full (backfill).
     """
 
-    def __init__(self, llm, news_type, tools):
+    def __init__(self, llm, news_type, tools, top_k: int = TOP_K_PER_DAY,
+                 summary_mode: str = DEFAULT_SUMMARY_MODE, fetch_pages: bool = True,
+                 write_files: bool = True, store: Optional[ArticleStore] = None,
+                 incremental: bool = True,
+                 gdelt_windows: Optional[int] = GDELT_INTERACTIVE_WINDOWS):
         self.llm = llm
+        self.top_k = top_k
+        self.fetch_pages = fetch_pages
+        self.write_files = write_files
+        self.store = store
+        self.incremental = incremental
+        self.gdelt_windows = gdelt_windows
+        self.summary_mode = (summary_mode or DEFAULT_SUMMARY_MODE).lower()
+        if self.summary_mode not in SUMMARY_MODES:
+            self.summary_mode = DEFAULT_SUMMARY_MODE
         self.news_type = (news_type or "news").lower().strip()
+        self.batch = self.news_type == ALL_CATEGORIES
         self.tools = tools or []
-        self.tavily = TavilyClient()
-        self.state: Dict = {}
+        # Tavily only serves ranges that reach today; without a key (e.g.
+        # a backfill) the node just runs without it, like the Guardian.
+        self.tavily = TavilyClient() if os.getenv("TAVILY_API_KEY") else None
         self.guardian_key = os.getenv("GUARDIAN_API_KEY")
 
+    @property
+    def categories(self) -> Tuple[str, ...]:
+        """Categories this node produces summaries for."""
+        return NEWS_CATEGORIES if self.batch else (self.news_type,)
+
     # ------------------------------------------------------------------
     # URL NORMALISATION + DEDUPE
     # ------------------------------------------------------------------
     def _normalize_url(self, url: str) -> str:
         """
-        Normalise URL so that UTM params / tracking do not create duplicates.
+        De-duplication key of ``url`` (see ``url_canonical``): tracking
+        params, AMP / mobile variants and hosts aliases fold together, and
+        a page's known ``<link rel="canonical">`` maps to the key first
+        assigned to it.
         """
-        if not url:
-            return ""
-        try:
-            url = url.strip()
-            parsed = urlparse(url)
-            cleaned = parsed._replace(query="", fragment="")
-            scheme = cleaned.scheme.lower() or "https"
-            netloc = cleaned.netloc.lower()
-            cleaned = cleaned._replace(scheme=scheme, netloc=netloc)
-            return urlunparse(cleaned)
-        except Exception:
-            return url.strip()
+        return canonical_key(url, self.store)
 
-    def _dedupe_and_clamp_dates(self, items: List[Dict]) -> List[Dict]:
+    def _dedupe_and_clamp_dates(self, items: List[Dict]) -> List[Article]:
         """
-        Remove duplicate URLs and clamp any future dates.
+        Remove duplicate URLs, drop future-dated items and turn the raw
+        provider dicts into ``Article`` records.
 
-        Adds:
-        - "__url"            : cleaned URL
-        - "__pub_date_only"  : YYYY-MM-DD string
+        Category hints of duplicates are merged, so an article served by
+        two category feeds keeps both.
         """
         today = date.today()
-        clean: List[Dict] = []
-        seen: set[str] = set()
+        clean: List[Article] = []
+        # None marks a URL that was seen but dropped (future-dated).
+        seen: Dict[str, Optional[Article]] = {}
+        keys = canonical_keys(
+            (item.get("url") or item.get("link") for item in items), self.store
+        )
 
         for item in items:
             url = item.get("url") or item.get("link")
             if not url:
                 continue
 
-            norm = self._normalize_url(url)
-            if not norm or norm in seen:
+            norm = keys.get(url)
+            if not norm:
+                continue
+            hints = tuple(item.get("categories") or ())
+            if norm in seen:
+                kept = seen[norm]
+                if kept is not None:
+                    kept.categories += tuple(c for c in hints if c not in kept.categories)
                 continue
-            seen.add(norm)
 
             pub_raw = (
                 item.get("published_date")
@@ -87,6 +241,7 @@ class NewsNode:
                 or ""
             )
 
+            stamp = ""
             if pub_raw:
                 d = today
                 try:
@@ -96,6 +251,7 @@ class NewsNode:
                             pub_raw.replace("Z", "+00:00")
                         ).astimezone(timezone.utc)
                         d = dt.date()
+                        stamp = dt.isoformat()
                     else:
                         dt = datetime.fromisoformat(pub_raw)
                         d = dt.date()
@@ -106,6 +262,7 @@ class NewsNode:
                             pub_raw[:25], "%a, %d %b %Y %H:%M:%S"
                         )
                         d = dt.date()
+                        stamp = dt.replace(tzinfo=timezone.utc).isoformat()
                     except Exception:
                         d = today
             else:
@@ -113,63 +270,146 @@ class NewsNode:
 
             if d > today:
                 # Skip any future-dated articles
+                seen[norm] = None
                 continue
 
-            item["__pub_date_only"] = d.isoformat()
-            item["__url"] = url
-            clean.append(item)
+            article = Article(
+                title=item.get("title") or "",
+                url=url,
+                key=norm,
+                published=d.isoformat(),
+                description=(
+                    item.get("description")
+                    or item.get("content")
+                    or item.get("snippet")
+                    or ""
+                ),
+                source=item.get("source") or item.get("source_id") or "",
+                categories=hints,
+                text=item.get("text") or "",
+                image=item.get("image"),
+                published_at=stamp,
+            )
+            seen[norm] = article
+            clean.append(article)
 
         return clean
 
+    # ------------------------------------------------------------------
+    # CATEGORY CLASSIFICATION
+    # ------------------------------------------------------------------
+    def _classify(self, articles: List[Article]) -> List[Article]:
+        """
+        Set ``Article.categories``.
+
+        A single-category run tags everything with its own category. In
+        batch mode provider hints (feed / section of origin) are combined
+        with the local classifier's labels for title + description;
+        articles with no specific category land in the general ones.
+        """
+        if not self.batch:
+            for art in articles:
+                art.categories = (self.news_type,)
+            return articles
+
+        classifier = get_classifier()
+        for art in articles:
+            hints = set(art.categories)
+            labels = set(classifier.classify(art.title, art.description))
+            if hints - set(GENERAL_CATEGORIES):
+                # A specific provider label beats "nothing specific".
+                labels -= set(GENERAL_CATEGORIES)
+            tags = hints | labels
+            art.categories = tuple(c for c in NEWS_CATEGORIES if c in tags)
+        return articles
+
+    # ------------------------------------------------------------------
+    # WATERMARKS (incremental runs)
+    # ------------------------------------------------------------------
+    def _only_new(self, articles: List[Article]) -> List[Article]:
+        """
+        Articles not processed yet for at least one of their categories.
+        The global seen-URL index settles never-ingested URLs at once;
+        only the rest are checked per (source, category).
+        """
+        try:
+            store = self.store or get_store()
+            ingested = get_seen_index(store).seen(a.key for a in articles)
+            seen = store.seen(self.categories, ingested) if ingested else set()
+        except Exception as e:
+            print(f"Watermarks unavailable ({e}); processing everything")
+            return articles
+        return [
+            art for art in articles
+            if art.key not in ingested
+            or any((art.source, c, art.key) not in seen for c in art.categories)
+        ]
+
+    def _watermarks(self, source: str, start: date, end: date) -> Dict[date, datetime]:
+        """
+        Time each day of ``start``..``end`` was already fetched through
+        from ``source`` (naive UTC); days never fetched are absent.
+        """
+        if not self.incremental:
+            return {}
+        try:
+            stamps = (self.store or get_store()).day_watermarks(
+                source, self.categories, start, end
+            )
+            return {
+                date.fromisoformat(day): datetime.fromisoformat(stamp)
+                .astimezone(timezone.utc).replace(tzinfo=None)
+                for day, stamp in stamps.items()
+            }
+        except Exception:
+            return {}
+
     # ------------------------------------------------------------------
     # GUARDIAN (latest + archive)
     # ------------------------------------------------------------------
-    def _fetch_guardian(
-        self, start: date, end: date, category: str
+    def _per_day_quota(self) -> int:
+        """Archive articles per day and provider; a batch run covers every category."""
+        if self.batch:
+            return ARCHIVE_PER_DAY * len(set(NEWS_CATEGORIES) - set(GENERAL_CATEGORIES))
+        return ARCHIVE_PER_DAY
+
+    async def _fetch_guardian(
+        self, start: date, end: date, category: str,
+        coverage: Optional[Dict[date, datetime]] = None,
     ) -> List[Dict]:
+        """
+        Guardian search over ``start``..``end`` with an even per-day quota
+        (see ``archive_fetch``), skipping days already fetched through.
+        """
         if not self.guardian_key:
             return []
 
-        url = "https://content.guardianapis.com/search"
-
-        section_map = {
-            "finance": "business",
-            "business": "business",
-            "sports": "sport",
-            "movies": "film",
-            "tech": "technology",
-        }
-        section = section_map.get(category)
-        q = None
-        if category in ("movies", "sports", "tech"):
-            q = category
-
         params = {
             "api-key": self.guardian_key,
-            "from-date": start.isoformat(),
-            "to-date": end.isoformat(),
-            "page-size": 50,
             "order-by": "newest",
             "show-fields": "trailText,bodyText",
         }
-        if section:
-            params["section"] = section
-        if q:
-            params["q"] = q
-
-        try:
-            resp = requests.get(url, params=params, timeout=8)
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception:
-            return []
+        if category != ALL_CATEGORIES:
+            # In batch mode the query is unfiltered; sectionId tells the
+            # categories apart.
+            section = GUARDIAN_SECTIONS.get(category)
+            if section:
+                params["section"] = section
+            if category in ("movies", "sports", "tech"):
+                params["q"] = category
+
+        since = await asyncio.to_thread(self._watermarks, "guardian", start, end)
+        raw = await fetch_guardian_archive(
+            params, start, end, self._per_day_quota(), since, coverage
+        )
 
         results: List[Dict] = []
-        for r in data.get("response", {}).get("results", []):
+        for r in raw:
             web_url = r.get("webUrl")
             if not web_url:
                 continue
             fields = r.get("fields", {}) or {}
+            section_id = r.get("sectionId")
             results.append(
                 {
                     "title": r.get("webTitle"),
@@ -179,101 +419,72 @@ class NewsNode:
                     "url": web_url,
                     "published_date": r.get("webPublicationDate", ""),
                     "source": "guardian",
+                    "categories": [
+                        c for c, s in GUARDIAN_SECTIONS.items() if s == section_id
+                    ],
                 }
             )
         return results
 
     # ------------------------------------------------------------------
-    # BBC RSS (latest headlines per category – free)
+    # RSS / ATOM FEEDS (catalog feeds, polled into the store)
     # ------------------------------------------------------------------
-    def _fetch_bbc(self, category: str) -> List[Dict]:
-        feed_map = {
-            "news": "https://feeds.bbci.co.uk/news/rss.xml",
-            "general": "https://feeds.bbci.co.uk/news/rss.xml",
-            "finance": "https://feeds.bbci.co.uk/news/business/rss.xml",
-            "business": "https://feeds.bbci.co.uk/news/business/rss.xml",
-            "sports": "https://feeds.bbci.co.uk/sport/rss.xml",
-            "movies": "https://feeds.bbci.co.uk/news/entertainment_and_arts/rss.xml",
-            "tech": "https://feeds.bbci.co.uk/news/technology/rss.xml",
-        }
-        feed_url = feed_map.get(category, feed_map["news"])
+    async def _fetch_feeds(self, start: date, end: date) -> List[Dict]:
+        """
+        Feed items of this run's categories over ``start``..``end``.
 
+        When the range reaches today the due catalog feeds are polled
+        first (conditional GETs, see ``feed_poller``); everything else is
+        read from what earlier polls stored, so past days are covered by
+        feed items too. Without a usable store the feeds are read directly.
+        """
+        store = self.store or get_store()
         try:
-            resp = requests.get(feed_url, timeout=8)
-            resp.raise_for_status()
-            import xml.etree.ElementTree as ET
-
-            root = ET.fromstring(resp.content)
-        except Exception:
-            return []
-
-        items: List[Dict] = []
-        for node in root.findall(".//item"):
-            title = node.findtext("title") or ""
-            desc = node.findtext("description") or ""
-            link = node.findtext("link") or ""
-            pub = node.findtext("pubDate") or ""
-            if not link:
-                continue
-            items.append(
-                {
-                    "title": title,
-                    "description": desc,
-                    "url": link,
-                    "published_date": pub,
-                    "source": "bbc",
-                }
+            if end >= date.today():
+                await apoll(self.categories, store)
+            return await asyncio.to_thread(
+                store.feed_items, covered(self.categories), start, end
             )
-        return items
+        except Exception as e:
+            print(f"Feed store unavailable ({e}); reading feeds directly")
+            return await afetch_feeds(self.categories) if end >= date.today() else []
 
     # ------------------------------------------------------------------
     # GDELT DOC API (archive)
     # ------------------------------------------------------------------
-    def _fetch_gdelt(
-        self, start: date, end: date, category: str
+    async def _fetch_gdelt(
+        self, start: date, end: date, category: str,
+        coverage: Optional[Dict[date, datetime]] = None,
     ) -> List[Dict]:
         """
         Use GDELT doc API for archive ranges (for any selected date
-        that is strictly in the past).
+        that is strictly in the past), with an even per-day quota.
         """
-        base = "http://api.gdeltproject.org/api/v2/doc/doc"
-
-        query_map = {
-            "finance": "finance OR stock OR market",
-            "business": "business OR company OR earnings",
-            "sports": "sports OR football OR cricket OR soccer OR tennis",
-            "movies": "movie OR film OR cinema OR hollywood OR bollywood",
-            "tech": "technology OR AI OR software OR gadgets OR startups",
-            "general": "",
-            "news": "",
-        }
-        extra = query_map.get(category, "")
+        if category == ALL_CATEGORIES:
+            # Every category's terms OR'd into one query.
+            extra = " OR ".join(t for t in GDELT_TERMS.values() if t)
+        else:
+            extra = GDELT_TERMS.get(category, "")
         query = "news"
         if extra:
-            query = f"news {extra}"
-
-        start_dt = start.strftime("%Y%m%d000000")
-        end_dt = end.strftime("%Y%m%d235959")
+            query = f"news ({extra})"
 
         params = {
             "query": query,
             "mode": "ArtList",
-            "maxrecords": 50,
             "sort": "Date",
             "format": "json",
-            "startdatetime": start_dt,
-            "enddatetime": end_dt,
         }
-
-        try:
-            resp = requests.get(base, params=params, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception:
-            return []
+        # GDELT filters by time, so each day only asks for what came after
+        # that day's watermark.
+        since = await asyncio.to_thread(self._watermarks, "gdelt", start, end)
+        raw = await fetch_gdelt_archive(
+            params, start, end, self._per_day_quota(), since, coverage,
+            self.gdelt_windows,
+        )
 
         items: List[Dict] = []
-        for art in data.get("articles", []):
+        for art in raw:
             url = art.get("url")
             if not url:
                 continue
@@ -288,10 +499,52 @@ class NewsNode:
             )
         return items
 
+    # ------------------------------------------------------------------
+    # TAVILY (latest / near-term)
+    # ------------------------------------------------------------------
+    async def _tavily_search(self, query: str, topic: str, frequency: str) -> List[Dict]:
+        time_range_map = {"daily": "day", "weekly": "week", "monthly": "month"}
+
+        try:
+            # TavilyClient is sync; keep it off the event loop.
+            tavily_resp = await asyncio.to_thread(
+                self.tavily.search,
+                query=query,
+                topic=topic,
+                time_range=time_range_map.get(frequency, "day"),
+                include_answer="none",
+                max_results=35,
+                days=FREQUENCY_DAYS.get(frequency, 1),
+            )
+            results = tavily_resp.get("results", [])
+        except Exception:
+            return []
+        for r in results:
+            r.setdefault("source", "tavily")
+        return results
+
+    async def _fetch_tavily(self, category: str, frequency: str) -> List[Dict]:
+        if self.tavily is None:
+            return []
+        if category == ALL_CATEGORIES:
+            results = await asyncio.gather(
+                *(
+                    self._tavily_search(query, topic, frequency)
+                    for topic, query in TAVILY_BATCH_QUERIES.items()
+                )
+            )
+            return [item for items in results for item in items]
+
+        tavily_topic, query_suffix = TAVILY_QUERIES.get(
+            category, ("news", "breaking news")
+        )
+        query = f"Latest {category} news – {query_suffix}"
+        return await self._tavily_search(query, tavily_topic, frequency)
+
     # ------------------------------------------------------------------
     # 1) FETCH RAW NEWS
     # ------------------------------------------------------------------
-    def fetch_news(self, state: dict) -> dict:
+    async def afetch_news(self, state: NewsState) -> dict:
         """
         Fetch news based on timeframe + selected_date from the UI.
 
@@ -299,7 +552,8 @@ class NewsNode:
           - JSON string: {"timeframe": "...", "selected_date": "YYYY-MM-DD"}
           - plain string: "today"/"weekly"/"monthly"
         """
-        last_msg = state["messages"][-1]["content"]
+        last = state["messages"][-1]
+        last_msg = last["content"] if isinstance(last, dict) else last.content
 
         if isinstance(last_msg, str):
             try:
@@ -311,155 +565,165 @@ class NewsNode:
         else:
             payload = {}
 
-        frequency = str(payload.get("timeframe", "today")).lower()
-        selected_date_str = payload.get("selected_date")
-
-        # Normalise timeframe
-        if frequency in ("today", "daily"):
-            frequency = "daily"
-        elif frequency.startswith("week"):
-            frequency = "weekly"
-        elif frequency.startswith("month"):
-            frequency = "monthly"
-        else:
-            frequency = "daily"
+        frequency = normalize_frequency(payload.get("timeframe", "today"))
 
-        # Anchor date (never in the future)
+        # Range ending at the anchor date (never in the future); the UI
+        # shows exactly this window.
         today = date.today()
-        if selected_date_str:
-            try:
-                anchor = datetime.fromisoformat(selected_date_str).date()
-            except Exception:
-                anchor = today
-        else:
-            anchor = today
-        if anchor > today:
-            anchor = today
-
-        # Compute range for Guardian / GDELT
-        if frequency == "daily":
-            start_date = end_date = anchor
-        elif frequency == "weekly":
-            start_date = anchor - timedelta(days=6)
-            end_date = anchor
-        else:  # monthly
-            start_date = anchor - timedelta(days=29)
-            end_date = anchor
-
-        self.state["frequency"] = frequency
-        self.state["selected_date"] = anchor.isoformat()
+        anchor = parse_anchor(payload.get("selected_date"), today)
+        start_date, end_date = date_range(frequency, anchor, today)
 
         category = self.news_type
-        all_items: List[Dict] = []
 
-        # ----------------------------------------------------------
-        # Tavily + BBC – only if the range touches *today*
-        # (Tavily is good for recent, not deep archives)
-        # ----------------------------------------------------------
+        # Every provider runs concurrently on one event loop.
+        tasks = []
         if end_date >= today:
-            time_range_map = {"daily": "day", "weekly": "week", "monthly": "month"}
-            days_map = {"daily": 1, "weekly": 7, "monthly": 30}
+            # Tavily – only if the range touches *today*
+            # (Tavily is good for recent, not deep archives)
+            tasks.append(self._fetch_tavily(category, frequency))
 
-            time_range = time_range_map.get(frequency, "day")
-            days = days_map.get(frequency, 1)
+        # RSS / Atom feeds: polled when due, otherwise served from the store
+        tasks.append(self._fetch_feeds(start_date, end_date))
 
-            CATEGORY_CONFIG = {
-                "news": (
-                    "news",
-                    "breaking news headlines from BBC, The Guardian, AP and Reuters",
-                ),
-                "general": (
-                    "news",
-                    "top general stories from BBC, The Guardian, AP and Reuters",
-                ),
-                "finance": (
-                    "finance",
-                    "finance and markets news from Reuters, Bloomberg, WSJ and FT",
-                ),
-                "business": (
-                    "finance",
-                    "business and company news from FT, Bloomberg, WSJ and Reuters",
-                ),
-                "sports": (
-                    "news",
-                    "sports headlines, scores and match reports from ESPN and BBC Sport",
-                ),
-                "movies": (
-                    "news",
-                    "movies and entertainment news from Variety, Hollywood Reporter and IMDB news",
-                ),
-                "tech": (
-                    "news",
-                    "technology news about AI, software, gadgets and startups from The Verge, Wired and TechCrunch",
-                ),
-            }
+        # Archive sources report the days they fetched completely, so the
+        # save step can move those days' watermarks.
+        coverage: Dict[str, Dict[date, datetime]] = {"guardian": {}, "gdelt": {}}
+
+        # Guardian (works for both latest + archive)
+        tasks.append(
+            self._fetch_guardian(start_date, end_date, category, coverage["guardian"])
+        )
 
-            tavily_topic, query_suffix = CATEGORY_CONFIG.get(
-                category, ("news", "breaking news")
+        # GDELT – only if anchor is in the past
+        if anchor < today:
+            tasks.append(
+                self._fetch_gdelt(start_date, end_date, category, coverage["gdelt"])
             )
-            query = f"Latest {category} news – {query_suffix}"
 
+        all_items: List[Dict] = []
+        for items in await asyncio.gather(*tasks):
+            all_items.extend(items)
+
+        notices = []
+        if anchor < today:
+            thin = [d for d in day_windows(start_date, end_date) if d not in coverage["gdelt"]]
+            if thin:
+                notices.append(
+                    f"GDELT results are partial for {len(thin)} of "
+                    f"{(end_date - start_date).days + 1} days; backfill this range "
+                    "for full coverage."
+                )
+
+        # Optional fallback: NewsDataSearch tool, only queried when every
+        # other source came back empty
+        news_tool = next(
+            (t for t in self.tools if isinstance(t, NewsDataSearch)), None
+        )
+        if news_tool is not None and not all_items:
             try:
-                tavily_resp = self.tavily.search(
-                    query=query,
-                    topic=tavily_topic,
-                    time_range=time_range,
-                    include_answer="none",
-                    max_results=35,
-                    days=days,
+                tool_output = await news_tool.arun(
+                    {
+                        "query": "latest news" if self.batch else f"latest {category} news",
+                        "days": (end_date - start_date).days + 1,
+                        "category": None if self.batch else category,
+                    }
                 )
-                tavily_results = tavily_resp.get("results", [])
+                all_items.extend(tool_output.get("results", []))
             except Exception:
-                tavily_results = []
-
-            all_items.extend(tavily_results)
-
-            # BBC headlines (always latest)
-            all_items.extend(self._fetch_bbc(category))
+                pass
+
+        # Final cleaning + de-dupe, then categories, then only what is new
+        # (dedupe may read cached pages for their canonical links)
+        articles = await asyncio.to_thread(self._dedupe_and_clamp_dates, all_items)
+        articles = self._classify(articles)
+        if self.incremental:
+            articles = await asyncio.to_thread(self._only_new, articles)
+        return {
+            "frequency": frequency,
+            "selected_date": anchor.isoformat(),
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "news_data": articles,
+            "new_articles": articles,
+            "coverage": {
+                source: {
+                    day.isoformat(): until.replace(tzinfo=timezone.utc).isoformat()
+                    for day, until in days.items()
+                }
+                for source, days in coverage.items()
+            },
+            "notices": notices,
+        }
 
-        # Guardian (works for both latest + archive)
-        all_items.extend(self._fetch_guardian(start_date, end_date, category))
+    def fetch_news(self, state: NewsState) -> dict:
+        """Sync shim around ``afetch_news`` for ``graph.invoke``."""
+        return run_sync(self.afetch_news(state))
 
-        # GDELT – only if anchor is in the past
-        if anchor < today:
-            all_items.extend(self._fetch_gdelt(start_date, end_date, category))
+    # ------------------------------------------------------------------
+    # 2) RANK STORIES + FETCH ARTICLE PAGES
+    # ------------------------------------------------------------------
+    async def afetch_articles(self, state: NewsState) -> dict:
+        """
+        Rank the fetched stories (near-duplicates collapse into one) and
+        download the pages of the top K per day, so their summaries are
+        built from the article body rather than the feed teaser. Pages
+        are cached, so the UI cards reuse the same fetch for media.
+        """
+        news_items = state.get("news_data") or []
+        ranked = rank_articles(news_items)
+        for score, art in ranked:
+            art.score = score
+
+        if self.fetch_pages and ranked:
+            wanted, _ = select_top_k(ranked, self.top_k, self.categories)
+            pages = await afetch_articles([a.url for a in wanted])
+            resolved: Dict[int, Tuple[str, ...]] = {}
+            for art in wanted:
+                page = pages.get(art.url)
+                if page is not None:
+                    # Keep what the feed provided when the page yields nothing.
+                    art.text = page.text or art.text
+                    art.image = page.image or art.image
+                    if page.canonical:
+                        key = await asyncio.to_thread(learn, art.url, page.canonical, self.store)
+                        resolved[id(art)] = (key or art.key, canonical_url(page.canonical))
+
+            # Pages whose canonical link names another ranked story (or
+            # the same page as another one) are copies of it: merge them
+            # rather than summarise twice.
+            kept: Dict[str, Article] = {}
+            deduped = []
+            for score, art in ranked:
+                keys = {art.key, *resolved.get(id(art), ())}
+                original = next((kept[k] for k in keys if k in kept), None)
+                if original is not None:
+                    original.categories += tuple(
+                        c for c in art.categories if c not in original.categories
+                    )
+                    continue
+                kept.update(dict.fromkeys(keys, art))
+                deduped.append((score, art))
+            ranked = deduped
 
-        # Optional fallback: NewsDataSearch tool
-        if not all_items:
-            news_tool = next(
-                (t for t in self.tools if isinstance(t, NewsDataSearch)), None
-            )
-            if news_tool is not None:
-                try:
-                    tool_output = news_tool.run(f"latest {category} news")
-                    all_items.extend(tool_output.get("results", []))
-                except Exception:
-                    pass
+        return {"news_data": [art for _, art in ranked]}
 
-        # Final cleaning + de-dupe
-        clean_results = self._dedupe_and_clamp_dates(all_items)
-        self.state["news_data"] = clean_results
-        state["news_data"] = clean_results
-        return state
+    def fetch_articles(self, state: NewsState) -> dict:
+        """Sync shim around ``afetch_articles`` for ``graph.invoke``."""
+        return run_sync(self.afetch_articles(state))
 
     # ------------------------------------------------------------------
-    # 2) SUMMARISE ARTICLES  (STRICT, LOW HALLUCINATION)
+    # 3) SUMMARISE ARTICLES  (STRICT, LOW HALLUCINATION)
     # ------------------------------------------------------------------
-    def _build_articles_string(self, news_items: List[Dict]) -> str:
+    def _build_articles_string(self, news_items: List[Article]) -> str:
         """
         Turn article list into a compact text block for the LLM.
         """
         blocks = []
         for idx, item in enumerate(news_items, start=1):
-            title = item.get("title") or ""
-            desc = (
-                item.get("description")
-                or item.get("content")
-                or item.get("snippet")
-                or ""
-            )
-            url = item.get("__url") or item.get("url") or item.get("link")
-            pub = item.get("__pub_date_only") or ""
+            title = item.title
+            desc = " ".join((item.text or item.description).split()[:LLM_TEXT_WORDS])
+            url = item.url
+            pub = item.published
             if not title or not url:
                 continue
 
@@ -469,7 +733,38 @@ class NewsNode:
             )
         return "\n".join(blocks)
 
-    def _run_summariser(self, articles_block: str) -> List[Dict]:
+    def _prompt_chunks(self, news_items: List[Article]) -> List[List[Article]]:
+        """Split ``news_items`` into runs of at most ``LLM_PROMPT_WORDS`` input words."""
+        chunks: List[List[Article]] = []
+        words = 0
+        for item in news_items:
+            size = len(item.title.split()) + min(
+                len((item.text or item.description).split()), LLM_TEXT_WORDS
+            )
+            if not chunks or words + size > LLM_PROMPT_WORDS:
+                chunks.append([])
+                words = 0
+            chunks[-1].append(item)
+            words += size
+        return chunks
+
+    async def _summarise_top(self, news_items: List[Article]) -> List[Dict]:
+        """LLM summaries of ``news_items``, one call per prompt chunk."""
+        slots = asyncio.Semaphore(max(LLM_CONCURRENCY, 1))
+
+        async def one(chunk: List[Article]) -> List[Dict]:
+            async with slots:
+                return await self._run_summariser(self._build_articles_string(chunk))
+
+        results = await asyncio.gather(*(one(c) for c in self._prompt_chunks(news_items)))
+        # One summary per URL, even if the LLM repeats one across calls.
+        merged: Dict[str, Dict] = {}
+        for items in results:
+            for item in items:
+                merged.setdefault(item["url"], item)
+        return list(merged.values())
+
+    async def _run_summariser(self, articles_block: str) -> List[Dict]:
         """
         Call LLM and ask for strict structured summaries.
 
@@ -510,7 +805,7 @@ Rules:
         )
 
         try:
-            response = self.llm.invoke(prompt.format(articles=articles_block))
+            response = await self.llm.ainvoke(prompt.format(articles=articles_block))
             raw = getattr(response, "content", str(response))
         except Exception:
             # If LLM call fails (e.g., org restricted), we fall back later.
@@ -544,63 +839,55 @@ Rules:
 
         return summaries
 
-    def summarize_news(self, state: dict) -> dict:
+    def _extractive_summaries(self, news_items: List[Article]) -> List[Dict]:
         """
-        Summarise fetched news into markdown understood by the UI.
+        Local extractive summaries of the article text, used for stories
+        the LLM does not see and those it leaves out or cuts off.
         """
-        news_items = self.state.get("news_data", [])
-        if not news_items:
-            msg = "# No news found\n(No articles returned for this category and time range.)\n"
-            self.state["summary"] = msg
-            state["summary"] = msg
-            return state
-
-        # 1) Try strict LLM summariser
-        articles_block = self._build_articles_string(news_items)
-        structured = self._run_summariser(articles_block)
-
-        # 2) Fallback using descriptions directly
-        if not structured:
-            fallback: List[Dict] = []
-            seen_urls: set[str] = set()
-
-            for item in news_items:
-                url = item.get("__url") or item.get("url") or item.get("link")
-                if not url or url in seen_urls:
-                    continue
-                seen_urls.add(url)
+        fallback: List[Dict] = []
+        seen_urls: set[str] = set()
 
-                d = item.get("__pub_date_only") or date.today().isoformat()
-                title = item.get("title") or "News"
+        for item in news_items:
+            url = item.url
+            if not url or url in seen_urls:
+                continue
+            seen_urls.add(url)
 
-                text = (
-                    item.get("description")
-                    or item.get("content")
-                    or item.get("snippet")
-                    or ""
-                )
+            d = item.published or date.today().isoformat()
+            title = item.title or "News"
 
-                if not text:
-                    summary = (
-                        "Source did not provide article text. "
-                        "Open the full story to read more."
-                    )
-                else:
-                    words = text.split()
-                    summary = " ".join(words[:150])
+            text = item.text or item.description
+            if text.startswith(("http://", "https://")):
+                # GDELT only gives the source URL
+                text = ""
 
-                fallback.append(
-                    {
-                        "date": d,
-                        "title": title,
-                        "summary": summary,
-                        "url": url,
-                    }
+            summary = extractive_summary(text)
+            if not summary:
+                summary = (
+                    "Source did not provide article text. "
+                    "Open the full story to read more."
                 )
 
-            structured = fallback
+            fallback.append(
+                {
+                    "date": d,
+                    "title": title,
+                    "summary": summary,
+                    "url": url,
+                }
+            )
+        return fallback
+
+    def _unmatched(self, articles: List[Article], summaries: List[Dict]) -> List[Article]:
+        """``articles`` none of ``summaries`` refers to (by URL or its key)."""
+        urls = {item["url"] for item in summaries}
+        keys = {
+            self._normalize_url(url) for url in urls - {a.url for a in articles}
+        }
+        return [a for a in articles if a.url not in urls and a.key not in keys]
 
-        # 3) Group by date → markdown
+    def _to_markdown(self, structured: Iterable[Dict]) -> str:
+        """Group summaries by date → markdown understood by the UI."""
         grouped: dict[str, List[Dict]] = defaultdict(list)
         for item in structured:
             d = item.get("date") or date.today().isoformat()
@@ -616,33 +903,144 @@ Rules:
                 lines.append(f"- **{title}**: {summary} [Read full story]({url})")
             lines.append("")
 
-        summary_md = "\n".join(lines).strip()
-        self.state["summary"] = summary_md
-        state["summary"] = summary_md
-        return state
+        return "\n".join(lines).strip()
+
+    def _stored_summaries(self, state: NewsState) -> List[Dict]:
+        """Summaries earlier runs stored for this run's range (incremental runs)."""
+        if not self.incremental or not state.get("start_date") or not state.get("end_date"):
+            return []
+        try:
+            return (self.store or get_store()).summary_items(
+                self.categories,
+                date.fromisoformat(state["start_date"]),
+                date.fromisoformat(state["end_date"]),
+            )
+        except Exception as e:
+            print(f"Stored summaries unavailable: {e}")
+            return []
+
+    async def asummarize_news(self, state: NewsState) -> dict:
+        """
+        Summarise fetched news into markdown understood by the UI, one
+        document per category. All categories share a single LLM pass
+        over the top-ranked stories.
+        """
+        news_items = state.get("news_data") or []
+        previous = await asyncio.to_thread(self._stored_summaries, state)
+        msg = "# No news found\n(No articles returned for this category and time range.)\n"
+        if not news_items and not previous:
+            return {"summaries": {cat: msg for cat in self.categories}}
+
+        # 1) Pick the stories the LLM summarises (``news_data`` arrives
+        #    ranked from ``afetch_articles``)
+        ranked = [(art.score, art) for art in news_items]
+        if self.summary_mode == "fast":
+            top, rest = [], [art for _, art in ranked]
+        elif self.summary_mode == "llm":
+            top, rest = [art for _, art in ranked], []
+        else:
+            top, rest = select_top_k(ranked, self.top_k, self.categories)
+
+        # 2) Try strict LLM summariser; top stories it skipped or cut off
+        #    get an extractive summary instead of disappearing
+        structured: List[Dict] = []
+        if top:
+            structured = await self._summarise_top(top)
+            structured += self._extractive_summaries(self._unmatched(top, structured))
+
+        # 3) Everything else gets a local extractive summary
+        structured += self._extractive_summaries(rest)
+
+        # 4) Route each summary to the categories of its article
+        # (a single-category run keeps summaries whose URL the LLM altered).
+        categories_by_key = {a.key: a.categories for a in news_items}
+        scores = {a.key: a.score for a in news_items}
+        key_by_url = {a.url: a.key for a in news_items}
+        unmatched = () if self.batch else self.categories
+        per_category: Dict[str, List[Dict]] = defaultdict(list)
+        for item in structured:
+            key = item["key"] = key_by_url.get(item["url"]) or self._normalize_url(item["url"])
+            item["score"] = scores.get(key, 0.0)
+            for cat in categories_by_key.get(key) or unmatched:
+                per_category[cat].append(item)
+
+        # 5) Earlier runs' summaries complete the range
+        fresh = {item["key"] for item in structured}
+        for item in previous:
+            if item["key"] in fresh:
+                continue
+            for cat in item["categories"]:
+                if cat in self.categories:
+                    per_category[cat].append(item)
+        for items in per_category.values():
+            items.sort(key=lambda i: -i.get("score", 0.0))
+
+        return {
+            "summaries": {
+                cat: self._to_markdown(per_category[cat]) or msg
+                for cat in self.categories
+            },
+            "summary_items": structured,
+        }
+
+    def summarize_news(self, state: NewsState) -> dict:
+        """Sync shim around ``asummarize_news`` for ``graph.invoke``."""
+        return run_sync(self.asummarize_news(state))
 
     # ------------------------------------------------------------------
-    # 3) SAVE SUMMARY FILE
+    # 4) SAVE SUMMARY FILES + ARTICLE STORE
     # ------------------------------------------------------------------
-    def save_result(self, state: State, config=None):
-        frequency = self.state.get("frequency", "daily")
-        summary = self.state.get("summary", "")
-
-        if not summary:
-            self.state["filename"] = None
-            return self.state
-
-        filename = f"./News/{frequency}_summary.md"
-        heading = {
-            "daily": "Today News Summary",
-            "weekly": "Weekly News Summary",
-            "monthly": "Monthly News Summary",
-        }.get(frequency, "Daily News Summary")
-
-        os.makedirs("./News", exist_ok=True)
+    def _write_summary(self, filename: str, heading: str, summary: str) -> None:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
         with open(filename, "w", encoding="utf-8") as f:
             f.write(f"# {heading}\n\n")
             f.write(summary)
 
-        self.state["filename"] = filename
-        return self.state
+    def _store_articles(self, state: NewsState) -> None:
+        items = state.get("summary_items") or []
+        try:
+            store = self.store or get_store()
+            store.save(
+                state.get("news_data") or [],
+                {item["key"]: item for item in items if item.get("key")},
+            )
+            # Every fetched article, including ranking's merged duplicates.
+            fetched = state.get("new_articles") or state.get("news_data") or []
+            store.advance(fetched)
+            for source, days in (state.get("coverage") or {}).items():
+                store.cover_days(source, self.categories, days)
+            index = get_seen_index(store)
+            index.add(a.key for a in fetched)
+            index.flush()
+        except Exception as e:
+            # The store is a cache of past runs; never fail the run over it.
+            print(f"Article store not updated: {e}")
+
+    async def asave_result(self, state: NewsState, config=None) -> dict:
+        """
+        Write one summary file per category and keep the run's articles
+        and summaries in the article store.
+        """
+        frequency = state.get("frequency") or "daily"
+        summaries = state.get("summaries") or {}
+        heading = SUMMARY_HEADINGS.get(frequency, "Daily News Summary")
+
+        filenames = {}
+        if self.write_files:
+            filenames = {
+                cat: summary_path(frequency, cat)
+                for cat, summary in summaries.items()
+                if summary
+            }
+        await asyncio.gather(
+            asyncio.to_thread(self._store_articles, state),
+            *(
+                asyncio.to_thread(self._write_summary, path, heading, summaries[cat])
+                for cat, path in filenames.items()
+            ),
+        )
+        return {"filenames": filenames}
+
+    def save_result(self, state: NewsState, config=None) -> dict:
+        """Sync shim around ``asave_result`` for ``graph.invoke``."""
+        return run_sync(self.asave_result(state, config))
@@ -1,11 +1,57 @@
+from dataclasses import dataclass
 from typing_extensions import TypedDict,List
 from langgraph.graph.message import add_messages
 from pydantic import BaseModel, Field
-from typing import Annotated
+from typing import Annotated, Dict, Optional, Tuple
 
 
 class State(TypedDict):
     """
     Represent the structure of the state used in graph
     """
-    messages: Annotated[List, Field(metadata={"add_messages": add_messages})]
\ No newline at end of file
+    messages: Annotated[List, add_messages]
+
+
+@dataclass(slots=True)
+class Article:
+    """
+    One cleaned, de-duplicated article flowing through the News graph.
+
+    ``url`` is the link as the source returned it, ``key`` its normalised
+    form used for de-duplication, and ``published`` the publication day
+    as ``YYYY-MM-DD`` (never in the future), with ``published_at`` the
+    full UTC timestamp when the source gave one. ``categories`` lists every
+    UI category the article belongs to, ``score`` its importance rank
+    score, and ``text`` / ``image`` what the article-fetch stage pulled
+    from the page itself.
+    """
+    title: str
+    url: str
+    key: str
+    published: str
+    description: str = ""
+    source: str = ""
+    categories: Tuple[str, ...] = ()
+    score: float = 0.0
+    text: str = ""
+    image: Optional[str] = None
+    published_at: str = ""
+
+
+class NewsState(State, total=False):
+    """
+    State of the News graph. Every node reads its inputs from here and
+    returns only the keys it produces, so one compiled graph can serve
+    concurrent runs.
+    """
+    frequency: str
+    selected_date: str
+    start_date: str
+    end_date: str
+    news_data: List[Article]
+    new_articles: List[Article]
+    coverage: Dict[str, Dict[str, str]]
+    notices: List[str]
+    summaries: Dict[str, str]
+    summary_items: List[Dict]
+    filenames: Dict[str, str]
@@ -0,0 +1,43 @@
+"""
+Helpers for calling async code from the synchronous parts of the app
+(Streamlit scripts, sync graph nodes, command-line entry points).
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable
+
+from src.LangGraph.tools import http_pool
+
+
+async def _closing(awaitable: Awaitable) -> Any:
+    try:
+        return await awaitable
+    finally:
+        # The loop is about to go away and its connections with it.
+        await http_pool.aclose_async_client()
+
+
+def run(awaitable: Awaitable) -> Any:
+    """
+    ``asyncio.run`` that also closes the loop's pooled HTTP client, so
+    short-lived loops do not leak clients and their sockets.
+    """
+    return asyncio.run(_closing(awaitable))
+
+
+def run_sync(awaitable: Awaitable) -> Any:
+    """
+    Run ``awaitable`` to completion and return its result.
+
+    Uses ``run`` when the current thread has no running loop (the
+    Streamlit script thread, plain scripts). If a loop is already
+    running, the coroutine is executed on a fresh loop in a worker thread
+    so the caller's loop is never re-entered.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return run(awaitable)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(run, awaitable).result()
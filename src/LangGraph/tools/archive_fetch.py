@@ -0,0 +1,312 @@
+"""
+Archive fetching for Guardian and GDELT with even coverage over a range.
+
+A date range is split into one window per day, and every day gets its
+own quota (``ARCHIVE_PER_DAY``), so a monthly range is no longer
+dominated by its newest days:
+
+  - Guardian: page 1 of each day tells how many pages exist; only the
+    pages still needed for the quota are then fetched, concurrently.
+  - GDELT (no paging, newest first): a day whose query comes back full
+    is split adaptively, keeping the later half's results and querying
+    the earlier half with the rest of the quota, down to
+    ``GDELT_MIN_WINDOW``.
+
+Every request waits on a per-provider rate limiter. The limiters are
+process-wide and loop-agnostic, so concurrent runs share the budget.
+Throttled (429) and failed requests are retried with backoff and
+reported when they give up, so a lost window is never silently read as
+a day without news.
+
+Callers can pass ``since`` (per day, the time it was already fetched
+through) to skip finished days, and collect ``covered`` (per day, the
+time it is fetched through after this call) for days skipped or fully
+fetched. ``covered`` stops ``ARCHIVE_LAG`` short of now, since the
+providers index recent articles with a delay.
+
+At ``GDELT_RATE`` a month of day windows takes minutes, so interactive
+callers cap the number of GDELT requests with ``max_windows``: the days
+are then merged into that many coarse windows, one request each, which
+are neither split nor counted as covered.
+"""
+import asyncio
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from src.LangGraph.tools import http_pool
+
+ARCHIVE_PER_DAY = int(os.getenv("ARCHIVE_PER_DAY", "20"))
+ARCHIVE_CONCURRENCY = int(os.getenv("ARCHIVE_CONCURRENCY", "6"))
+# Extra attempts for throttled / failed requests, and the first backoff.
+ARCHIVE_RETRIES = int(os.getenv("ARCHIVE_RETRIES", "2"))
+ARCHIVE_BACKOFF = float(os.getenv("ARCHIVE_BACKOFF", "5"))
+# Articles younger than this may not be indexed yet; never count them covered.
+ARCHIVE_LAG = timedelta(minutes=int(os.getenv("ARCHIVE_LAG_MINUTES", "30")))
+
+GUARDIAN_URL = "https://content.guardianapis.com/search"
+GUARDIAN_PAGE_SIZE = 50
+# Developer keys allow 12 calls/second.
+GUARDIAN_RATE = float(os.getenv("GUARDIAN_RATE", "10"))
+
+GDELT_URL = "http://api.gdeltproject.org/api/v2/doc/doc"
+GDELT_MAX_RECORDS = 250
+# GDELT asks for at most one request every 5 seconds.
+GDELT_RATE = float(os.getenv("GDELT_RATE", "0.2"))
+GDELT_MIN_WINDOW = timedelta(hours=3)
+# GDELT requests per interactive run (about 30 s at the default rate).
+GDELT_INTERACTIVE_WINDOWS = int(os.getenv("GDELT_INTERACTIVE_WINDOWS", "6"))
+
+
+class RateLimiter:
+    """
+    Spaces request starts at least ``1 / rate`` seconds apart. Slots are
+    reserved under a thread lock and awaited with ``asyncio.sleep``, so
+    one limiter works across event loops and threads.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+GUARDIAN_LIMITER = RateLimiter(GUARDIAN_RATE)
+GDELT_LIMITER = RateLimiter(GDELT_RATE)
+
+
+def day_windows(start: date, end: date) -> List[date]:
+    """Every day from ``start`` to ``end`` inclusive, newest first."""
+    days = (end - start).days
+    return [end - timedelta(days=i) for i in range(days + 1)]
+
+
+def _day_bounds(day: date) -> Tuple[datetime, datetime]:
+    """First and last second of ``day`` (naive UTC)."""
+    start = datetime.combine(day, datetime.min.time())
+    return start, start + timedelta(days=1, seconds=-1)
+
+
+def _covered_until(day: date) -> datetime:
+    """How far a complete fetch of ``day`` made right now reaches."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return min(now - ARCHIVE_LAG, _day_bounds(day)[1])
+
+
+def _retry_after(resp: httpx.Response, default: float) -> float:
+    try:
+        return max(float(resp.headers.get("Retry-After", default)), 0.0)
+    except ValueError:
+        return default
+
+
+async def _get_json(url: str, params: Dict, limiter: RateLimiter,
+                    slots: asyncio.Semaphore, timeout: float) -> Optional[Dict]:
+    """
+    JSON body of a GET, or None once every attempt failed. 429 / 5xx
+    answers and network errors are retried after a backoff (the server's
+    ``Retry-After`` when it sends one); other errors are not.
+    """
+    backoff = ARCHIVE_BACKOFF
+    for attempt in range(ARCHIVE_RETRIES + 1):
+        async with slots:
+            await limiter.wait()
+            try:
+                resp = await http_pool.aget(url, params=params, timeout=timeout)
+                error = None
+            except httpx.HTTPError as e:
+                resp, error = None, e
+        if resp is not None:
+            if resp.status_code == 429 or resp.status_code >= 500:
+                error = f"HTTP {resp.status_code}"
+                backoff = _retry_after(resp, backoff)
+            elif resp.is_error:
+                print(f"Archive request failed ({url}, HTTP {resp.status_code}); skipping window")
+                return None
+            else:
+                try:
+                    return resp.json()
+                except ValueError:
+                    error = "invalid JSON"
+        if attempt < ARCHIVE_RETRIES:
+            await asyncio.sleep(backoff)
+            backoff *= 2
+    print(f"Archive request failed ({url}, {error}) after {ARCHIVE_RETRIES + 1} attempts; skipping window")
+    return None
+
+
+# ----------------------------------------------------------------------
+# GUARDIAN
+# ----------------------------------------------------------------------
+async def _guardian_day(day: date, params: Dict, quota: int,
+                        slots: asyncio.Semaphore) -> Tuple[List[Dict], bool]:
+    """A day's results and whether every request for them succeeded."""
+    page_size = min(quota, GUARDIAN_PAGE_SIZE)
+    base = dict(params, **{
+        "from-date": day.isoformat(),
+        "to-date": day.isoformat(),
+        "page-size": page_size,
+    })
+
+    first = await _get_json(GUARDIAN_URL, dict(base, page=1), GUARDIAN_LIMITER, slots, 8)
+    if not first:
+        return [], False
+    response = first.get("response", {})
+    results = list(response.get("results", []))
+    if len(results) >= quota:
+        return results[:quota], True
+
+    # Only the pages still needed for the quota, all at once.
+    needed = -(-(quota - len(results)) // page_size)
+    last_page = min(int(response.get("pages") or 1), 1 + needed)
+    more = await asyncio.gather(*(
+        _get_json(GUARDIAN_URL, dict(base, page=p), GUARDIAN_LIMITER, slots, 8)
+        for p in range(2, last_page + 1)
+    ))
+    for data in more:
+        if data:
+            results.extend(data.get("response", {}).get("results", []))
+    return results[:quota], all(more)
+
+
+async def fetch_guardian_archive(params: Dict, start: date, end: date,
+                                 per_day: int = ARCHIVE_PER_DAY,
+                                 since: Optional[Dict[date, datetime]] = None,
+                                 covered: Optional[Dict[date, datetime]] = None) -> List[Dict]:
+    """
+    Guardian search results for every day in ``start``..``end`` (at most
+    ``per_day`` each). ``params`` carries the api key, section, query etc.
+
+    The API filters by whole days, so a day in ``since`` is skipped once
+    it was fetched through its end and otherwise fetched again in full.
+    """
+    since = since or {}
+    days = [
+        day for day in day_windows(start, end)
+        if since.get(day, datetime.min) < _day_bounds(day)[1]
+    ]
+    slots = asyncio.Semaphore(ARCHIVE_CONCURRENCY)
+    fetched = await asyncio.gather(*(
+        _guardian_day(day, params, per_day, slots) for day in days
+    ))
+    if covered is not None:
+        covered.update((day, done) for day, done in since.items() if start <= day <= end)
+        covered.update(
+            (day, _covered_until(day)) for day, (_, ok) in zip(days, fetched) if ok
+        )
+    return [r for results, _ in fetched for r in results]
+
+
+# ----------------------------------------------------------------------
+# GDELT
+# ----------------------------------------------------------------------
+def _gdelt_time(dt: datetime) -> str:
+    return dt.strftime("%Y%m%d%H%M%S")
+
+
+def _seen_at(article: Dict) -> Optional[datetime]:
+    try:
+        return datetime.strptime(article.get("seendate", ""), "%Y%m%dT%H%M%SZ")
+    except ValueError:
+        return None
+
+
+async def _gdelt_window(params: Dict, start: datetime, end: datetime,
+                        quota: int, slots: asyncio.Semaphore) -> Tuple[List[Dict], bool]:
+    """A window's articles and whether every request for them succeeded."""
+    query = dict(params, **{
+        "startdatetime": _gdelt_time(start),
+        "enddatetime": _gdelt_time(end),
+        "maxrecords": min(quota, GDELT_MAX_RECORDS),
+    })
+    data = await _get_json(GDELT_URL, query, GDELT_LIMITER, slots, 10)
+    if data is None:
+        return [], False
+    articles = data.get("articles", [])
+    if len(articles) < quota or end - start <= GDELT_MIN_WINDOW:
+        return articles[:quota], True
+
+    # Saturated: results are newest-first, so they all sit late in the
+    # window. Keep the later half's share and fill from the earlier half.
+    mid = start + (end - start) / 2
+    later = [a for a in articles if (_seen_at(a) or end) >= mid][: quota // 2]
+    earlier, ok = await _gdelt_window(
+        params, start, mid - timedelta(seconds=1), quota - len(later), slots
+    )
+    return later + earlier, ok
+
+
+async def fetch_gdelt_archive(params: Dict, start: date, end: date,
+                              per_day: int = ARCHIVE_PER_DAY,
+                              since: Optional[Dict[date, datetime]] = None,
+                              covered: Optional[Dict[date, datetime]] = None,
+                              max_windows: Optional[int] = None) -> List[Dict]:
+    """
+    GDELT ArtList articles for every day in ``start``..``end`` (at most
+    ``per_day`` each). ``params`` carries query, mode, format and sort.
+
+    GDELT filters by time, so a day in ``since`` only asks for what came
+    after the time it was fetched through, and is skipped once that
+    reaches its end. With ``max_windows`` and more days left than that,
+    the days are fetched in that many coarse windows instead.
+    """
+    since = since or {}
+    windows = []
+    for day in day_windows(start, end):
+        day_start, day_end = _day_bounds(day)
+        done = since.get(day)
+        if done is not None:
+            if done >= day_end:
+                continue
+            day_start = max(day_start, done + timedelta(seconds=1))
+        windows.append((day, day_start, day_end))
+    slots = asyncio.Semaphore(ARCHIVE_CONCURRENCY)
+    if covered is not None:
+        covered.update((day, done) for day, done in since.items() if start <= day <= end)
+
+    if max_windows and len(windows) > max_windows:
+        return await _gdelt_coarse(params, windows, per_day, max_windows, slots)
+
+    fetched = await asyncio.gather(*(
+        _gdelt_window(params, s, e, per_day, slots) for _, s, e in windows
+    ))
+    if covered is not None:
+        covered.update(
+            (day, _covered_until(day)) for (day, _, _), (_, ok) in zip(windows, fetched) if ok
+        )
+    return [a for articles, _ in fetched for a in articles]
+
+
+async def _gdelt_coarse(params: Dict, windows: List[Tuple[date, datetime, datetime]],
+                        per_day: int, count: int, slots: asyncio.Semaphore) -> List[Dict]:
+    """
+    One request per run of consecutive day windows, ``count`` runs in
+    all. Results are GDELT's newest in each run, capped at
+    ``GDELT_MAX_RECORDS``, so older days of a run may come back thin.
+    """
+    size = -(-len(windows) // count)
+    groups = [windows[i:i + size] for i in range(0, len(windows), size)]
+    fetched = await asyncio.gather(*(
+        _get_json(GDELT_URL, dict(params, **{
+            # Windows are newest first.
+            "startdatetime": _gdelt_time(group[-1][1]),
+            "enddatetime": _gdelt_time(group[0][2]),
+            "maxrecords": min(per_day * len(group), GDELT_MAX_RECORDS),
+        }), GDELT_LIMITER, slots, 10)
+        for group in groups
+    ))
+    return [a for data in fetched if data for a in data.get("articles", [])]
@@ -0,0 +1,285 @@
+"""
+Shared article-page fetch + extraction.
+
+Each article page is downloaded once and turned into an ``ArticlePage``
+holding both the readable main text (for summarisation) and the media
+metadata (for the UI cards). Results are cached in memory and on disk,
+so the summariser and the renderer reuse one fetch. Failed fetches are
+cached too, but only for ``FAILURE_TTL``, so a transient error does not
+hide an article's text for a whole day.
+
+Batch downloads run with a global concurrency bound plus a per-host
+limit and a minimum interval between requests to one host.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin, urlparse
+
+from src.LangGraph.tools import http_pool
+
+# Optional: HTML parsing
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+CACHE_DIR = os.getenv("ARTICLE_CACHE_DIR", os.path.join(".cache", "articles"))
+CACHE_TTL = int(os.getenv("ARTICLE_CACHE_TTL", str(24 * 3600)))
+FAILURE_TTL = int(os.getenv("ARTICLE_FAILURE_TTL", str(10 * 60)))
+MEMORY_CACHE_SIZE = 1024
+
+MAX_CONCURRENCY = int(os.getenv("ARTICLE_FETCH_CONCURRENCY", "8"))
+PER_HOST_CONCURRENCY = int(os.getenv("ARTICLE_FETCH_PER_HOST", "4"))
+# Seconds between two request starts to the same host.
+HOST_INTERVAL = float(os.getenv("ARTICLE_HOST_INTERVAL", "0.5"))
+FETCH_TIMEOUT = 6
+
+# Blocks that never hold the article body.
+_BOILERPLATE_TAGS = [
+    "script", "style", "noscript", "nav", "header", "footer", "aside",
+    "form", "iframe", "svg", "button", "figure",
+]
+MIN_PARAGRAPH_CHARS = 40
+
+
+@dataclass(slots=True)
+class ArticlePage:
+    """Main text and media of one article page."""
+    url: str
+    text: str = ""
+    image: Optional[str] = None
+    video: Optional[str] = None
+    canonical: Optional[str] = None
+    fetched_at: float = 0.0
+    failed: bool = False
+
+
+# ----------------------------------------------------------------------
+# EXTRACTION
+# ----------------------------------------------------------------------
+def _meta(soup, keys) -> Optional[str]:
+    for attr, key in keys:
+        tag = soup.find("meta", attrs={attr: key})
+        if tag and tag.get("content"):
+            return tag["content"]
+    return None
+
+
+def _main_text(soup) -> str:
+    """
+    Readability-style body extraction: score every element that directly
+    holds paragraphs by the length of its paragraph text, penalised by
+    link density, and keep the paragraphs of the best one.
+    """
+    for tag in soup(_BOILERPLATE_TAGS):
+        tag.decompose()
+
+    scores: Dict[int, float] = {}
+    parents: Dict[int, object] = {}
+    for p in soup.find_all("p"):
+        text = p.get_text(" ", strip=True)
+        if len(text) < MIN_PARAGRAPH_CHARS:
+            continue
+        parent = p.parent
+        if parent is None:
+            continue
+        link_chars = sum(len(a.get_text(strip=True)) for a in p.find_all("a"))
+        score = (len(text) + 25 * text.count(",")) * (1 - link_chars / len(text))
+        scores[id(parent)] = scores.get(id(parent), 0.0) + score
+        parents[id(parent)] = parent
+
+    if not scores:
+        return ""
+    best = parents[max(scores, key=scores.get)]
+    paragraphs = [
+        p.get_text(" ", strip=True)
+        for p in best.find_all("p")
+        if len(p.get_text(strip=True)) >= MIN_PARAGRAPH_CHARS
+    ]
+    return "\n\n".join(paragraphs)
+
+
+def extract(html: str, url: str) -> ArticlePage:
+    """Parse an article page into text + media metadata."""
+    page = ArticlePage(url=url, fetched_at=time.time())
+    if not html or BeautifulSoup is None:
+        return page
+    try:
+        soup = BeautifulSoup(html, "html.parser")
+    except Exception:
+        return page
+
+    page.image = _meta(soup, [
+        ("property", "og:image"),
+        ("name", "og:image"),
+        ("property", "twitter:image"),
+        ("name", "twitter:image"),
+    ])
+    page.video = _meta(soup, [
+        ("property", "og:video"),
+        ("name", "og:video"),
+        ("property", "twitter:player"),
+        ("name", "twitter:player"),
+    ])
+    link = soup.find("link", rel="canonical")
+    if link and link.get("href"):
+        page.canonical = urljoin(url, link["href"])
+    page.text = _main_text(soup)
+    return page
+
+
+# ----------------------------------------------------------------------
+# CACHE (memory LRU + disk)
+# ----------------------------------------------------------------------
+_memory: "OrderedDict[str, ArticlePage]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def _cache_file(url: str) -> str:
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, digest[:2], f"{digest}.json")
+
+
+def _fresh(page: ArticlePage) -> bool:
+    ttl = FAILURE_TTL if page.failed else CACHE_TTL
+    return time.time() - page.fetched_at < ttl
+
+
+def cached(url: str) -> Optional[ArticlePage]:
+    """Cached page for ``url`` (memory first, then disk), if still fresh."""
+    with _memory_lock:
+        page = _memory.get(url)
+        if page is not None:
+            _memory.move_to_end(url)
+    if page is not None and _fresh(page):
+        return page
+
+    try:
+        with open(_cache_file(url), "r", encoding="utf-8") as f:
+            page = ArticlePage(**json.load(f))
+    except Exception:
+        return None
+    if not _fresh(page):
+        return None
+    _remember(page)
+    return page
+
+
+def _remember(page: ArticlePage) -> None:
+    with _memory_lock:
+        _memory[page.url] = page
+        _memory.move_to_end(page.url)
+        while len(_memory) > MEMORY_CACHE_SIZE:
+            _memory.popitem(last=False)
+
+
+def store(page: ArticlePage) -> None:
+    """Put ``page`` in both caches."""
+    _remember(page)
+    path = _cache_file(page.url)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(page), f)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
+# ----------------------------------------------------------------------
+# FETCH
+# ----------------------------------------------------------------------
+def fetch_article(url: str) -> ArticlePage:
+    """Fetch one page through the sync pool (cached)."""
+    page = cached(url)
+    if page is not None:
+        return page
+    try:
+        resp = http_pool.get(url, timeout=FETCH_TIMEOUT)
+        resp.raise_for_status()
+        page = extract(resp.text, url)
+    except Exception:
+        # Remember failures briefly, so a dead link is not retried every rerun.
+        page = ArticlePage(url=url, fetched_at=time.time(), failed=True)
+    store(page)
+    return page
+
+
+class _HostGate:
+    """Per-host concurrency limit plus minimum interval between requests."""
+
+    def __init__(self, limit: int, interval: float):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.interval = interval
+        self.lock = asyncio.Lock()
+        self.next_start = 0.0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        if self.interval > 0:
+            async with self.lock:
+                loop = asyncio.get_running_loop()
+                wait = self.next_start - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self.next_start = loop.time() + self.interval
+        return self
+
+    async def __aexit__(self, *exc):
+        self.semaphore.release()
+
+
+async def afetch_articles(
+    urls: Iterable[str],
+    concurrency: int = MAX_CONCURRENCY,
+    per_host: int = PER_HOST_CONCURRENCY,
+    host_interval: Optional[float] = None,
+) -> Dict[str, ArticlePage]:
+    """
+    Fetch and extract many pages concurrently; each URL is downloaded at
+    most once and cached pages are not downloaded at all. Requests to
+    one host start ``host_interval`` seconds apart (``HOST_INTERVAL`` by
+    default).
+    """
+    if host_interval is None:
+        host_interval = HOST_INTERVAL
+    unique = list(dict.fromkeys(u for u in urls if u))
+    # Cache lookups may hit the disk; do them all off the event loop.
+    hits = await asyncio.to_thread(lambda: {u: cached(u) for u in unique})
+    pages: Dict[str, ArticlePage] = {u: p for u, p in hits.items() if p is not None}
+    todo: List[str] = [u for u in unique if u not in pages]
+    if not todo:
+        return pages
+
+    limit = asyncio.Semaphore(max(concurrency, 1))
+    gates: Dict[str, _HostGate] = {}
+
+    async def one(url: str) -> None:
+        host = urlparse(url).netloc.lower()
+        gate = gates.setdefault(host, _HostGate(max(per_host, 1), host_interval))
+        # Wait for the host first so a busy host does not hold global slots.
+        async with gate, limit:
+            try:
+                resp = await http_pool.aget(url, timeout=FETCH_TIMEOUT)
+                resp.raise_for_status()
+                html = resp.text
+            except Exception:
+                html = None
+        # Parsing is CPU work; keep it off the event loop.
+        if html is None:
+            page = ArticlePage(url=url, fetched_at=time.time(), failed=True)
+        else:
+            page = await asyncio.to_thread(extract, html, url)
+        await asyncio.to_thread(store, page)
+        pages[url] = page
+
+    await asyncio.gather(*(one(u) for u in todo))
+    return pages
@@ -0,0 +1,515 @@
+"""
+Local SQLite store of ingested articles and their summaries.
+
+Every News run (live or backfill) saves its articles, their categories
+and summaries here, and the backfill command records which
+(day, category) pairs are complete. A fully backfilled range can then be
+served to the UI straight from disk, without any provider or LLM call.
+
+The feed poller keeps the raw items of every catalog feed here too,
+along with each feed's poll time and HTTP validators (ETag /
+Last-Modified) for conditional requests.
+
+Incremental runs keep the keys already processed per (source,
+category), so a refresh only summarises what is new and reuses stored
+summaries for the rest. Archive sources (Guardian, GDELT) also get one
+watermark per (source, category, UTC day): the time that day was fully
+fetched through, so a refresh skips finished days and only asks for
+what came after on the others.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.LangGraph.state.state import Article
+
+STORE_DB = os.getenv("NEWS_STORE_DB", "./news_store.sqlite")
+# Seen keys older than this are forgotten (day watermarks are kept).
+SEEN_RETENTION_DAYS = int(os.getenv("NEWS_SEEN_RETENTION_DAYS", "60"))
+# Keeps ``IN (...)`` lists under SQLite's bound-parameter limit.
+_IN_CHUNK = 500
+
+# Progress rows for a batch (every-category) backfill use this category.
+ALL_CATEGORIES = "all"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    key         TEXT PRIMARY KEY,
+    url         TEXT NOT NULL,
+    title       TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    source      TEXT NOT NULL DEFAULT '',
+    published   TEXT NOT NULL,
+    image       TEXT,
+    score       REAL NOT NULL DEFAULT 0,
+    headline    TEXT,
+    summary     TEXT,
+    updated_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS article_categories (
+    key       TEXT NOT NULL,
+    category  TEXT NOT NULL,
+    published TEXT NOT NULL,
+    PRIMARY KEY (key, category)
+);
+CREATE INDEX IF NOT EXISTS idx_category_day
+    ON article_categories (category, published);
+CREATE TABLE IF NOT EXISTS backfill_progress (
+    day         TEXT NOT NULL,
+    category    TEXT NOT NULL,
+    articles    INTEGER NOT NULL,
+    finished_at REAL NOT NULL,
+    PRIMARY KEY (day, category)
+);
+CREATE TABLE IF NOT EXISTS feed_state (
+    feed          TEXT PRIMARY KEY,
+    polled_at     REAL NOT NULL,
+    status        INTEGER NOT NULL DEFAULT 0,
+    etag          TEXT,
+    last_modified TEXT
+);
+CREATE TABLE IF NOT EXISTS feed_items (
+    url         TEXT NOT NULL,
+    feed        TEXT NOT NULL,
+    day         TEXT NOT NULL,
+    categories  TEXT NOT NULL,
+    item        TEXT NOT NULL,
+    fetched_at  REAL NOT NULL,
+    PRIMARY KEY (url, feed)
+);
+CREATE INDEX IF NOT EXISTS idx_feed_items_day ON feed_items (day);
+DROP TABLE IF EXISTS watermarks;
+CREATE TABLE IF NOT EXISTS day_watermarks (
+    source     TEXT NOT NULL,
+    category   TEXT NOT NULL,
+    day        TEXT NOT NULL,
+    latest     TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (source, category, day)
+);
+CREATE TABLE IF NOT EXISTS seen_articles (
+    source   TEXT NOT NULL,
+    category TEXT NOT NULL,
+    key      TEXT NOT NULL,
+    day      TEXT NOT NULL,
+    PRIMARY KEY (source, category, key)
+);
+CREATE INDEX IF NOT EXISTS idx_seen_day ON seen_articles (day);
+CREATE TABLE IF NOT EXISTS ingested (
+    key        TEXT PRIMARY KEY,
+    first_seen REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS canonical_links (
+    link TEXT PRIMARY KEY,
+    key  TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS url_keys (
+    url TEXT PRIMARY KEY,
+    key TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class ArticleStore:
+    """Thread-safe wrapper around one SQLite connection."""
+
+    def __init__(self, path: str = STORE_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------------
+    # WRITE
+    # ------------------------------------------------------------------
+    def save(self, articles: Iterable[Article], summaries: Dict[str, Dict]) -> int:
+        """
+        Upsert ``articles`` with their categories. ``summaries`` maps an
+        article key to its ``{"title", "summary"}``; an existing summary
+        is kept when the new run has none for that article.
+        """
+        now = time.time()
+        rows, cats = [], []
+        for art in articles:
+            if not art.published:
+                continue
+            summary = summaries.get(art.key) or {}
+            rows.append((
+                art.key, art.url, art.title, art.description, art.source,
+                art.published, art.image, art.score,
+                summary.get("title"), summary.get("summary"), now,
+            ))
+            cats.extend((art.key, c, art.published) for c in art.categories)
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO articles (key, url, title, description, source,
+                    published, image, score, headline, summary, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    title = excluded.title,
+                    description = excluded.description,
+                    image = COALESCE(excluded.image, articles.image),
+                    score = MAX(excluded.score, articles.score),
+                    headline = COALESCE(excluded.headline, articles.headline),
+                    summary = COALESCE(excluded.summary, articles.summary),
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO article_categories VALUES (?, ?, ?)", cats
+            )
+        return len(rows)
+
+    def mark_done(self, day: str, category: str, articles: int) -> None:
+        """Record a finished backfill of ``category`` on ``day``."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO backfill_progress VALUES (?, ?, ?, ?)",
+                (day, category, articles, time.time()),
+            )
+
+    # ------------------------------------------------------------------
+    # WATERMARKS
+    # ------------------------------------------------------------------
+    def advance(self, articles: Iterable[Article]) -> None:
+        """Mark ``articles`` as seen for their (source, category) pairs."""
+        seen = [
+            (art.source, cat, art.key, art.published)
+            for art in articles
+            for cat in art.categories
+        ]
+        cutoff = (date.today() - timedelta(days=SEEN_RETENTION_DAYS)).isoformat()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_articles VALUES (?, ?, ?, ?)", seen
+            )
+            self._conn.execute("DELETE FROM seen_articles WHERE day < ?", (cutoff,))
+
+    def cover_days(self, source: str, categories: Iterable[str], days: Dict[str, str]) -> None:
+        """
+        Move the day watermarks of ``source`` in ``categories`` up to
+        ``days`` (ISO day -> UTC time it was fetched through).
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO day_watermarks VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(source, category, day) DO UPDATE SET
+                    latest = MAX(excluded.latest, day_watermarks.latest),
+                    updated_at = excluded.updated_at
+                """,
+                [(source, cat, day, stamp, now) for cat in categories for day, stamp in days.items()],
+            )
+
+    def day_watermarks(self, source: str, categories: Iterable[str],
+                       start: date, end: date) -> Dict[str, str]:
+        """
+        Per UTC day in ``start``..``end``: the time ``source`` was fetched
+        through in all of ``categories`` (the oldest of their watermarks).
+        Days missing a watermark for any category are left out.
+        """
+        categories = list(categories)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT day, MIN(latest) AS latest, COUNT(*) AS n FROM day_watermarks "
+                f"WHERE source = ? AND day BETWEEN ? AND ? "
+                f"AND category IN ({','.join('?' * len(categories))}) GROUP BY day",
+                [source, start.isoformat(), end.isoformat(), *categories],
+            ).fetchall()
+        return {r["day"]: r["latest"] for r in rows if r["n"] == len(categories)}
+
+    def seen(self, categories: Iterable[str], keys: Iterable[str]) -> Set[Tuple[str, str, str]]:
+        """``(source, category, key)`` triples already processed among ``keys``."""
+        categories, keys = list(categories), list(dict.fromkeys(keys))
+        found: Set[Tuple[str, str, str]] = set()
+        with self._lock:
+            for i in range(0, len(keys), _IN_CHUNK):
+                chunk = keys[i:i + _IN_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT source, category, key FROM seen_articles "
+                    f"WHERE category IN ({','.join('?' * len(categories))}) "
+                    f"AND key IN ({','.join('?' * len(chunk))})",
+                    [*categories, *chunk],
+                ).fetchall()
+                found.update((r["source"], r["category"], r["key"]) for r in rows)
+        return found
+
+    def mark_ingested(self, keys: Iterable[str]) -> None:
+        """Add ``keys`` to the exact set behind ``seen_index``."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO ingested VALUES (?, ?)", [(k, now) for k in keys]
+            )
+
+    def ingested(self, keys: Iterable[str]) -> Set[str]:
+        """The subset of ``keys`` ever ingested."""
+        keys = list(keys)
+        found: Set[str] = set()
+        with self._lock:
+            for i in range(0, len(keys), _IN_CHUNK):
+                chunk = keys[i:i + _IN_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT key FROM ingested WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update(r["key"] for r in rows)
+        return found
+
+    # ------------------------------------------------------------------
+    # CANONICAL LINKS
+    # ------------------------------------------------------------------
+    def link_key(self, url: str, link: str, key: str) -> str:
+        """
+        De-duplication key of ``url``, whose page names ``link`` as its
+        canonical link. ``key`` is offered for ``link``; the first key
+        any process assigned to a link wins, and a URL keeps the first
+        key it was given.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO canonical_links VALUES (?, ?)", (link, key)
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO url_keys "
+                "SELECT ?, key FROM canonical_links WHERE link = ?",
+                (url, link),
+            )
+            row = self._conn.execute(
+                "SELECT key FROM url_keys WHERE url = ?", (url,)
+            ).fetchone()
+        return row["key"]
+
+    def url_keys(self, urls: Iterable[str]) -> Dict[str, str]:
+        """Keys assigned through ``link_key`` to any of ``urls``."""
+        urls = list(urls)
+        found: Dict[str, str] = {}
+        with self._lock:
+            for i in range(0, len(urls), _IN_CHUNK):
+                chunk = urls[i:i + _IN_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT url, key FROM url_keys WHERE url IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update((r["url"], r["key"]) for r in rows)
+        return found
+
+    def iter_ingested(self, batch: int = 100_000) -> Iterator[List[str]]:
+        """Every ingested key, in batches (for rebuilding the Bloom filter)."""
+        last = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT key FROM ingested WHERE key > ? ORDER BY key LIMIT ?",
+                    (last, batch),
+                ).fetchall()
+            if not rows:
+                return
+            keys = [r["key"] for r in rows]
+            last = keys[-1]
+            yield keys
+
+    # ------------------------------------------------------------------
+    # FEEDS
+    # ------------------------------------------------------------------
+    def claim_due_feeds(self, intervals: Dict[str, int], force: bool = False) -> List[str]:
+        """
+        Feeds of ``intervals`` (name -> seconds) whose last poll is at
+        least their interval ago, stamped as polled now in the same
+        transaction so concurrent pollers never claim a feed twice.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            polled = dict(self._conn.execute(
+                "SELECT feed, polled_at FROM feed_state"
+            ).fetchall())
+            due = [
+                name for name, interval in intervals.items()
+                if force or now - polled.get(name, 0.0) >= interval
+            ]
+            self._conn.executemany(
+                """
+                INSERT INTO feed_state (feed, polled_at) VALUES (?, ?)
+                ON CONFLICT(feed) DO UPDATE SET polled_at = excluded.polled_at
+                """,
+                [(name, now) for name in due],
+            )
+        return due
+
+    def feed_validators(self, names: Iterable[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """``{feed: (etag, last_modified)}`` from each feed's last good response."""
+        names = list(names)
+        if not names:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT feed, etag, last_modified FROM feed_state "
+                f"WHERE feed IN ({','.join('?' * len(names))})",
+                names,
+            ).fetchall()
+        return {r["feed"]: (r["etag"], r["last_modified"]) for r in rows}
+
+    def update_feed(self, name: str, status: int, etag: Optional[str] = None,
+                    last_modified: Optional[str] = None) -> None:
+        """Record a poll result; validators are kept unless new ones arrived."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                UPDATE feed_state SET status = ?,
+                    etag = COALESCE(?, etag),
+                    last_modified = COALESCE(?, last_modified)
+                WHERE feed = ?
+                """,
+                (status, etag, last_modified, name),
+            )
+
+    def save_feed_items(self, name: str, categories: Iterable[str], items: Iterable[Dict]) -> int:
+        """Merge a feed's items; returns how many were new."""
+        now = time.time()
+        cats = ",".join(categories)
+        today = date.today().isoformat()
+        rows = [
+            (item["url"], name, _day(item.get("published_date") or "", today),
+             cats, json.dumps(item), now)
+            for item in items
+            if item.get("url")
+        ]
+        with self._lock, self._conn:
+            cur = self._conn.executemany(
+                "INSERT OR IGNORE INTO feed_items VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+        return max(cur.rowcount, 0)
+
+    def feed_items(self, categories: Iterable[str], start: date, end: date) -> List[Dict]:
+        """Stored feed items of ``categories`` published in ``start``..``end``."""
+        wanted = set(categories)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT categories, item FROM feed_items WHERE day BETWEEN ? AND ?",
+                (start.isoformat(), end.isoformat()),
+            ).fetchall()
+        items = []
+        for row in rows:
+            cats = [c for c in row["categories"].split(",") if c in wanted]
+            if cats:
+                item = json.loads(row["item"])
+                item["categories"] = cats
+                items.append(item)
+        return items
+
+    # ------------------------------------------------------------------
+    # READ
+    # ------------------------------------------------------------------
+    def done_days(self, category: str, start: date, end: date) -> Set[str]:
+        """Days in ``start``..``end`` backfilled for ``category`` (directly or in batch)."""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT DISTINCT day FROM backfill_progress
+                WHERE category IN (?, ?) AND day BETWEEN ? AND ?
+                """,
+                (category, ALL_CATEGORIES, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return {r["day"] for r in rows}
+
+    def covers(self, category: str, start: date, end: date) -> bool:
+        """True when every day of ``start``..``end`` is backfilled."""
+        return len(self.done_days(category, start, end)) == (end - start).days + 1
+
+    def summary_items(self, categories: Iterable[str], start: date, end: date) -> List[Dict]:
+        """
+        Stored summaries of ``categories`` in ``start``..``end``, in the
+        summariser's item format plus ``categories`` and ``score``.
+        """
+        categories = list(categories)
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT a.key, a.url, a.published, a.score, a.summary,
+                       COALESCE(a.headline, a.title) AS headline,
+                       GROUP_CONCAT(c.category) AS cats
+                FROM article_categories c JOIN articles a ON a.key = c.key
+                WHERE c.category IN ({','.join('?' * len(categories))})
+                  AND c.published BETWEEN ? AND ? AND a.summary IS NOT NULL
+                GROUP BY a.key
+                """,
+                [*categories, start.isoformat(), end.isoformat()],
+            ).fetchall()
+        return [
+            {
+                "date": r["published"],
+                "title": r["headline"],
+                "summary": r["summary"],
+                "url": r["url"],
+                "key": r["key"],
+                "categories": r["cats"].split(","),
+                "score": r["score"],
+            }
+            for r in rows
+        ]
+
+    def sections(self, category: str, start: date, end: date,
+                 limit_per_day: Optional[int] = None) -> List[Dict]:
+        """
+        Stored summaries as UI sections, newest day first:
+        ``[{"date": ..., "articles": [{"title", "summary", "url"}]}]``.
+        Within a day articles keep their importance order.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT a.published, a.url, a.score,
+                       COALESCE(a.headline, a.title) AS title,
+                       COALESCE(a.summary, a.description) AS summary
+                FROM article_categories c JOIN articles a ON a.key = c.key
+                WHERE c.category = ? AND c.published BETWEEN ? AND ?
+                ORDER BY c.published DESC, a.score DESC
+                """,
+                (category, start.isoformat(), end.isoformat()),
+            ).fetchall()
+
+        sections: List[Dict] = []
+        for row in rows:
+            if not sections or sections[-1]["date"] != row["published"]:
+                sections.append({"date": row["published"], "articles": []})
+            articles = sections[-1]["articles"]
+            if limit_per_day is None or len(articles) < limit_per_day:
+                articles.append(
+                    {"title": row["title"], "summary": row["summary"] or "", "url": row["url"]}
+                )
+        return sections
+
+
+def _day(published: str, default: str) -> str:
+    """ISO day of a feed date, or ``default`` when it cannot be read."""
+    try:
+        return date.fromisoformat(published[:10]).isoformat()
+    except ValueError:
+        return default
+
+
+def days_between(start: date, end: date) -> List[date]:
+    """Every day from ``start`` to ``end`` inclusive, oldest first."""
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def get_store(path: str = STORE_DB) -> ArticleStore:
+    """Process-wide store for ``path`` (relative paths resolve against the cwd)."""
+    return _open_store(os.path.abspath(path))
+
+
+@lru_cache(maxsize=None)
+def _open_store(path: str) -> ArticleStore:
+    return ArticleStore(path)
@@ -0,0 +1,160 @@
+"""
+Local, CPU-only category classifier for news articles.
+
+A small linear model over title + description: every unigram / bigram in
+the lexicon carries a weight per category, title terms count double, and
+an article gets every category whose score clears ``MIN_SCORE`` and is
+within ``RELATIVE_SCORE`` of the best one. Articles matching nothing
+specific fall into the general categories.
+
+This lets one broad provider fetch populate every category view instead
+of one targeted remote query per category.
+"""
+import re
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+GENERAL_CATEGORIES = ("news", "general")
+
+# term -> weight, per category. Bigrams are matched on adjacent tokens.
+LEXICON: Dict[str, Dict[str, float]] = {
+    "finance": {
+        "finance": 2.0, "financial": 2.0, "stock": 2.5, "stocks": 2.5,
+        "shares": 2.0, "market": 1.0, "markets": 1.5, "investor": 2.0,
+        "investors": 2.0, "inflation": 2.5, "interest rate": 3.0,
+        "interest rates": 3.0, "central bank": 3.0, "bank": 1.0, "banks": 1.5,
+        "bond": 2.0, "bonds": 2.0, "yields": 2.0, "currency": 2.0,
+        "dollar": 1.5, "pound": 1.0, "crypto": 2.0, "bitcoin": 2.5,
+        "recession": 2.0, "economy": 1.5, "gdp": 2.5, "nasdaq": 3.0,
+        "dow": 2.0, "ftse": 3.0, "rally": 1.0, "mortgage": 2.0,
+        "mortgages": 2.0, "budget": 1.0, "tax": 1.0, "fed": 2.0,
+        "wall street": 3.0, "oil prices": 2.0, "price growth": 2.0,
+        "benchmark rate": 3.0, "rate cut": 3.0, "rate cuts": 3.0,
+    },
+    "business": {
+        "business": 2.0, "company": 1.5, "companies": 1.5, "firm": 1.5,
+        "earnings": 2.0, "profit": 2.0, "profits": 2.0, "revenue": 2.0,
+        "sales": 1.5, "ceo": 2.5, "chief executive": 2.5, "merger": 3.0,
+        "acquisition": 3.0, "takeover": 3.0, "deal": 1.0, "retail": 2.0,
+        "retailer": 2.5, "airline": 2.0, "jobs": 1.0, "layoffs": 2.5,
+        "workers": 1.0, "strike": 1.0, "startup": 1.5, "start-up": 1.5,
+        "funding": 1.5, "investment": 1.5, "industry": 1.5,
+        "supply chain": 2.0, "quarterly": 2.0, "shareholders": 2.0,
+        "brand": 1.0, "grocery": 1.5, "manufacturer": 2.0,
+    },
+    "sports": {
+        "sport": 2.0, "sports": 2.0, "football": 3.0, "soccer": 3.0,
+        "cricket": 3.0, "tennis": 3.0, "rugby": 3.0, "golf": 3.0,
+        "f1": 3.0, "formula one": 3.0, "nba": 3.0, "nfl": 3.0,
+        "match": 2.0, "league": 2.0, "cup": 1.5, "championship": 2.5,
+        "tournament": 2.5, "olympic": 3.0, "olympics": 3.0, "goal": 1.5,
+        "goals": 1.5, "striker": 3.0, "midfielder": 3.0, "coach": 2.0,
+        "manager": 0.5, "wickets": 3.0, "innings": 3.0, "test series": 3.0,
+        "grand slam": 3.0, "champions league": 3.5, "premier league": 3.5,
+        "world cup": 3.0, "title race": 2.5, "semi-final": 2.0,
+        "quarter-final": 2.0, "quarter-finals": 2.0, "final": 1.0,
+        "win": 0.5, "victory": 1.0, "defeat": 1.0, "season": 1.0,
+        "player": 1.5, "players": 1.5, "team": 1.0, "squad": 2.0,
+        "injury": 1.5, "marathon": 3.0, "boxing": 3.0,
+    },
+    "movies": {
+        "movie": 3.0, "movies": 3.0, "film": 2.5, "films": 2.5,
+        "cinema": 3.0, "hollywood": 3.0, "bollywood": 3.0,
+        "box office": 3.5, "actor": 2.5, "actress": 3.0, "director": 1.5,
+        "premiere": 2.5, "sequel": 2.5, "trailer": 2.0, "oscar": 3.0,
+        "oscars": 3.0, "festival": 1.0, "film festival": 3.0,
+        "streaming": 1.5, "netflix": 2.0, "series": 0.5, "star": 1.0,
+        "stars": 1.0, "cast": 1.5, "screen": 1.0, "animated": 2.0,
+        "studio": 1.5, "blockbuster": 3.0, "entertainment": 2.0,
+        "music": 1.5, "album": 2.0, "award": 1.0, "awards": 1.5,
+    },
+    "tech": {
+        "technology": 2.5, "tech": 2.0, "ai": 3.0,
+        "artificial intelligence": 3.5, "software": 2.5, "hardware": 2.0,
+        "gadget": 2.5, "gadgets": 2.5, "smartphone": 3.0, "iphone": 3.0,
+        "android": 3.0, "app": 1.5, "apps": 1.5, "chip": 2.5, "chips": 2.5,
+        "semiconductor": 3.0, "data centre": 2.5, "data center": 2.5,
+        "cloud": 1.5, "cyber": 2.5, "cyber-attack": 3.0, "hackers": 2.5,
+        "robot": 2.5, "robots": 2.5, "laptop": 2.5, "model": 0.5,
+        "chatbot": 3.0, "openai": 3.0, "google": 1.5, "apple": 1.5,
+        "microsoft": 2.0, "battery": 1.5, "foldable": 2.5, "internet": 1.5,
+        "online": 0.5, "social media": 2.0, "startups": 1.5, "digital": 1.0,
+        "computing": 2.5, "quantum": 2.0, "electric vehicle": 2.0,
+    },
+}
+
+MIN_SCORE = 2.5
+RELATIVE_SCORE = 0.5
+TITLE_WEIGHT = 2.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*")
+
+
+class CategoryClassifier:
+    """
+    Multi-label keyword classifier. ``classify`` returns the matching
+    categories in ``categories`` order.
+    """
+
+    def __init__(
+        self,
+        lexicon: Dict[str, Dict[str, float]] = None,
+        min_score: float = MIN_SCORE,
+        relative_score: float = RELATIVE_SCORE,
+    ):
+        lexicon = lexicon or LEXICON
+        self.categories: Tuple[str, ...] = tuple(lexicon)
+        self.min_score = min_score
+        self.relative_score = relative_score
+
+        # term -> [(category index, weight)] so scoring is one dict lookup
+        # per token / bigram.
+        self._weights: Dict[str, List[Tuple[int, float]]] = {}
+        for idx, cat in enumerate(self.categories):
+            for term, weight in lexicon[cat].items():
+                self._weights.setdefault(term, []).append((idx, weight))
+
+    def _accumulate(self, text: str, factor: float, scores: List[float]) -> None:
+        tokens = _TOKEN_RE.findall(text.lower())
+        weights = self._weights
+        prev = ""
+        for tok in tokens:
+            for idx, w in weights.get(tok, ()):
+                scores[idx] += w * factor
+            if prev:
+                for idx, w in weights.get(f"{prev} {tok}", ()):
+                    scores[idx] += w * factor
+            prev = tok
+
+    def scores(self, title: str, description: str = "") -> Dict[str, float]:
+        """Score of every specific category."""
+        scores = [0.0] * len(self.categories)
+        self._accumulate(title or "", TITLE_WEIGHT, scores)
+        self._accumulate(description or "", 1.0, scores)
+        return dict(zip(self.categories, scores))
+
+    def classify(self, title: str, description: str = "") -> Tuple[str, ...]:
+        """
+        Categories for one article; the general categories when no
+        specific one scores high enough.
+        """
+        scores = self.scores(title, description)
+        best = max(scores.values(), default=0.0)
+        if best < self.min_score:
+            return GENERAL_CATEGORIES
+        cutoff = max(self.min_score, best * self.relative_score)
+        return tuple(c for c, s in scores.items() if s >= cutoff)
+
+    def classify_many(self, texts: Iterable[Sequence[str]]) -> List[Tuple[str, ...]]:
+        """``classify`` over ``(title, description)`` pairs."""
+        return [self.classify(*pair) for pair in texts]
+
+
+_default = None
+
+
+def get_classifier() -> CategoryClassifier:
+    """Process-wide classifier built from the default lexicon."""
+    global _default
+    if _default is None:
+        _default = CategoryClassifier()
+    return _default
@@ -0,0 +1,81 @@
+"""
+Date ranges shared by the News graph and the UI.
+
+The graph fetches, and the UI shows, the same inclusive window ending at
+the selected day (never after today): one day for daily, the last 7 days
+for weekly and the last 30 days for monthly. Both sides take it from
+``date_range``, so nothing is fetched only to be filtered out on screen.
+
+``DateIndex`` keeps date sections sorted once, so picking a window is a
+binary search instead of parsing and scanning every section per rerun.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Days in each window, ending at (and including) the anchor day.
+FREQUENCY_DAYS = {"daily": 1, "weekly": 7, "monthly": 30}
+
+
+def normalize_frequency(timeframe: Optional[str]) -> str:
+    """``daily`` / ``weekly`` / ``monthly`` for a UI timeframe or frequency."""
+    tf = str(timeframe or "").strip().lower()
+    if tf.startswith("week"):
+        return "weekly"
+    if tf.startswith("month"):
+        return "monthly"
+    return "daily"
+
+
+def parse_anchor(value, today: Optional[date] = None) -> date:
+    """The anchor day from a date or ISO string, clamped to today."""
+    today = today or date.today()
+    if isinstance(value, datetime):
+        anchor = value.date()
+    elif isinstance(value, date):
+        anchor = value
+    else:
+        try:
+            anchor = datetime.fromisoformat(str(value)).date()
+        except Exception:
+            anchor = today
+    return min(anchor, today)
+
+
+def date_range(frequency: str, anchor=None, today: Optional[date] = None) -> Tuple[date, date]:
+    """Inclusive ``(start, end)`` of the ``frequency`` window ending at ``anchor``."""
+    end = parse_anchor(anchor, today)
+    days = FREQUENCY_DAYS.get(normalize_frequency(frequency), 1)
+    return end - timedelta(days=days - 1), end
+
+
+class DateIndex:
+    """
+    Date sections (``{"date": ..., "articles": [...]}``) sorted by day.
+    Sections whose date is not an ISO day ("No Date", "Latest") are kept
+    aside and returned by every query.
+    """
+
+    def __init__(self, sections: Iterable[Dict]):
+        dated: List[Tuple[str, int, Dict]] = []
+        self.undated: List[Dict] = []
+        for i, section in enumerate(sections):
+            try:
+                day = date.fromisoformat(str(section.get("date", ""))[:10]).isoformat()
+            except ValueError:
+                self.undated.append(section)
+                continue
+            dated.append((day, i, section))
+        # Oldest first for bisect; reversed slices keep file order within a day.
+        dated.sort(key=lambda d: (d[0], -d[1]))
+        self.days = [d[0] for d in dated]
+        self.sections = [d[2] for d in dated]
+
+    def __len__(self) -> int:
+        return len(self.sections) + len(self.undated)
+
+    def between(self, start: date, end: date) -> List[Dict]:
+        """Sections dated ``start``..``end`` (newest first), then undated ones."""
+        lo = bisect_left(self.days, start.isoformat())
+        hi = bisect_right(self.days, end.isoformat())
+        return self.sections[lo:hi][::-1] + self.undated
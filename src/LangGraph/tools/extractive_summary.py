@@ -0,0 +1,120 @@
+"""
+Local extractive summariser (TextRank over sentence TF vectors).
+
+Sentences are turned into L2-normalised term-frequency vectors, their
+cosine-similarity graph is ranked with PageRank (power iteration in
+NumPy), and the best sentences are returned in their original order up
+to a word budget. A few hundred sentences take milliseconds, so this is
+the no-LLM path for briefings and the fallback when the LLM fails.
+"""
+import html
+import re
+from typing import List
+
+import numpy as np
+
+MAX_WORDS = 150
+MAX_SENTENCES = 4
+DAMPING = 0.85
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-6
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])[\"'”’)]?\s+(?=[A-Z0-9\"“‘(])")
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_STOPWORDS = frozenset(
+    "a an and are as at be been but by for from had has have he her his i in "
+    "into is it its of on or our she that the their they this to was we were "
+    "which who will with would you".split()
+)
+
+
+def clean_text(text: str) -> str:
+    """Strip HTML tags / entities and collapse whitespace."""
+    if not text:
+        return ""
+    text = html.unescape(_TAG_RE.sub(" ", text))
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENTENCE_RE.split(text) if s.strip()]
+
+
+def _sentence_vectors(sentences: List[str]) -> np.ndarray:
+    vocab = {}
+    rows = []
+    for sentence in sentences:
+        ids = [
+            vocab.setdefault(w, len(vocab))
+            for w in _WORD_RE.findall(sentence.lower())
+            if w not in _STOPWORDS
+        ]
+        rows.append(ids)
+
+    matrix = np.zeros((len(sentences), max(len(vocab), 1)), dtype=np.float32)
+    for i, ids in enumerate(rows):
+        if ids:
+            np.add.at(matrix[i], ids, 1.0)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def textrank(sentences: List[str]) -> np.ndarray:
+    """PageRank score of every sentence in the similarity graph."""
+    n = len(sentences)
+    if n <= 2:
+        return np.ones(n, dtype=np.float32)
+
+    vectors = _sentence_vectors(sentences)
+    sim = vectors @ vectors.T
+    np.fill_diagonal(sim, 0.0)
+    out_weight = sim.sum(axis=1)
+    isolated = out_weight == 0
+    out_weight[isolated] = 1.0
+    transition = sim / out_weight[:, None]
+    # Sentences sharing no words with any other link to all of them evenly.
+    transition[isolated] = 1.0 / n
+
+    scores = np.full(n, 1.0 / n, dtype=np.float32)
+    for _ in range(MAX_ITERATIONS):
+        updated = (1 - DAMPING) / n + DAMPING * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < TOLERANCE:
+            return updated
+        scores = updated
+    return scores
+
+
+def summarize(text: str, max_words: int = MAX_WORDS, max_sentences: int = MAX_SENTENCES) -> str:
+    """
+    Extractive summary of ``text``: its highest-ranked sentences in
+    original order, within ``max_words`` and ``max_sentences``. Short
+    texts are returned (cleaned) as they are.
+    """
+    text = clean_text(text)
+    if not text:
+        return ""
+    # Feeds often repeat the teaser inside the body.
+    sentences = list(dict.fromkeys(split_sentences(text)))
+    if len(sentences) <= max_sentences and len(text.split()) <= max_words:
+        return text
+
+    scores = textrank(sentences)
+    # Ties favour earlier sentences (news leads carry the story).
+    order = sorted(range(len(sentences)), key=lambda i: (-float(scores[i]), i))
+
+    chosen: List[int] = []
+    words = 0
+    for i in order:
+        length = len(sentences[i].split())
+        if chosen and words + length > max_words:
+            continue
+        chosen.append(i)
+        words += length
+        if len(chosen) >= max_sentences:
+            break
+
+    summary = " ".join(sentences[i] for i in sorted(chosen))
+    return " ".join(summary.split()[:max_words])
@@ -0,0 +1,99 @@
+"""
+Feed poller: keeps the article store's feed items up to date.
+
+Each catalog feed is polled at most once per its own interval. Due feeds
+are claimed in the store (so concurrent runs never poll one twice), read
+with conditional GETs using the ETag / Last-Modified of their last good
+response, and only items not stored yet are added. A News run therefore
+costs at most a few due, mostly ``304 Not Modified`` requests instead of
+one download per feed.
+
+Run continuously alongside the app with:
+    python -m src.LangGraph.tools.feed_poller --loop
+"""
+import argparse
+import asyncio
+import os
+import time
+from typing import Dict, Iterable, Optional
+
+from src.LangGraph.tools.aio import run
+from src.LangGraph.tools.article_store import ArticleStore, get_store
+from src.LangGraph.tools.feeds import FEED_MAX_ITEMS, aread_feed, feeds_for, load_catalog
+
+POLL_CONCURRENCY = int(os.getenv("FEED_POLL_CONCURRENCY", "8"))
+
+
+async def apoll(categories: Optional[Iterable[str]] = None,
+                store: Optional[ArticleStore] = None,
+                force: bool = False) -> Dict[str, int]:
+    """
+    Poll the due feeds serving ``categories`` (every feed when ``None``)
+    into the store. Returns counts: ``due``, ``not_modified``,
+    ``failed`` and ``new_items``.
+    """
+    store = store or get_store()
+    catalog = load_catalog()
+    if categories is None:
+        specs = list(catalog)
+    else:
+        specs = list(feeds_for(categories, catalog))
+
+    due = set(await asyncio.to_thread(
+        store.claim_due_feeds, {spec.name: spec.interval for spec in specs}, force
+    ))
+    specs = [spec for spec in specs if spec.name in due]
+    stats = {"due": len(specs), "not_modified": 0, "failed": 0, "new_items": 0}
+    if not specs:
+        return stats
+
+    validators = await asyncio.to_thread(store.feed_validators, due)
+    slots = asyncio.Semaphore(POLL_CONCURRENCY)
+
+    async def one(spec) -> None:
+        etag, modified = validators.get(spec.name, (None, None))
+        async with slots:
+            result = await aread_feed(
+                spec.url, spec.source, spec.categories, FEED_MAX_ITEMS, etag, modified
+            )
+        if result.status == 304:
+            stats["not_modified"] += 1
+        elif not result.status or result.status >= 400:
+            stats["failed"] += 1
+        elif result.items:
+            new = await asyncio.to_thread(
+                store.save_feed_items, spec.name, spec.categories, result.items
+            )
+            stats["new_items"] += new
+        await asyncio.to_thread(
+            store.update_feed, spec.name, result.status, result.etag, result.last_modified
+        )
+
+    await asyncio.gather(*(one(spec) for spec in specs))
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Poll the RSS / Atom feed catalog into the article store.")
+    parser.add_argument("--loop", action="store_true", help="keep polling as feeds come due")
+    parser.add_argument("--every", type=float, default=60, help="seconds between due checks with --loop")
+    parser.add_argument("--force", action="store_true", help="poll every feed now, ignoring intervals")
+    args = parser.parse_args(argv)
+
+    force = args.force
+    while True:
+        started = time.perf_counter()
+        stats = run(apoll(force=force))
+        print(
+            f"{time.strftime('%H:%M:%S')} polled {stats['due']} feeds: "
+            f"{stats['new_items']} new items, {stats['not_modified']} unchanged, "
+            f"{stats['failed']} failed ({(time.perf_counter() - started) * 1000:.0f} ms)"
+        )
+        if not args.loop:
+            break
+        force = False
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    main()
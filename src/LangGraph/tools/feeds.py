@@ -0,0 +1,330 @@
+"""
+Streaming RSS / Atom ingestion.
+
+Feed bodies are read chunk by chunk and pushed through an incremental
+XML parser (``XMLPullParser``, the non-blocking form of ``iterparse``).
+Each ``<item>`` / ``<entry>`` is turned into a provider dict as soon as
+it closes and is then cleared and detached from the tree, so memory
+stays flat however long the feed is, and reading stops early once
+``FEED_MAX_ITEMS`` items are in.
+
+RSS 2.0, RSS 1.0 (RDF) and Atom are handled, including the common
+namespaced fields: ``content:encoded``, ``dc:date`` / ``dc:creator``,
+``media:thumbnail`` / ``media:content`` and Atom links. Feeds that are
+not well-formed XML are re-read with ``feedparser`` when it is installed.
+
+Feeds are listed in ``feed_catalog.ini`` (one section per feed with its
+categories and poll interval); ``feed_poller`` polls them into the
+article store, and ``afetch_feeds`` reads them directly.
+"""
+import asyncio
+import os
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from configparser import ConfigParser
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.LangGraph.tools import http_pool
+from src.LangGraph.tools.extractive_summary import clean_text
+
+# Optional: tolerant parser for malformed feeds
+try:
+    import feedparser
+except ImportError:
+    feedparser = None
+
+FEED_MAX_ITEMS = int(os.getenv("FEED_MAX_ITEMS", "100"))
+FEED_TIMEOUT = 8
+# Bytes handed to the parser at a time; bounds the tree built between drains.
+FEED_CHUNK = 64 * 1024
+
+FEED_CATALOG = os.getenv(
+    "NEWS_FEED_CATALOG", os.path.join(os.path.dirname(__file__), "feed_catalog.ini")
+)
+DEFAULT_INTERVAL_MINUTES = 30
+
+# Categories without feeds of their own read these.
+FALLBACK_CATEGORY = "news"
+
+
+@dataclass(slots=True, frozen=True)
+class FeedSpec:
+    """One catalog entry."""
+    name: str
+    source: str
+    url: str
+    categories: Tuple[str, ...]
+    interval: int  # seconds between polls
+
+
+# Used when the catalog file is missing or empty.
+DEFAULT_FEEDS = (
+    FeedSpec("bbc-top", "bbc", "https://feeds.bbci.co.uk/news/rss.xml", ("news", "general"), 900),
+)
+
+
+@lru_cache(maxsize=None)
+def load_catalog(path: str = FEED_CATALOG) -> Tuple[FeedSpec, ...]:
+    """Parse the feed catalog (cached per path)."""
+    config = ConfigParser()
+    config.read(path)
+    specs = []
+    for name in config.sections():
+        section = config[name]
+        url = section.get("url", "").strip()
+        categories = tuple(
+            c.strip().lower() for c in section.get("categories", "").split(",") if c.strip()
+        )
+        if not url or not categories:
+            continue
+        try:
+            minutes = float(section.get("interval", DEFAULT_INTERVAL_MINUTES))
+        except ValueError:
+            minutes = DEFAULT_INTERVAL_MINUTES
+        specs.append(
+            FeedSpec(name, section.get("source", name).strip(), url, categories, int(minutes * 60))
+        )
+    return tuple(specs) or DEFAULT_FEEDS
+
+
+def covered(categories: Iterable[str], catalog: Iterable[FeedSpec] = ()) -> Tuple[str, ...]:
+    """``categories`` with every one lacking feeds replaced by the fallback."""
+    catalog = tuple(catalog) or load_catalog()
+    served = {c for spec in catalog for c in spec.categories}
+    return tuple(dict.fromkeys(c if c in served else FALLBACK_CATEGORY for c in categories))
+
+
+def feeds_for(categories: Iterable[str], catalog: Iterable[FeedSpec] = ()) -> Dict[FeedSpec, List[str]]:
+    """Feeds serving ``categories``, each mapped to the categories it serves."""
+    catalog = tuple(catalog) or load_catalog()
+    wanted: Dict[FeedSpec, List[str]] = defaultdict(list)
+    for category in covered(categories, catalog):
+        for spec in catalog:
+            if category in spec.categories:
+                wanted[spec].append(category)
+    return wanted
+
+
+@dataclass(slots=True)
+class FeedResult:
+    """Outcome of one (conditional) feed read."""
+    items: List[Dict] = field(default_factory=list)
+    status: int = 0  # HTTP status; 0 when the request failed
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+MEDIA_NS = "http://search.yahoo.com/mrss/"
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+
+_ITEM_TAGS = ("item", "entry")
+
+
+def _split(tag: str) -> Tuple[str, str]:
+    """``{namespace}local`` -> ``(namespace, local)``."""
+    if tag[:1] == "{":
+        ns, _, local = tag[1:].partition("}")
+        return ns, local
+    return "", tag
+
+
+def _iso_date(raw: str) -> str:
+    """RFC 822 / ISO 8601 feed dates as UTC ISO; unknown formats pass through."""
+    raw = (raw or "").strip()
+    if not raw:
+        return ""
+    try:
+        dt = parsedate_to_datetime(raw)
+    except (TypeError, ValueError, IndexError):
+        try:
+            dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        except ValueError:
+            return raw
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat()
+
+
+def _is_image(elem: ET.Element) -> bool:
+    kind = elem.get("medium") or elem.get("type") or "image"
+    return kind.startswith("image")
+
+
+def _item(elem: ET.Element, source: str, categories: Tuple[str, ...]) -> Optional[Dict]:
+    """Provider dict for one ``<item>`` / ``<entry>``."""
+    fields: Dict[str, str] = {}
+    link = image = None
+    for child in elem.iter():
+        if child is elem:
+            continue
+        ns, name = _split(child.tag)
+        text = (child.text or "").strip()
+        if name == "link":
+            href = child.get("href")
+            if href is not None:
+                # Atom: the entry's own page is rel="alternate" (the default).
+                if child.get("rel", "alternate") == "alternate":
+                    link = link or href
+            elif text:
+                link = link or text
+        elif ns == MEDIA_NS and name in ("thumbnail", "content"):
+            if child.get("url") and _is_image(child):
+                image = image or child.get("url")
+        elif name == "enclosure":
+            if child.get("url") and (child.get("type") or "").startswith("image/"):
+                image = image or child.get("url")
+        elif (ns, name) in ((CONTENT_NS, "encoded"), (ATOM_NS, "content")):
+            fields.setdefault("content", text)
+        elif text and ns != MEDIA_NS:
+            fields.setdefault(name, text)
+
+    guid = fields.get("guid") or fields.get("id") or ""
+    link = link or (guid if guid.startswith("http") else "")
+    if not link:
+        return None
+    return {
+        "title": clean_text(fields.get("title", "")),
+        "description": clean_text(fields.get("description") or fields.get("summary") or ""),
+        "text": clean_text(fields.get("content", "")),
+        "url": link,
+        "published_date": _iso_date(
+            fields.get("pubDate")
+            or fields.get("published")
+            or fields.get("date")
+            or fields.get("updated")
+            or fields.get("issued")
+            or ""
+        ),
+        "image": image,
+        "author": fields.get("creator") or fields.get("name") or "",
+        "source": source,
+        "categories": list(categories),
+    }
+
+
+class _ItemStream:
+    """
+    Turns ``(event, element)`` pairs from ``XMLPullParser`` into items,
+    clearing and detaching every finished item.
+    """
+
+    def __init__(self, source: str, categories: Iterable[str]):
+        self.source = source
+        self.categories = tuple(categories)
+        self._stack: List[ET.Element] = []
+
+    def handle(self, event: str, elem: ET.Element) -> Optional[Dict]:
+        if event == "start":
+            self._stack.append(elem)
+            return None
+        self._stack.pop()
+        if _split(elem.tag)[1] not in _ITEM_TAGS:
+            return None
+        item = _item(elem, self.source, self.categories)
+        elem.clear()
+        if self._stack:
+            self._stack[-1].remove(elem)
+        return item
+
+
+def _feedparser_items(body: bytes, source: str, categories: Iterable[str],
+                      max_items: int) -> List[Dict]:
+    """Fallback for feeds that are not well-formed XML."""
+    parsed = feedparser.parse(body)
+    items: List[Dict] = []
+    for entry in parsed.entries[:max_items]:
+        link = entry.get("link")
+        if not link:
+            continue
+        media = entry.get("media_thumbnail") or entry.get("media_content") or [{}]
+        content = entry.get("content") or [{}]
+        items.append(
+            {
+                "title": clean_text(entry.get("title", "")),
+                "description": clean_text(entry.get("summary", "")),
+                "text": clean_text(content[0].get("value", "")),
+                "url": link,
+                "published_date": _iso_date(entry.get("published") or entry.get("updated") or ""),
+                "image": media[0].get("url"),
+                "author": entry.get("author", ""),
+                "source": source,
+                "categories": list(categories),
+            }
+        )
+    return items
+
+
+async def aread_feed(url: str, source: str = "", categories: Iterable[str] = (),
+                     max_items: int = FEED_MAX_ITEMS, etag: Optional[str] = None,
+                     last_modified: Optional[str] = None) -> FeedResult:
+    """
+    Download and parse one feed incrementally. With ``etag`` /
+    ``last_modified`` the request is conditional and an unchanged feed
+    comes back as status 304 with no items.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    stream = _ItemStream(source, categories)
+    parser = ET.XMLPullParser(events=("start", "end"))
+    result = FeedResult()
+    try:
+        async with http_pool.astream(url, timeout=FEED_TIMEOUT, headers=headers or None) as resp:
+            result.status = resp.status_code
+            if resp.status_code == 304:
+                return result
+            resp.raise_for_status()
+            result.etag = resp.headers.get("ETag")
+            result.last_modified = resp.headers.get("Last-Modified")
+            async for chunk in resp.aiter_bytes(chunk_size=FEED_CHUNK):
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    item = stream.handle(event, elem)
+                    if item is not None:
+                        result.items.append(item)
+                if len(result.items) >= max_items:
+                    # Enough items: stop reading the rest of the body.
+                    del result.items[max_items:]
+                    return result
+        parser.close()
+    except ET.ParseError:
+        if feedparser is None:
+            return result
+        try:
+            resp = await http_pool.aget(url, timeout=FEED_TIMEOUT)
+            resp.raise_for_status()
+            result.items = await asyncio.to_thread(
+                _feedparser_items, resp.content, source, stream.categories, max_items
+            )
+        except Exception:
+            pass
+    except Exception:
+        result.status = 0
+    return result
+
+
+async def afetch_feed(url: str, source: str = "", categories: Iterable[str] = (),
+                      max_items: int = FEED_MAX_ITEMS) -> List[Dict]:
+    """Items of one feed; ``[]`` on any failure."""
+    return (await aread_feed(url, source, categories, max_items)).items
+
+
+async def afetch_feeds(categories: Iterable[str], max_items: int = FEED_MAX_ITEMS) -> List[Dict]:
+    """
+    Items of every catalog feed serving ``categories``, read now. A feed
+    shared by several categories is fetched once and its items carry all
+    of them.
+    """
+    wanted = feeds_for(categories)
+    results = await asyncio.gather(*(
+        afetch_feed(spec.url, spec.source, cats, max_items) for spec, cats in wanted.items()
+    ))
+    return [item for items in results for item in items]
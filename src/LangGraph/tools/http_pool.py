@@ -0,0 +1,115 @@
+"""
+Shared HTTP connection pool for every news provider.
+
+All outgoing provider / article requests go through one ``httpx.Client``
+(sync) and one ``httpx.AsyncClient`` per event loop, so TCP + TLS
+connections are reused across sources and nodes instead of being
+re-established for every call. The sync client lives for the process;
+an async client lives as long as its loop's run and is closed by
+``aio.run`` / ``aio.run_sync`` before the loop is torn down.
+"""
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+USER_AGENT = "Mozilla/5.0 (genai-news-app)"
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+_lock = threading.Lock()
+_sync_client: Optional[httpx.Client] = None
+# AsyncClient connections are bound to the loop that opened them, and
+# Streamlit reruns may each start a fresh loop.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_transport: Optional[Any] = None
+
+
+def _client_kwargs() -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {
+        "timeout": DEFAULT_TIMEOUT,
+        "limits": DEFAULT_LIMITS,
+        "follow_redirects": True,
+        "headers": {"User-Agent": USER_AGENT},
+    }
+    if _transport is not None:
+        kwargs["transport"] = _transport
+    return kwargs
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide sync client."""
+    global _sync_client
+    with _lock:
+        if _sync_client is None:
+            _sync_client = httpx.Client(**_client_kwargs())
+        return _sync_client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(**_client_kwargs())
+            _async_clients[loop] = client
+        return client
+
+
+async def aclose_async_client() -> None:
+    """Close and forget the running loop's async client, if it has one."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+def get(url: str, params: Optional[Dict] = None, timeout: Optional[float] = None,
+        headers: Optional[Dict] = None) -> httpx.Response:
+    """GET through the shared sync client."""
+    kwargs: Dict[str, Any] = {"params": params, "headers": headers}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    return get_client().get(url, **kwargs)
+
+
+async def aget(url: str, params: Optional[Dict] = None, timeout: Optional[float] = None,
+               headers: Optional[Dict] = None) -> httpx.Response:
+    """GET through the shared async client of the running loop."""
+    kwargs: Dict[str, Any] = {"params": params, "headers": headers}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    return await get_async_client().get(url, **kwargs)
+
+
+@asynccontextmanager
+async def astream(url: str, params: Optional[Dict] = None, timeout: Optional[float] = None,
+                  headers: Optional[Dict] = None) -> AsyncIterator[httpx.Response]:
+    """Streaming GET; the body is read incrementally with ``aiter_bytes``."""
+    kwargs: Dict[str, Any] = {"params": params, "headers": headers}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    async with get_async_client().stream("GET", url, **kwargs) as resp:
+        yield resp
+
+
+def use_transport(transport: Optional[Any]) -> None:
+    """
+    Route all pooled clients through ``transport`` (e.g. an
+    ``httpx.MockTransport`` for offline runs); ``None`` restores the
+    network. Existing clients are dropped so the change applies at once.
+    """
+    global _transport, _sync_client
+    with _lock:
+        _transport = transport
+        if _sync_client is not None:
+            _sync_client.close()
+        _sync_client = None
+        _async_clients.clear()
@@ -0,0 +1,189 @@
+"""
+Local importance ranking for fetched articles.
+
+Articles telling the same story (near-identical titles published
+within ``CLUSTER_WINDOW`` of each other) are clustered, each cluster is
+represented by the article from its most trusted source, and clusters
+are scored by
+
+  - cross-source coverage: how many distinct sources carry the story,
+  - cluster size: how many articles / URLs it has,
+  - source weight of the representative,
+  - recency relative to the newest article in the run.
+
+``select_top_k`` then keeps the best ``k`` stories per day (and per
+category) for the LLM, so summarisation cost grows with ``k`` rather
+than with the raw fetch volume.
+"""
+import math
+import os
+import re
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.LangGraph.state.state import Article
+
+TOP_K_PER_DAY = int(os.getenv("NEWS_TOP_K_PER_DAY", "10"))
+
+# Jaccard similarity of title tokens above which two articles are the
+# same story.
+CLUSTER_SIMILARITY = 0.6
+# Only articles published this close to a cluster's first article join
+# it, so recurring or syndicated headlines from other days stay apart.
+CLUSTER_WINDOW = timedelta(hours=int(os.getenv("NEWS_CLUSTER_WINDOW_HOURS", "48")))
+
+SOURCE_WEIGHTS = {
+    "guardian": 1.0,
+    "bbc": 1.0,
+    "reuters": 1.0,
+    "tavily": 0.8,
+    "gdelt": 0.5,
+}
+DEFAULT_SOURCE_WEIGHT = 0.6
+
+W_COVERAGE = 2.0
+W_CLUSTER = 1.0
+W_SOURCE = 1.0
+W_RECENCY = 1.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in into is it its of on or "
+    "over the to up was were will with after new says".split()
+)
+
+
+def _title_tokens(title: str) -> Set[str]:
+    return {
+        t for t in _TOKEN_RE.findall((title or "").lower())
+        if t not in _STOPWORDS
+    }
+
+
+def source_weight(source: str) -> float:
+    return SOURCE_WEIGHTS.get((source or "").lower(), DEFAULT_SOURCE_WEIGHT)
+
+
+def _published_time(art: Article) -> Optional[datetime]:
+    """Publication time (naive UTC); day-only dates count from midnight."""
+    try:
+        if art.published_at:
+            return datetime.fromisoformat(art.published_at).replace(tzinfo=None)
+        return datetime.fromisoformat(art.published)
+    except ValueError:
+        return None
+
+
+def cluster_articles(articles: Sequence[Article]) -> List[List[Article]]:
+    """
+    Group articles whose title tokens overlap by at least
+    ``CLUSTER_SIMILARITY`` (Jaccard) and that were published within
+    ``CLUSTER_WINDOW`` of the cluster's first article. An inverted token
+    index limits comparisons to clusters sharing a word with the article.
+    """
+    clusters: List[List[Article]] = []
+    cluster_tokens: List[Set[str]] = []
+    cluster_times: List[Optional[datetime]] = []
+    index: Dict[str, List[int]] = defaultdict(list)
+
+    for art in articles:
+        tokens = _title_tokens(art.title)
+        when = _published_time(art)
+        best, best_sim = -1, 0.0
+        candidates = {cid for tok in tokens for cid in index.get(tok, ())}
+        for cid in candidates:
+            seed = cluster_times[cid]
+            if when is not None and seed is not None and abs(when - seed) > CLUSTER_WINDOW:
+                continue
+            other = cluster_tokens[cid]
+            sim = len(tokens & other) / len(tokens | other)
+            if sim > best_sim:
+                best, best_sim = cid, sim
+
+        if tokens and best_sim >= CLUSTER_SIMILARITY:
+            clusters[best].append(art)
+            continue
+
+        cid = len(clusters)
+        clusters.append([art])
+        cluster_tokens.append(tokens)
+        cluster_times.append(when)
+        for tok in tokens:
+            index[tok].append(cid)
+    return clusters
+
+
+def _age_days(published: str, newest: date) -> int:
+    try:
+        return max((newest - date.fromisoformat(published)).days, 0)
+    except ValueError:
+        return 0
+
+
+def rank_articles(articles: Sequence[Article]) -> List[Tuple[float, Article]]:
+    """
+    One ``(score, article)`` per story, best first.
+
+    The representative is the cluster's most trusted source; it inherits
+    the categories of every member so no category view loses the story.
+    """
+    if not articles:
+        return []
+
+    newest = max(
+        (date.fromisoformat(a.published) for a in articles if a.published),
+        default=date.today(),
+    )
+
+    ranked: List[Tuple[float, Article]] = []
+    for members in cluster_articles(articles):
+        rep = max(members, key=lambda a: (source_weight(a.source), len(a.description)))
+        for other in members:
+            if other is not rep:
+                rep.categories += tuple(
+                    c for c in other.categories if c not in rep.categories
+                )
+
+        coverage = len({(a.source or a.key).lower() for a in members})
+        score = (
+            W_COVERAGE * (coverage - 1)
+            + W_CLUSTER * math.log2(len(members))
+            + W_SOURCE * source_weight(rep.source)
+            + W_RECENCY / (1 + _age_days(rep.published, newest))
+        )
+        ranked.append((score, rep))
+
+    ranked.sort(key=lambda pair: pair[0], reverse=True)
+    return ranked
+
+
+def select_top_k(
+    ranked: Iterable[Tuple[float, Article]],
+    k: int = TOP_K_PER_DAY,
+    categories: Sequence[str] = (),
+) -> Tuple[List[Article], List[Article]]:
+    """
+    Split ranked stories into ``(top, rest)``: the ``k`` best per day,
+    counted separately for each of ``categories`` (all stories share one
+    count when no categories are given). Both lists keep rank order;
+    ``k <= 0`` keeps everything.
+    """
+    if k <= 0:
+        return [art for _, art in ranked], []
+
+    taken: Dict[Tuple[str, str], int] = defaultdict(int)
+    top: List[Article] = []
+    rest: List[Article] = []
+
+    for _, art in ranked:
+        day = art.published
+        groups = [c for c in art.categories if c in categories] if categories else [""]
+        wanted = [g for g in groups if taken[(day, g)] < k]
+        if wanted:
+            for g in wanted:
+                taken[(day, g)] += 1
+            top.append(art)
+        else:
+            rest.append(art)
+    return top, rest
@@ -1,16 +1,32 @@
 from langchain_community.tools.tavily_search.tool import TavilySearchResults
 from langgraph.prebuilt import ToolNode
 from langchain.tools import BaseTool
-from newsdataapi import NewsDataApiClient
-from pydantic import PrivateAttr
-from typing import Any, Dict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 import os
+
+from src.LangGraph.tools import http_pool
+
 load_dotenv()
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 
 NEWS_DATA_API_KEY = os.getenv("NEWS_DATA_API_KEY")
 
+NEWSDATA_LATEST_URL = "https://newsdata.io/api/1/latest"
+
+# UI news type -> NewsData.io category
+NEWSDATA_CATEGORY_MAP = {
+    "news": "top",
+    "general": "top",
+    "finance": "business",
+    "business": "business",
+    "sports": "sports",
+    "movies": "entertainment",
+    "tech": "technology",
+}
+
+
 class NewsDataSearch(BaseTool):
     name: str = "newsdata_search"
     description: str = (
@@ -18,30 +34,112 @@ class NewsDataSearch(BaseTool):
         "Input must be a text query."
     )
 
-    api_key: str
-    _client: Any = PrivateAttr()
+    api_key: Optional[str] = None
+    language: str = "en"
+    page_size: int = 10
+    max_pages: int = 3
 
-    def __init__(self, api_key: str, **kwargs):
+    def __init__(self, api_key: Optional[str], **kwargs):
         super().__init__(api_key=api_key, **kwargs)
-        self._client = NewsDataApiClient(apikey=api_key)
 
-    def _run(self, query: str, days: int = None) -> Dict:
+    # ------------------------------------------------------------------
+    # request / response helpers shared by the sync and async paths
+    # ------------------------------------------------------------------
+    def _params(self, query: str, category: Optional[str], page: Optional[str]) -> Dict:
+        params = {
+            "apikey": self.api_key,
+            "q": query,
+            "language": self.language,
+            "size": self.page_size,
+        }
+        mapped = NEWSDATA_CATEGORY_MAP.get((category or "").lower())
+        if mapped:
+            params["category"] = mapped
+        if page:
+            params["page"] = page
+        return params
+
+    @staticmethod
+    def _published(item: Dict) -> Optional[datetime]:
+        raw = item.get("pubDate") or ""
+        try:
+            return datetime.fromisoformat(raw).replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    def _filter_page(self, data: Dict, cutoff: Optional[datetime]) -> tuple:
         """
-        Run NewsData.io search with optional time filtering.
-        
+        Keep items newer than ``cutoff``.
+
+        Returns ``(items, exhausted)``; results come newest first, so one
+        item older than the cutoff means later pages are all too old.
         """
-        
-        
-       
-        response = self._client.news_api(
-            q=query,
-            language="en",
-            country="us"
-        )
-        return response
-
-    async def _arun(self, query: str):
-        raise NotImplementedError("Async not implemented")
+        kept: List[Dict] = []
+        exhausted = False
+        for item in data.get("results") or []:
+            published = self._published(item)
+            if cutoff and published and published < cutoff:
+                exhausted = True
+                continue
+            kept.append(item)
+        return kept, exhausted
+
+    @staticmethod
+    def _cutoff(days: Optional[int]) -> Optional[datetime]:
+        if not days:
+            return None
+        return datetime.now(timezone.utc) - timedelta(days=days)
+
+    # ------------------------------------------------------------------
+    # tool entry points
+    # ------------------------------------------------------------------
+    def _run(self, query: str, days: Optional[int] = None, category: Optional[str] = None) -> Dict:
+        """
+        Run NewsData.io search with optional time and category filtering,
+        following ``nextPage`` tokens up to ``max_pages``.
+        """
+        if not self.api_key:
+            return {"results": []}
+
+        cutoff = self._cutoff(days)
+        results: List[Dict] = []
+        page = None
+        for _ in range(self.max_pages):
+            resp = http_pool.get(NEWSDATA_LATEST_URL, params=self._params(query, category, page))
+            resp.raise_for_status()
+            data = resp.json()
+
+            items, exhausted = self._filter_page(data, cutoff)
+            results.extend(items)
+            page = data.get("nextPage")
+            if exhausted or not page:
+                break
+        return {"results": results}
+
+    async def _arun(self, query: str, days: Optional[int] = None, category: Optional[str] = None) -> Dict:
+        """
+        Async variant of ``_run`` on the shared connection pool, so it can
+        be awaited alongside the other providers.
+        """
+        if not self.api_key:
+            return {"results": []}
+
+        cutoff = self._cutoff(days)
+        results: List[Dict] = []
+        page = None
+        for _ in range(self.max_pages):
+            resp = await http_pool.aget(
+                NEWSDATA_LATEST_URL, params=self._params(query, category, page)
+            )
+            resp.raise_for_status()
+            data = resp.json()
+
+            items, exhausted = self._filter_page(data, cutoff)
+            results.extend(items)
+            page = data.get("nextPage")
+            if exhausted or not page:
+                break
+        return {"results": results}
 
 def get_tools():
     """
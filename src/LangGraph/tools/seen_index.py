@@ -0,0 +1,289 @@
+"""
+Global "already ingested?" index over normalised article URLs.
+
+A scalable Bloom filter answers in O(1) with a few bits per URL; only
+its "maybe" answers are confirmed against the exact set kept in the
+article store (``ingested`` table), so results are exact while almost
+every genuinely new URL is decided without touching SQLite.
+
+The filter grows by adding larger, stricter sub-filters as it fills
+(Almeida et al.), so the overall false-positive rate stays below
+``SEEN_INDEX_ERROR`` however many URLs arrive. It is saved next to the
+store (``<store>.bloom``) before the store is updated, so it is always a
+superset of the exact set: a crash can cost an extra confirmation, never
+a wrong "new". A missing or unreadable file is rebuilt from the store.
+
+Several processes (the app, a backfill) may share one store. Saving
+OR-merges the file's filter into the in-memory one under a file lock
+before writing it back, and lookups pick up the file again whenever
+another process has rewritten it, so no process drops another's keys.
+"""
+import hashlib
+import json
+import math
+import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: one process per store is assumed
+    fcntl = None
+
+from src.LangGraph.tools.article_store import ArticleStore, get_store
+
+SEEN_INDEX_CAPACITY = int(os.getenv("SEEN_INDEX_CAPACITY", "100000"))
+SEEN_INDEX_ERROR = float(os.getenv("SEEN_INDEX_ERROR", "0.001"))
+# Each new sub-filter holds GROWTH times more URLs at TIGHTENING times the
+# previous error rate; the rates are scaled so they sum to SEEN_INDEX_ERROR.
+GROWTH = 2
+TIGHTENING = 0.5
+_MAGIC = b"SEENIDX1"
+
+
+def _hash_pairs(keys: List[str]) -> np.ndarray:
+    """Two independent 64-bit hashes per key (for double hashing)."""
+    raw = b"".join(hashlib.blake2b(k.encode("utf-8"), digest_size=16).digest() for k in keys)
+    return np.frombuffer(raw, dtype=np.uint64).reshape(-1, 2)
+
+
+class BloomFilter:
+    """Fixed-capacity Bloom filter over a NumPy bit array."""
+
+    def __init__(self, capacity: int, error_rate: float, bits: Optional[np.ndarray] = None,
+                 count: int = 0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.m = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.k = max(1, round(self.m / capacity * math.log(2)))
+        self.bits = bits if bits is not None else np.zeros((self.m + 7) // 8, dtype=np.uint8)
+        self.count = count
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        steps = np.arange(self.k, dtype=np.uint64)
+        # Wrap-around on overflow is fine: it is the same for every lookup.
+        with np.errstate(over="ignore"):
+            combined = hashes[:, :1] + steps * (hashes[:, 1:] | np.uint64(1))
+        return combined % np.uint64(self.m)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        pos = self._positions(hashes)
+        hit = (self.bits[pos >> np.uint64(3)] >> (pos & np.uint64(7)).astype(np.uint8)) & 1
+        return hit.all(axis=1)
+
+    def add(self, hashes: np.ndarray) -> None:
+        pos = self._positions(hashes).ravel()
+        masks = np.left_shift(1, (pos & np.uint64(7)).astype(np.uint8)).astype(np.uint8)
+        np.bitwise_or.at(self.bits, pos >> np.uint64(3), masks)
+        self.count += len(hashes)
+
+    def merge(self, other: "BloomFilter") -> None:
+        """OR in ``other`` (same capacity and error rate)."""
+        self.bits = self.bits | other.bits
+        # Keys both sides added are counted once: estimate the union from
+        # the fill (Swamidass & Baldi), never below either side's count.
+        filled = int(np.unpackbits(self.bits).sum())
+        if filled >= self.m:
+            estimate = self.capacity
+        else:
+            estimate = round(-self.m / self.k * math.log(1 - filled / self.m))
+        self.count = max(self.count, other.count, estimate)
+
+
+class ScalableBloomFilter:
+    """A growing series of ``BloomFilter`` s with a bounded total error."""
+
+    def __init__(self, capacity: int = SEEN_INDEX_CAPACITY, error_rate: float = SEEN_INDEX_ERROR):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.filters: List[BloomFilter] = []
+
+    def __len__(self) -> int:
+        return sum(f.count for f in self.filters)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(f.bits.nbytes for f in self.filters)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(hashes), dtype=bool)
+        for f in self.filters:
+            if found.all():
+                break
+            todo = ~found
+            found[todo] = f.contains(hashes[todo])
+        return found
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add hashes not already present, opening new sub-filters as needed."""
+        hashes = hashes[~self.contains(hashes)] if len(hashes) else hashes
+        while len(hashes):
+            if not self.filters or self.filters[-1].count >= self.filters[-1].capacity:
+                n = len(self.filters)
+                self.filters.append(BloomFilter(
+                    self.capacity * GROWTH ** n,
+                    self.error_rate * (1 - TIGHTENING) * TIGHTENING ** n,
+                ))
+            current = self.filters[-1]
+            room = current.capacity - current.count
+            current.add(hashes[:room])
+            hashes = hashes[room:]
+
+    def merge(self, other: "ScalableBloomFilter") -> None:
+        """Union with ``other``; sub-filter ``n`` has the same shape in both."""
+        for n, theirs in enumerate(other.filters):
+            if n < len(self.filters):
+                self.filters[n].merge(theirs)
+            else:
+                self.filters.append(theirs)
+
+    # ------------------------------------------------------------------
+    # PERSISTENCE
+    # ------------------------------------------------------------------
+    def save(self, path: str) -> None:
+        header = json.dumps({
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "filters": [
+                {"capacity": f.capacity, "error_rate": f.error_rate, "count": f.count}
+                for f in self.filters
+            ],
+        }).encode("utf-8")
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(_MAGIC + len(header).to_bytes(4, "big") + header)
+            for f in self.filters:
+                fh.write(f.bits.tobytes())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ScalableBloomFilter":
+        with open(path, "rb") as fh:
+            if fh.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError("not a seen-index file")
+            header = json.loads(fh.read(int.from_bytes(fh.read(4), "big")))
+            bloom = cls(header["capacity"], header["error_rate"])
+            for spec in header["filters"]:
+                f = BloomFilter(spec["capacity"], spec["error_rate"], count=spec["count"])
+                f.bits = np.frombuffer(bytearray(fh.read(f.bits.nbytes)), dtype=np.uint8)
+                if len(f.bits) != (f.m + 7) // 8:
+                    raise ValueError("truncated seen-index file")
+                bloom.filters.append(f)
+        return bloom
+
+
+def _stamp(path: str) -> Optional[Tuple[int, int]]:
+    """``(mtime_ns, size)`` of ``path``, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class SeenIndex:
+    """Bloom filter in front of the store's exact ``ingested`` set."""
+
+    def __init__(self, store: ArticleStore, path: Optional[str] = None):
+        self.store = store
+        self.path = path or f"{store.path}.bloom"
+        self._lock = threading.Lock()
+        self._pending: List[str] = []
+        self._stamp = _stamp(self.path)
+        try:
+            self.bloom = ScalableBloomFilter.load(self.path)
+        except Exception:
+            self.bloom = self._rebuild()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock shared by every process writing ``path``."""
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.path}.lock", "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _rebuild(self) -> ScalableBloomFilter:
+        bloom = ScalableBloomFilter()
+        for keys in self.store.iter_ingested():
+            bloom.add(_hash_pairs(keys))
+        if len(bloom):
+            with self._file_lock():
+                self._merge_file(bloom)
+                bloom.save(self.path)
+                self._stamp = _stamp(self.path)
+        return bloom
+
+    def _merge_file(self, bloom: ScalableBloomFilter) -> None:
+        """OR the file's filter into ``bloom`` if another process rewrote it."""
+        stamp = _stamp(self.path)
+        if stamp is None or stamp == self._stamp:
+            return
+        try:
+            bloom.merge(ScalableBloomFilter.load(self.path))
+        except Exception:
+            pass  # unreadable: our filter replaces it
+        self._stamp = stamp
+
+    def seen(self, keys: Iterable[str]) -> Set[str]:
+        """The subset of ``keys`` already ingested (exact)."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return set()
+        with self._lock:
+            if _stamp(self.path) != self._stamp:
+                self._merge_file(self.bloom)
+            maybe = self.bloom.contains(_hash_pairs(keys))
+        candidates = [k for k, hit in zip(keys, maybe) if hit]
+        if not candidates:
+            return set()
+        return self.store.ingested(candidates)
+
+    def add(self, keys: Iterable[str]) -> None:
+        """
+        Add ``keys`` to the in-memory filter. They reach the file and the
+        store on the next ``flush``, so a run saves the filter once.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+        with self._lock:
+            self.bloom.add(_hash_pairs(keys))
+            self._pending.extend(keys)
+
+    def flush(self) -> None:
+        """
+        Record the keys added since the last flush as ingested: the
+        filter is merged with the file and saved first, then the store.
+        """
+        with self._lock:
+            keys, self._pending = self._pending, []
+            if not keys:
+                return
+            with self._file_lock():
+                self._merge_file(self.bloom)
+                self.bloom.save(self.path)
+                self._stamp = _stamp(self.path)
+        self.store.mark_ingested(keys)
+
+
+@lru_cache(maxsize=None)
+def _index_for(path: str) -> SeenIndex:
+    return SeenIndex(get_store(path))
+
+
+def get_seen_index(store: Optional[ArticleStore] = None) -> SeenIndex:
+    """Process-wide index paired with ``store`` (the default store if None)."""
+    store = store or get_store()
+    if store is get_store(store.path):
+        return _index_for(os.path.abspath(store.path))
+    return SeenIndex(store)
@@ -0,0 +1,150 @@
+"""
+Local thumbnail cache for news card images.
+
+Cards used to hot-link full-size ``og:image`` and Pexels originals, so
+every reader pulled multi-megabyte files from third-party hosts on every
+view. Here each image is downloaded once, shrunk to the card height
+(``.news-media`` is 170px high) and written as a JPEG into a
+content-addressed directory served by Streamlit's static file serving
+(``.streamlit/config.toml``). Identical images published under different
+URLs share one file.
+
+Without Pillow, or for any image that cannot be fetched or decoded, the
+original URL is kept. Failed images are retried after ``FAILURE_TTL``,
+so a transient error does not pin a card to the original for good.
+"""
+import asyncio
+import hashlib
+import io
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from src.LangGraph.tools import http_pool
+
+try:
+    from PIL import Image
+except ImportError:  # optional: cards hot-link the originals instead
+    Image = None
+
+THUMB_DIR = os.getenv("NEWS_THUMB_DIR", os.path.join("static", "thumbs"))
+# Where THUMB_DIR is served from (Streamlit serves ./static at app/static).
+THUMB_URL = os.getenv("NEWS_THUMB_URL", "app/static/thumbs")
+THUMB_HEIGHT = int(os.getenv("NEWS_THUMB_HEIGHT", "170"))
+# Wide banners are capped rather than kept at full width.
+THUMB_MAX_WIDTH = THUMB_HEIGHT * 3
+THUMB_QUALITY = 82
+MAX_SOURCE_BYTES = 20 * 1024 * 1024
+FETCH_CONCURRENCY = int(os.getenv("NEWS_THUMB_CONCURRENCY", "8"))
+FETCH_TIMEOUT = 8
+FAILURE_TTL = int(os.getenv("NEWS_THUMB_FAILURE_TTL", str(10 * 60)))
+
+# Source URL -> thumbnail URL, and -> time of its last failed attempt.
+_known: Dict[str, str] = {}
+_failed: Dict[str, float] = {}
+_known_lock = threading.Lock()
+
+
+def _link_file(url: str) -> str:
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(THUMB_DIR, "urls", digest[:2], digest)
+
+
+def _public(rel: str) -> str:
+    return f"{THUMB_URL}/{rel}"
+
+
+def cached_thumbnail(url: str) -> Optional[str]:
+    """Thumbnail URL for ``url`` if it was made before (memory, then disk)."""
+    with _known_lock:
+        if url in _known:
+            return _known[url]
+    try:
+        with open(_link_file(url), "r", encoding="utf-8") as f:
+            rel = f.read().strip()
+    except OSError:
+        return None
+    if not os.path.exists(os.path.join(THUMB_DIR, rel)):
+        return None
+    with _known_lock:
+        _known[url] = _public(rel)
+    return _known[url]
+
+
+def _write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def make_thumbnail(url: str, data: bytes) -> str:
+    """Store a card-sized JPEG of ``data`` (image bytes of ``url``); returns its URL."""
+    digest = hashlib.sha256(data).hexdigest()
+    rel = f"{digest[:2]}/{digest}.jpg"
+    path = os.path.join(THUMB_DIR, rel)
+    if not os.path.exists(path):
+        with Image.open(io.BytesIO(data)) as img:
+            # JPEG sources decode straight at a reduced scale.
+            img.draft("RGB", (THUMB_MAX_WIDTH, THUMB_HEIGHT))
+            img = img.convert("RGB")
+            img.thumbnail((THUMB_MAX_WIDTH, THUMB_HEIGHT))
+            out = io.BytesIO()
+            img.save(out, "JPEG", quality=THUMB_QUALITY, optimize=True, progressive=True)
+        _write(path, out.getvalue())
+    _write(_link_file(url), rel.encode("utf-8"))
+    with _known_lock:
+        _known[url] = _public(rel)
+        _failed.pop(url, None)
+    return _known[url]
+
+
+def _forget(url: str) -> None:
+    with _known_lock:
+        _failed[url] = time.time()
+
+
+async def athumbnails(urls: Iterable[str]) -> Dict[str, str]:
+    """
+    Thumbnail URLs for the given image URLs, downloading and resizing the
+    ones not cached yet concurrently. Images without a thumbnail are left
+    out, so callers fall back to the original URL.
+    """
+    if Image is None:
+        return {}
+    unique = [u for u in dict.fromkeys(urls) if u and u.startswith(("http://", "https://"))]
+    hits = await asyncio.to_thread(lambda: {u: cached_thumbnail(u) for u in unique})
+    thumbs = {u: t for u, t in hits.items() if t}
+    now = time.time()
+    with _known_lock:
+        todo = [
+            u for u in unique
+            if u not in thumbs and now - _failed.get(u, 0.0) >= FAILURE_TTL
+        ]
+    if not todo:
+        return thumbs
+
+    limit = asyncio.Semaphore(max(FETCH_CONCURRENCY, 1))
+
+    async def one(url: str) -> None:
+        async with limit:
+            try:
+                resp = await http_pool.aget(url, timeout=FETCH_TIMEOUT)
+                resp.raise_for_status()
+                data = resp.content
+            except Exception:
+                _forget(url)
+                return
+        if not data or len(data) > MAX_SOURCE_BYTES:
+            _forget(url)
+            return
+        try:
+            # Decoding and resizing are CPU work; keep them off the event loop.
+            thumbs[url] = await asyncio.to_thread(make_thumbnail, url, data)
+        except Exception:
+            _forget(url)
+
+    await asyncio.gather(*(one(u) for u in todo))
+    return thumbs
@@ -0,0 +1,225 @@
+"""
+One URL canonicalisation for de-duplication (node, store and UI).
+
+``canonical_url`` applies rules only:
+
+  - scheme folded to https, host lower-cased, default port dropped;
+  - ``www.`` / mobile / AMP host prefixes folded (``m.bbc.co.uk`` ->
+    ``bbc.co.uk``), host aliases merged (``bbc.com`` -> ``bbc.co.uk``) and
+    Google AMP-cache links unwrapped;
+  - AMP path / query markers removed (``/amp``, ``.amp.html``, ``?amp=1``);
+  - tracking parameters (``utm_*``, ``fbclid``, ...) removed, while other
+    parameters are kept, sorted, since some sites identify articles by
+    query ID. Hosts in ``HOST_RULES`` keep only their allowlisted
+    parameters;
+  - fragment and trailing slash dropped.
+
+``canonical_key`` additionally follows the page's own
+``<link rel="canonical">`` when an earlier page fetch cached it (see
+``article_fetch``), so syndicated or re-routed copies collapse as well.
+A canonical link never replaces a key already handed out: it maps to
+the key of the first URL known to name it, so articles stored, seen or
+ingested under that key keep matching once the link is learned. The
+link -> key map lives in the article store, so every process sharing
+the store agrees on it and nothing already assigned is ever dropped.
+"""
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.LangGraph.tools import article_fetch
+from src.LangGraph.tools.article_store import ArticleStore, get_store
+
+# Host prefixes that serve the same page as the bare host.
+_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.", "www-m.")
+
+# Hosts serving one site under several names.
+HOST_ALIASES = {
+    "bbc.com": "bbc.co.uk",
+    "edition.cnn.com": "cnn.com",
+    "us.cnn.com": "cnn.com",
+    "uk.reuters.com": "reuters.com",
+    "theguardian.co.uk": "theguardian.com",
+    "guardian.co.uk": "theguardian.com",
+    "youtu.be": "youtube.com",
+}
+
+# Query parameters that never identify content.
+_TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "ref_url", "referrer", "src", "source", "cmp", "cmpid",
+    "ocid", "taid", "smid", "smtyp", "partner", "share", "shared", "via",
+    "at_medium", "at_campaign", "at_custom1", "at_custom2", "at_custom3", "at_custom4",
+    "__twitter_impression", "_ga", "_gl", "ito", "ns_mchannel", "ns_source",
+    "ns_campaign", "ns_linkname", "ns_fee", "guccounter", "guce_referrer",
+    "guce_referrer_sig", "outputtype", "amp",
+})
+_TRACKING_PREFIXES = ("utm_", "pk_", "mtm_", "hsa_", "at_", "ns_")
+
+# Per-host policy: ``keep`` is the allowlist of query parameters that
+# identify content (an empty set drops every parameter).
+HOST_RULES: Dict[str, Dict] = {
+    "bbc.co.uk": {"keep": set()},
+    "theguardian.com": {"keep": set()},
+    "nytimes.com": {"keep": set()},
+    "reuters.com": {"keep": set()},
+    "apnews.com": {"keep": set()},
+    "cnn.com": {"keep": set()},
+    "cnbc.com": {"keep": set()},
+    "washingtonpost.com": {"keep": set()},
+    "aljazeera.com": {"keep": set()},
+    "npr.org": {"keep": set()},
+    "espn.com": {"keep": {"gameid", "id"}},
+    "youtube.com": {"keep": {"v", "list"}},
+    "news.ycombinator.com": {"keep": {"id"}},
+}
+
+_AMP_SUFFIX = re.compile(r"\.amp(?=\.html?$|$)")
+_AMP_CACHE = re.compile(r"^/(?:[a-z]/)*s/(?P<rest>.+)$")
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def _host(netloc: str, scheme: str) -> str:
+    host = netloc.rsplit("@", 1)[-1].lower().strip(".")
+    name, _, port = host.partition(":")
+    if port and port != _DEFAULT_PORTS.get(scheme):
+        return host
+    for prefix in _HOST_PREFIXES:
+        if name.startswith(prefix) and name.count(".") >= 2:
+            name = name[len(prefix):]
+            break
+    return HOST_ALIASES.get(name, name)
+
+
+def _rule(host: str) -> Optional[Dict]:
+    """Rule for ``host`` or its nearest parent domain."""
+    parts = host.split(".")
+    for i in range(len(parts) - 1):
+        rule = HOST_RULES.get(".".join(parts[i:]))
+        if rule is not None:
+            return rule
+    return None
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in _TRACKING_PARAMS or name.startswith(_TRACKING_PREFIXES)
+
+
+@lru_cache(maxsize=65536)
+def canonical_url(url: str) -> str:
+    """Rule-based canonical form of ``url`` (see module docstring)."""
+    if not url:
+        return ""
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        scheme = (parts.scheme or "https").lower()
+        if scheme not in ("http", "https"):
+            return url
+
+        # Google AMP cache: https://www-site-com.cdn.ampproject.org/c/s/site.com/path
+        if parts.netloc.lower().endswith(".cdn.ampproject.org"):
+            m = _AMP_CACHE.match(parts.path)
+            if m:
+                return canonical_url(f"https://{m.group('rest')}")
+
+        host = _host(parts.netloc, scheme)
+        # "/amp/" segments and ".amp" / ".amp.html" suffixes mark AMP copies
+        segments = [seg for seg in parts.path.split("/") if seg and seg.lower() != "amp"]
+        if segments:
+            segments[-1] = _AMP_SUFFIX.sub("", segments[-1])
+        path = "/" + "/".join(segments)
+
+        rule = _rule(host)
+        params = [
+            (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if not _is_tracking(k)
+            and (rule is None or k.lower() in rule["keep"])
+        ]
+        query = urlencode(sorted(params))
+        return urlunsplit(("https", host, path, query, ""))
+    except Exception:
+        return url
+
+
+# ----------------------------------------------------------------------
+# CANONICAL-LINK KEYS
+# ----------------------------------------------------------------------
+# (store path, url) -> key read from or written to that store. Only a
+# memo: dropping it never changes a key.
+_memo: Dict[Tuple[str, str], str] = {}
+_memo_lock = threading.Lock()
+_MEMO_MAX = 50_000
+
+
+def _remember(store: ArticleStore, url: str, key: str) -> None:
+    with _memo_lock:
+        if len(_memo) >= _MEMO_MAX:
+            _memo.clear()
+        _memo[(store.path, url)] = key
+
+
+def learn(url: str, canonical: Optional[str],
+          store: Optional[ArticleStore] = None) -> Optional[str]:
+    """
+    Record that ``url``'s page names ``canonical`` as its canonical link
+    and return ``url``'s key (None when nothing could be recorded).
+    """
+    if not url or not canonical:
+        return None
+    try:
+        store = store or get_store()
+        # ``url`` was keyed by its rules until now; copies follow that key.
+        key = store.link_key(url, canonical_url(canonical), canonical_url(url))
+    except Exception:
+        return None
+    _remember(store, url, key)
+    return key
+
+
+def canonical_keys(urls: Iterable[str], store: Optional[ArticleStore] = None,
+                   follow_pages: bool = True) -> Dict[str, str]:
+    """
+    De-duplication key of every URL in ``urls``: the key already assigned
+    to the page's own ``<link rel="canonical">`` when it is known (from
+    the store or, with ``follow_pages``, an earlier fetch's cached page),
+    else the rule-based ``canonical_url``. The store is read once for the
+    whole batch.
+    """
+    store = store or get_store()
+    keys: Dict[str, str] = {}
+    todo = []
+    with _memo_lock:
+        for url in dict.fromkeys(u for u in urls if u):
+            key = _memo.get((store.path, url))
+            if key is None:
+                todo.append(url)
+            else:
+                keys[url] = key
+    if not todo:
+        return keys
+
+    try:
+        known = store.url_keys(todo)
+    except Exception:
+        known = {}
+    for url in todo:
+        key = known.get(url)
+        if key is not None:
+            _remember(store, url, key)
+        elif follow_pages:
+            page = article_fetch.cached(url)
+            if page is not None and page.canonical:
+                key = learn(url, page.canonical, store)
+        keys[url] = key or canonical_url(url)
+    return keys
+
+
+def canonical_key(url: str, store: Optional[ArticleStore] = None) -> str:
+    """De-duplication key of one URL (see ``canonical_keys``)."""
+    if not url:
+        return ""
+    return canonical_keys((url,), store)[url]
@@ -1,25 +1,29 @@
 import os
 import re
 import json
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
+from functools import lru_cache
 
 import streamlit as st
-from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk, ToolMessage
 
 from src.LangGraph.state.state import State
-
-# Optional: used to fetch article images / video from the news URL
-try:
-    import requests
-    from bs4 import BeautifulSoup
-except ImportError:
-    requests = None
-    BeautifulSoup = None
+from src.LangGraph.nodes.news_node import summary_path
+from src.LangGraph.tools.aio import run_sync
+from src.LangGraph.tools.article_fetch import FAILURE_TTL, fetch_article
+from src.LangGraph.tools.article_store import get_store
+from src.LangGraph.tools.date_ranges import DateIndex, date_range, normalize_frequency
+from src.LangGraph.tools.thumbnails import athumbnails
+from src.LangGraph.tools.url_canonical import canonical_keys
 
 
 # -------------------------------------------------------------------
 # HELPERS: PARSE MARKDOWN → STRUCTURED SECTIONS
 # -------------------------------------------------------------------
+# Bullet line: - **Title**: Summary text [Read full story](URL)
+_BULLET_RE = re.compile(r"-\s+\*\*(.+?)\*\*:\s*(.+?)\s*\[.*?\]\((https?://[^\)]+)\)")
+
+
 def parse_news_markdown_grouped(markdown_text: str):
     """
     Parse a markdown summary file of the form:
@@ -38,151 +42,95 @@ def parse_news_markdown_grouped(markdown_text: str):
           {"date": "2025-11-15", "articles": [ ... ]},
           ...
         ]
+
+    A file without any dated section comes back as one "No Date" section.
+    Articles are de-duplicated across the whole file by ``canonical_key``,
+    the key the News node de-duplicates on. The keys of the whole file
+    are read from the store in one batch; cached pages are not opened,
+    since the node has already recorded the canonical links it used.
     """
-    sections = []
+    # (date or None, title, summary, url) per bullet, in file order
+    bullets = []
     current_date = None
-    current_articles = []
-    seen_urls = set()
-
     for raw_line in markdown_text.splitlines():
         line = raw_line.strip()
 
-        # Ignore main H1 heading etc.
-        if not line or line.startswith("# "):
-            continue
-
         # New date heading
         if line.startswith("### "):
-            if current_date and current_articles:
-                sections.append({"date": current_date, "articles": current_articles})
-            current_date = line.replace("###", "").strip()
-            current_articles = []
+            current_date = line[4:].strip()
             continue
 
-        # Bullet line: - **Title**: Summary text [Read full story](URL)
-        if line.startswith("- "):
-            m = re.search(
-                r"-\s+\*\*(.+?)\*\*:\s*(.+?)\s*\[.*?\]\((https?://[^\)]+)\)",
-                line,
-            )
-            if not m:
-                continue
-
-            title = m.group(1).strip()
-            summary = m.group(2).strip()
-            url = m.group(3).strip()
-
-            norm_url = url.split("?", 1)[0].strip()
-
-            # Remove duplicates across the whole file by URL
-            if norm_url in seen_urls:
-                continue
-            seen_urls.add(norm_url)
-
-            current_articles.append(
-                {
-                    "title": title,
-                    "summary": summary,
-                    "url": url,
-                }
-            )
+        if not line.startswith("- "):
+            continue
+        m = _BULLET_RE.search(line)
+        if m:
+            bullets.append((current_date, m.group(1).strip(), m.group(2).strip(), m.group(3).strip()))
 
-    # Last section
-    if current_date and current_articles:
-        sections.append({"date": current_date, "articles": current_articles})
+    keys = canonical_keys((b[3] for b in bullets), follow_pages=False)
+    sections = []
+    # Every kept article, for files without ``###`` headings.
+    all_articles = []
+    seen_keys = set()
+    for day, title, summary, url in bullets:
+        # Remove duplicates across the whole file
+        key = keys.get(url, url)
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+
+        article = {"title": title, "summary": summary, "url": url}
+        all_articles.append(article)
+        if day is None:
+            continue
+        if not sections or sections[-1]["date"] != day:
+            sections.append({"date": day, "articles": []})
+        sections[-1]["articles"].append(article)
 
     # Fallback: if there were no ### headings, treat as "No Date"
-    if not sections:
-        flat_articles = []
-        for raw_line in markdown_text.splitlines():
-            line = raw_line.strip()
-            if not line.startswith("- "):
-                continue
-
-            m = re.search(
-                r"-\s+\*\*(.+?)\*\*:\s*(.+?)\s*\[.*?\]\((https?://[^\)]+)\)",
-                line,
-            )
-            if not m:
-                continue
+    if not sections and all_articles:
+        sections.append({"date": "No Date", "articles": all_articles})
 
-            title = m.group(1).strip()
-            summary = m.group(2).strip()
-            url = m.group(3).strip()
+    return sections
 
-            norm_url = url.split("?", 1)[0].strip()
-            if norm_url in seen_urls:
-                continue
-            seen_urls.add(norm_url)
 
-            flat_articles.append(
-                {"title": title, "summary": summary, "url": url}
-            )
+@lru_cache(maxsize=32)
+def _parse_summary_file(path: str, mtime_ns: int, size: int):
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        markdown_content = f.read()
+    return markdown_content, DateIndex(parse_news_markdown_grouped(markdown_content))
 
-        if flat_articles:
-            sections.append({"date": "No Date", "articles": flat_articles})
 
-    return sections
+def load_news_sections(path: str):
+    """
+    ``(markdown, sections)`` of the summary file at ``path``, parsed once
+    per file version (keyed by mtime and size), so reruns reuse it.
+    ``sections`` is a ``DateIndex`` ready for range filtering; it is
+    shared between reruns, so treat it as read-only.
+    """
+    info = os.stat(path)
+    return _parse_summary_file(path, info.st_mtime_ns, info.st_size)
 
 
 # -------------------------------------------------------------------
 # HELPERS: MEDIA (IMAGE + VIDEO)
 # -------------------------------------------------------------------
-@st.cache_data(show_spinner=False)
+@st.cache_data(show_spinner=False, ttl=FAILURE_TTL)
 def fetch_article_media(url: str):
     """
-    Try to fetch an image URL and a video URL from a news article page
-    using OpenGraph/Twitter meta tags.
+    Image URL and video URL of a news article page (OpenGraph/Twitter
+    meta tags). The page comes from the shared article-fetch cache, so
+    pages already read by the News graph are not downloaded again; this
+    cache only lives as long as a failed fetch does there, so a page
+    that failed once is retried like it would be by the graph.
 
     Returns:
         {"image": <url or None>, "video": <url or None>}
     """
-    if not url or not requests or not BeautifulSoup:
-        return {"image": None, "video": None}
-
-    try:
-        resp = requests.get(
-            url,
-            timeout=6,
-            headers={"User-Agent": "Mozilla/5.0 (genai-news-app)"},
-        )
-        resp.raise_for_status()
-    except Exception:
-        return {"image": None, "video": None}
-
-    try:
-        soup = BeautifulSoup(resp.text, "html.parser")
-    except Exception:
+    if not url:
         return {"image": None, "video": None}
 
-    image_url = None
-    video_url = None
-
-    # Common OpenGraph / Twitter image tags
-    for attr, key in [
-        ("property", "og:image"),
-        ("name", "og:image"),
-        ("property", "twitter:image"),
-        ("name", "twitter:image"),
-    ]:
-        tag = soup.find("meta", attrs={attr: key})
-        if tag and tag.get("content"):
-            image_url = tag["content"]
-            break
-
-    # Look for video-related meta tags
-    for attr, key in [
-        ("property", "og:video"),
-        ("name", "og:video"),
-        ("property", "twitter:player"),
-        ("name", "twitter:player"),
-    ]:
-        tag = soup.find("meta", attrs={attr: key})
-        if tag and tag.get("content"):
-            video_url = tag["content"]
-            break
-
-    return {"image": image_url, "video": video_url}
+    page = fetch_article(url)
+    return {"image": page.image, "video": page.video}
 
 
 def _get_fallback_image(news_type: str) -> str:
@@ -219,62 +167,167 @@ def _get_selected_date() -> date | None:
 
 def filter_sections_by_selected_date(sections, timeframe: str):
     """
-    Keep only sections whose date falls within the selected date range:
+    Keep only sections whose date falls within the selected range, the
+    same window the News graph fetched (see ``date_ranges.date_range``):
 
     - Today: that exact date
-    - Weekly: Monday–Sunday week containing selected date
-    - Monthly: whole calendar month of selected date
-    """
-    selected = _get_selected_date()
-    if not selected:
-        return sections
-
-    tf = timeframe.lower()
-    if tf.startswith("today"):
-        start = end = selected
-    elif tf.startswith("week"):
-        # Last 6 days plus the selected day (7-day window ending at selected)
-        start = selected - timedelta(days=6)
-        end = selected
-    elif tf.startswith("month"):
-        start = selected.replace(day=1)
-        if selected.month == 12:
-            end = selected.replace(year=selected.year + 1, month=1, day=1) - timedelta(
-                days=1
-            )
-        else:
-            end = selected.replace(month=selected.month + 1, day=1) - timedelta(days=1)
-    else:
-        return sections
-
-    filtered = []
-    today = date.today()
-
-    for section in sections:
-        try:
-            sec_date = datetime.fromisoformat(section.get("date", "")).date()
-        except Exception:
-            # If we can't parse, keep it (could be "Latest" or "No Date")
-            filtered.append(section)
-            continue
+    - Weekly: the 7 days ending at the selected date
+    - Monthly: the 30 days ending at the selected date
 
-        # Clamp any future dates
-        if sec_date > today:
-            continue
+    ``sections`` is a list or a prebuilt ``DateIndex``; sections without
+    a date ("Latest", "No Date") are kept.
+    """
+    index = sections if isinstance(sections, DateIndex) else DateIndex(sections)
+    start, end = date_range(timeframe, _get_selected_date())
+    return index.between(start, end)
 
-        if start <= sec_date <= end:
-            filtered.append(section)
 
-    return filtered
+def stored_sections(news_type: str, frequency: str):
+    """
+    Sections for a past range that the backfill command fully stored, or
+    None when the range still has to go through the News graph. Today
+    is always fetched live.
+    """
+    start, anchor = date_range(frequency, _get_selected_date())
+    if anchor >= date.today():
+        return None
+    try:
+        store = get_store()
+        if not store.covers(news_type, start, anchor):
+            return None
+        return store.sections(news_type, start, anchor)
+    except Exception:
+        return None
 
 
 # -------------------------------------------------------------------
 # RENDERING: ARTICLE GRID
 # -------------------------------------------------------------------
+# Cards rendered per "Load more" step; only rendered cards resolve media.
+NEWS_PAGE_SIZE = int(os.getenv("NEWS_PAGE_SIZE", "24"))
+
+NEWS_CSS = """
+<style>
+.news-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+    gap: 1.5rem;
+    margin-top: 1.0rem;
+    margin-bottom: 1.8rem;
+}
+.news-card {
+    background: #ffffff;
+    border-radius: 20px;
+    padding: 1.2rem 1.3rem;
+    box-shadow: 0 12px 30px rgba(15, 23, 42, 0.10);
+    transition: transform 0.15s ease-out, box-shadow 0.15s ease-out;
+    display: flex;
+    flex-direction: column;
+    height: 100%;
+}
+.news-card:hover {
+    transform: translateY(-4px);
+    box-shadow: 0 20px 40px rgba(15, 23, 42, 0.18);
+}
+.news-tag {
+    display: inline-block;
+    padding: 0.10rem 0.55rem;
+    border-radius: 999px;
+    font-size: 0.70rem;
+    font-weight: 600;
+    letter-spacing: 0.04em;
+    background: #eff6ff;
+    color: #1d4ed8;
+    margin-bottom: 0.35rem;
+    text-transform: uppercase;
+}
+.news-media {
+    width: 100%;
+    height: 170px;
+    border-radius: 16px;
+    object-fit: cover;
+    margin-bottom: 0.9rem;
+}
+.news-title {
+    font-size: 1.0rem;
+    font-weight: 700;
+    color: #111827;
+    margin-bottom: 0.4rem;
+}
+.news-summary {
+    font-size: 0.9rem;
+    color: #4b5563;
+    line-height: 1.4;
+    margin-bottom: 0.7rem;
+}
+.news-link {
+    margin-top: auto;
+    font-size: 0.9rem;
+    font-weight: 600;
+    color: #2563eb;
+    text-decoration: none;
+}
+.news-link:hover {
+    text-decoration: underline;
+}
+</style>
+"""
+
+
+@lru_cache(maxsize=4096)
+def _card_html(url: str, title: str, summary: str, tag_label: str,
+               img_url: str, video_url: str) -> str:
+    """HTML of one tile; cached per article, category and media."""
+    if video_url:
+        # If looks like direct video file → <video>, otherwise <iframe>
+        if any(video_url.lower().endswith(ext) for ext in [".mp4", ".webm", ".ogg"]):
+            media_html = f"""
+            <video class="news-media" controls preload="metadata">
+                <source src="{video_url}">
+                Your browser does not support the video tag.
+            </video>
+            """
+        else:
+            media_html = f"""
+            <iframe class="news-media" src="{video_url}"
+                    frameborder="0" allowfullscreen></iframe>
+            """
+    else:
+        media_html = f'<img src="{img_url}" class="news-media" />'
+
+    return f"""
+    <div class="news-card">
+        <div class="news-tag">{tag_label}</div>
+        {media_html.strip()}
+        <div class="news-title">{title}</div>
+        <div class="news-summary">{summary}</div>
+        <a href="{url}" target="_blank" class="news-link">
+            Read full story →
+        </a>
+    </div>
+    """.strip()
+
+
+@lru_cache(maxsize=256)
+def _grid_html(cards: tuple, tag_label: str) -> str:
+    """
+    Pre-rendered grid of one date section. ``cards`` holds each tile's
+    ``(url, title, summary, image, video)``, so the fragment is rebuilt
+    only when an article or its media changes.
+    """
+    # One element, so the grid container actually wraps the cards.
+    return (
+        '<div class="news-grid">'
+        + "\n".join(_card_html(url, title, summary, tag_label, img, video)
+                    for url, title, summary, img, video in cards)
+        + "</div>"
+    )
+
+
 def render_article_grid(articles, news_type: str):
     """
-    Render a responsive grid of tiles for all articles of a single date.
-    Each tile:
+    Render a responsive grid of tiles for articles of a single date
+    (styles come from ``NEWS_CSS``, injected once per page). Each tile:
         - category tag (Movies / Sports / Tech / etc.)
         - image or video thumbnail
         - title
@@ -282,122 +335,28 @@ def render_article_grid(articles, news_type: str):
         - "Read full story →" link
     """
     fallback_img = _get_fallback_image(news_type)
-    tag_label = news_type.capitalize()
-
-    st.markdown(
-        """
-        <style>
-        .news-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-            gap: 1.5rem;
-            margin-top: 1.0rem;
-            margin-bottom: 1.8rem;
-        }
-        .news-card {
-            background: #ffffff;
-            border-radius: 20px;
-            padding: 1.2rem 1.3rem;
-            box-shadow: 0 12px 30px rgba(15, 23, 42, 0.10);
-            transition: transform 0.15s ease-out, box-shadow 0.15s ease-out;
-            display: flex;
-            flex-direction: column;
-            height: 100%;
-        }
-        .news-card:hover {
-            transform: translateY(-4px);
-            box-shadow: 0 20px 40px rgba(15, 23, 42, 0.18);
-        }
-        .news-tag {
-            display: inline-block;
-            padding: 0.10rem 0.55rem;
-            border-radius: 999px;
-            font-size: 0.70rem;
-            font-weight: 600;
-            letter-spacing: 0.04em;
-            background: #eff6ff;
-            color: #1d4ed8;
-            margin-bottom: 0.35rem;
-            text-transform: uppercase;
-        }
-        .news-media {
-            width: 100%;
-            height: 170px;
-            border-radius: 16px;
-            object-fit: cover;
-            margin-bottom: 0.9rem;
-        }
-        .news-title {
-            font-size: 1.0rem;
-            font-weight: 700;
-            color: #111827;
-            margin-bottom: 0.4rem;
-        }
-        .news-summary {
-            font-size: 0.9rem;
-            color: #4b5563;
-            line-height: 1.4;
-            margin-bottom: 0.7rem;
-        }
-        .news-link {
-            margin-top: auto;
-            font-size: 0.9rem;
-            font-weight: 600;
-            color: #2563eb;
-            text-decoration: none;
-        }
-        .news-link:hover {
-            text-decoration: underline;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
 
-    cards_html = []
+    cards = []
     for art in articles:
-        title = art.get("title", "Untitled")
-        summary = art.get("summary", "Tap to read the full story →")
         url = art.get("url", "#")
-
         # Try to get media from article itself
         media = fetch_article_media(url)
-        img_url = media.get("image") or fallback_img
-        video_url = media.get("video")
-
-        if video_url:
-            # If looks like direct video file → <video>, otherwise <iframe>
-            if any(video_url.lower().endswith(ext) for ext in [".mp4", ".webm", ".ogg"]):
-                media_html = f"""
-                <video class="news-media" controls preload="metadata">
-                    <source src="{video_url}">
-                    Your browser does not support the video tag.
-                </video>
-                """
-            else:
-                media_html = f"""
-                <iframe class="news-media" src="{video_url}"
-                        frameborder="0" allowfullscreen></iframe>
-                """
-        else:
-            media_html = f'<img src="{img_url}" class="news-media" />'
-
-        card = f"""
-        <div class="news-card">
-            <div class="news-tag">{tag_label}</div>
-            {media_html}
-            <div class="news-title">{title}</div>
-            <div class="news-summary">{summary}</div>
-            <a href="{url}" target="_blank" class="news-link">
-                Read full story →
-            </a>
-        </div>
-        """
-        cards_html.append(card)
-
-    st.markdown('<div class="news-grid">', unsafe_allow_html=True)
-    st.markdown("\n".join(cards_html), unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+        cards.append([
+            url,
+            art.get("title", "Untitled"),
+            art.get("summary", "Tap to read the full story →"),
+            media.get("image") or fallback_img,
+            media.get("video") or "",
+        ])
+
+    # Serve card-sized local copies instead of hot-linking the originals.
+    try:
+        thumbs = run_sync(athumbnails(card[3] for card in cards if not card[4]))
+    except Exception:
+        thumbs = {}
+    cards = [tuple(card[:3]) + (thumbs.get(card[3], card[3]), card[4]) for card in cards]
+
+    st.markdown(_grid_html(tuple(cards), news_type.capitalize()), unsafe_allow_html=True)
 
 
 # -------------------------------------------------------------------
@@ -420,19 +379,13 @@ def render_news_sections(sections, news_type: str, timeframe: str):
     st.markdown(f"## {heading}")
 
     selected = _get_selected_date()
-    if selected:
-        if timeframe.lower().startswith("week"):
-            week_start = selected - timedelta(days=6)
-            week_end = selected
-            st.caption(f"Week of {week_start.isoformat()} to {week_end.isoformat()}")
-
-        elif timeframe.lower().startswith("month"):
-            st.caption(selected.strftime("%B %Y"))
-        else:
-            st.caption(selected.isoformat())
+    start, end = date_range(timeframe, selected)
+    if start == end:
+        st.caption(end.isoformat())
+    elif timeframe.lower().startswith("week"):
+        st.caption(f"Week of {start.isoformat()} to {end.isoformat()}")
     else:
-        # Fallback: today
-        st.caption(date.today().isoformat())
+        st.caption(f"{start.isoformat()} to {end.isoformat()}")
 
     st.write(f"**Selected News Type:** {news_type.capitalize()}")
 
@@ -446,15 +399,186 @@ def render_news_sections(sections, news_type: str, timeframe: str):
         st.warning("No news available for the selected date range.")
         return
 
-    # Render each date section
+    st.markdown(NEWS_CSS, unsafe_allow_html=True)
+    cursor_key = f"news_visible::{news_type}::{timeframe.lower()}::{selected}"
+    _render_visible_sections(sections, news_type, cursor_key)
+
+
+@st.fragment
+def _render_visible_sections(sections, news_type: str, cursor_key: str):
+    """
+    Render date sections up to the session's card cursor, with a
+    "Load more" button advancing it by ``NEWS_PAGE_SIZE``. Runs as a
+    fragment, so loading more re-renders only the grid.
+    """
+    sections = [s for s in sections if s.get("articles")]
+    total = sum(len(s["articles"]) for s in sections)
+    budget = visible = min(st.session_state.get(cursor_key, NEWS_PAGE_SIZE), total)
+
     for section in sections:
+        if budget <= 0:
+            break
+        articles = section["articles"]
         day = section.get("date", "Latest")
-        articles = section.get("articles", [])
-        if not articles:
-            continue
+        shown = articles[:budget]
+        budget -= len(shown)
 
         st.markdown(f"### {day}")
-        render_article_grid(articles, news_type)
+        render_article_grid(shown, news_type)
+        if len(shown) < len(articles):
+            st.caption(f"{len(shown)} of {len(articles)} stories for {day}")
+
+    if visible < total:
+        st.caption(f"Showing {visible} of {total} stories")
+        st.button(
+            "Load more",
+            key=f"{cursor_key}::more",
+            use_container_width=True,
+            on_click=_load_more,
+            args=(cursor_key, visible),
+        )
+
+
+def _load_more(cursor_key: str, visible: int):
+    # Runs before the (fragment) rerun that renders the extra cards.
+    st.session_state[cursor_key] = visible + NEWS_PAGE_SIZE
+
+
+# -------------------------------------------------------------------
+# CHAT HISTORY (FROM CHECKPOINTS)
+# -------------------------------------------------------------------
+HISTORY_RENDER_WINDOW = 20
+
+
+def checkpointed_messages(graph, config):
+    """Messages of the thread in ``config`` as stored by the checkpointer."""
+    try:
+        snapshot = graph.get_state(config)
+    except Exception:
+        return []
+    return list(snapshot.values.get("messages", [])) if snapshot else []
+
+
+def render_chat_history(messages):
+    """
+    Render the conversation so far. Only the latest
+    ``HISTORY_RENDER_WINDOW`` messages are drawn on every rerun; older
+    ones are drawn only when the reader asks for them.
+    """
+    visible = [
+        m
+        for m in messages
+        if isinstance(m, (HumanMessage, AIMessage)) and getattr(m, "content", None)
+    ]
+    older = visible[:-HISTORY_RENDER_WINDOW]
+    recent = visible[-HISTORY_RENDER_WINDOW:]
+
+    if older and st.toggle(
+        f"Show {len(older)} earlier messages", key="show_older_history"
+    ):
+        for msg in older:
+            role = "assistant" if isinstance(msg, AIMessage) else "user"
+            with st.chat_message(role):
+                st.write(msg.content)
+
+    for msg in recent:
+        role = "assistant" if isinstance(msg, AIMessage) else "user"
+        with st.chat_message(role):
+            st.write(msg.content)
+
+
+def _text(content) -> str:
+    """Plain text of a message/chunk ``content`` (str or content blocks)."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") for block in content or [] if isinstance(block, dict)
+    )
+
+
+def stream_chat_turn(graph, inputs, config):
+    """
+    Run one chat turn with ``stream_mode="messages"`` and render it live:
+    model tokens go straight into ``st.write_stream``, tool calls are
+    announced as soon as the model starts them and tool results as soon
+    as the tool node returns.
+    """
+    events = iter(graph.stream(inputs, config=config, stream_mode="messages"))
+    stash = []
+    announced = set()
+
+    def next_event():
+        return stash.pop() if stash else next(events, None)
+
+    def tokens(first: str):
+        # Pull text chunks off the shared stream until something else
+        # (a tool call or tool result) arrives; hand that back via stash.
+        yield first
+        while True:
+            event = next_event()
+            if event is None:
+                return
+            msg, _ = event
+            if (
+                isinstance(msg, AIMessageChunk)
+                and _text(msg.content)
+                and not msg.tool_call_chunks
+            ):
+                yield _text(msg.content)
+            else:
+                stash.append(event)
+                return
+
+    while True:
+        event = next_event()
+        if event is None:
+            break
+        msg, _ = event
+
+        if isinstance(msg, ToolMessage):
+            with st.chat_message("assistant"):
+                st.write(msg.content)
+                st.markdown(f"**✅ Tool Execution Completed** ({msg.name or 'tool'})")
+        elif isinstance(msg, AIMessageChunk):
+            for call in msg.tool_call_chunks:
+                key = call.get("id") or call.get("index")
+                if call.get("name") and key not in announced:
+                    announced.add(key)
+                    with st.chat_message("assistant"):
+                        st.markdown(f"**🧰 Tool Execution Started** ({call['name']})")
+            if _text(msg.content):
+                with st.chat_message("assistant"):
+                    st.write_stream(tokens(_text(msg.content)))
+        elif isinstance(msg, AIMessage) and _text(msg.content):
+            # Models that do not stream still arrive as one message.
+            with st.chat_message("assistant"):
+                st.write(_text(msg.content))
+
+
+# -------------------------------------------------------------------
+# NEWS GRAPH (ASYNC)
+# -------------------------------------------------------------------
+NEWS_STAGE_LABELS = {
+    "fetch_news": "Fetched articles",
+    "fetch_articles": "Ranked stories and read article pages",
+    "summarize_news": "Summarised articles",
+    "save_results": "Saved summary",
+}
+
+
+async def _run_news_graph(graph, inputs, progress=None):
+    """
+    Drive the News graph with ``astream`` so every provider, LLM and file
+    call shares one event loop; report each finished stage in ``progress``.
+    Returns the notices the nodes raised (e.g. partial archive results).
+    """
+    notices = []
+    async for update in graph.astream(inputs, stream_mode="updates"):
+        for node, values in update.items():
+            if progress is not None:
+                progress.caption(f"✓ {NEWS_STAGE_LABELS.get(node, node)}")
+            notices.extend((values or {}).get("notices") or [])
+    return notices
 
 
 # -------------------------------------------------------------------
@@ -472,38 +596,23 @@ class DisplayResultStreamlit:
         graph = self.graph
         user_message = self.user_message
 
-        if "messages" not in st.session_state:
-            st.session_state["messages"] = []
+        config = {"configurable": {"thread_id": self.thread_id}}
 
         # --------------------------------------------------------------
         # 1) BASIC CHATBOT
         # --------------------------------------------------------------
         if usecase == "Basic Chatbot":
-            for msg in st.session_state["messages"]:
-                role = "assistant" if isinstance(msg, AIMessage) else "user"
-                with st.chat_message(role):
-                    st.write(msg.content)
+            render_chat_history(checkpointed_messages(graph, config))
 
             if user_message:
-                user_msg = HumanMessage(content=user_message)
-                st.session_state["messages"].append(user_msg)
                 with st.chat_message("user"):
                     st.write(user_message)
 
-                state = State(messages=st.session_state["messages"])
-                print("THREAD ID USED:", self.thread_id)
+                # Only the new turn is sent; the checkpointer holds the rest.
+                state = State(messages=[HumanMessage(content=user_message)])
 
                 try:
-                    for event in graph.stream(
-                        state,
-                        config={"configurable": {"thread_id": self.thread_id}},
-                    ):
-                        for value in event.values():
-                            for msg in value.get("messages", []):
-                                if isinstance(msg, AIMessage):
-                                    st.session_state["messages"].append(msg)
-                                    with st.chat_message("assistant"):
-                                        st.write(msg.content)
+                    stream_chat_turn(graph, state, config)
                 except Exception as e:
                     st.error(
                         "The chatbot backend returned an authentication error.\n\n"
@@ -518,27 +627,14 @@ class DisplayResultStreamlit:
         # 2) CHATBOT WITH TAVILY SEARCH
         # --------------------------------------------------------------
         elif usecase == "Chatbot with tavily search":
+            render_chat_history(checkpointed_messages(graph, config))
+
+            with st.chat_message("user"):
+                st.write(user_message)
+
             initial_state = {"messages": [HumanMessage(content=user_message)]}
-            res = graph.invoke(initial_state)
 
-            for message in res.get("messages", []):
-                if isinstance(message, HumanMessage):
-                    with st.chat_message("user"):
-                        st.write(message.content)
-                elif isinstance(message, ToolMessage):
-                    with st.chat_message("assistant"):
-                        st.markdown("**🧰 Tool Execution Started**")
-                        st.write(message.content)
-                        st.markdown("**✅ Tool Execution Completed**")
-                elif isinstance(message, AIMessage) and getattr(
-                    message, "content", None
-                ):
-                    with st.chat_message("assistant"):
-                        st.write(message.content)
-                else:
-                    content = getattr(message, "content", str(message))
-                    with st.chat_message("assistant"):
-                        st.write(content)
+            stream_chat_turn(graph, initial_state, config)
 
         # --------------------------------------------------------------
         # 3) NEWS USECASE
@@ -561,31 +657,48 @@ class DisplayResultStreamlit:
             if selected_iso:
                 payload["selected_date"] = selected_iso
 
+            # Backfilled history is served from the local store.
+            frequency = normalize_frequency(timeframe)
+            sections = stored_sections(news_type, frequency)
+            if sections is not None:
+                render_news_sections(sections, news_type, timeframe)
+                return
+
             with st.spinner("Fetching and summarizing news... ⏳"):
+                progress = st.empty()
+                notices = []
                 try:
-                    _ = graph.invoke(
-                        {
-                            "messages": [
-                                {
-                                    "role": "user",
-                                    "content": json.dumps(payload),
-                                }
-                            ]
-                        }
+                    notices = run_sync(
+                        _run_news_graph(
+                            graph,
+                            {
+                                "messages": [
+                                    {
+                                        "role": "user",
+                                        "content": json.dumps(payload),
+                                    }
+                                ]
+                            },
+                            progress,
+                        )
                     )
+                    progress.empty()
                 except Exception as e:
                     st.warning(
                         "Graph invocation failed, using cached summaries if any.\n\n"
                         f"Details: {e}"
                     )
+                for notice in notices:
+                    st.info(notice)
 
-                # Load summary file based on timeframe
-                filename = f"{timeframe.lower()}_summary.md".replace("today", "daily")
-                news_path = os.path.join("News", filename)
+                # Load summary file based on timeframe + category, falling
+                # back to the shared file written by older versions.
+                news_path = summary_path(frequency, news_type)
+                if not os.path.exists(news_path):
+                    news_path = summary_path(frequency)
 
                 try:
-                    with open(news_path, "r", encoding="utf-8", errors="ignore") as f:
-                        markdown_content = f.read()
+                    markdown_content, sections = load_news_sections(news_path)
                 except FileNotFoundError:
                     st.error(f"News not generated or file not found: {news_path}")
                     return
@@ -593,8 +706,6 @@ class DisplayResultStreamlit:
                     st.error(f"An error occurred while reading news file: {e}")
                     return
 
-                sections = parse_news_markdown_grouped(markdown_content)
-
                 if not sections:
                     st.markdown(markdown_content, unsafe_allow_html=True)
                 else:
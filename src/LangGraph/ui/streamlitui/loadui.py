@@ -6,6 +6,7 @@ import streamlit as st
 from dotenv import load_dotenv
 
 from src.LangGraph.ui.ui_config import Config
+from src.LangGraph.nodes.news_node import NEWS_CATEGORIES
 
 load_dotenv()
 
@@ -33,11 +34,11 @@ class LoadStreamLitUI:
         st.session_state.setdefault("IsFetchButtonClicked", False)
         st.session_state.setdefault("IsFetchAIButtonClicked", False)
         st.session_state.setdefault("timeframe", "today")
+        # Only true on the rerun triggered by "Fetch All Categories".
+        st.session_state["NEWS_BATCH"] = False
 
         if "thread_id" not in st.session_state:
             st.session_state["thread_id"] = str(uuid.uuid4())
-        if "messages" not in st.session_state:
-            st.session_state["messages"] = []
 
         # ----------------- SIDEBAR -----------------
         with st.sidebar:
@@ -75,7 +76,7 @@ class LoadStreamLitUI:
 
                 self.user_controls["NEWS_TYPE"] = st.radio(
                     "Choose News Category",
-                    ["news", "general", "finance", "movies", "sports", "business", "tech"],
+                    list(NEWS_CATEGORIES),
                     horizontal=True,
                 )
 
@@ -130,7 +131,27 @@ class LoadStreamLitUI:
                 )
                 st.session_state["selected_date"] = selected_date
 
+                summary_label = st.selectbox(
+                    "Summary mode",
+                    ["Hybrid", "Fast", "LLM"],
+                    index=0,
+                    help=(
+                        "Hybrid: LLM for the top stories of each day, instant local "
+                        "summaries for the rest. Fast: local summaries only, no LLM. "
+                        "LLM: every story through the LLM."
+                    ),
+                )
+                self.user_controls["SUMMARY_MODE"] = summary_label.lower()
+
                 if st.button("Fetch Latest News", use_container_width=True):
                     st.session_state["IsFetchButtonClicked"] = True
 
+                if st.button(
+                    "Fetch All Categories",
+                    use_container_width=True,
+                    help="Refresh every category in one pass; the selected one is shown.",
+                ):
+                    st.session_state["IsFetchButtonClicked"] = True
+                    st.session_state["NEWS_BATCH"] = True
+
         return self.user_controls
@@ -1,11 +1,14 @@
+import os
 from configparser import ConfigParser
 
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "ui_config.ini")
+
 class Config:
     def get_title(self):
         # New heading at the top of the Streamlit app
         return "AI News Explorer: Smart Daily, Weekly & Monthly Briefings"
     
-    def __init__(self,config_file_path="./src/langGraph/ui/ui_config.ini"):
+    def __init__(self,config_file_path=DEFAULT_CONFIG_PATH):
         self.config=ConfigParser()
         self.config.read(config_file_path)
 